@@ -0,0 +1,49 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Speed of the installed JSON codecs at decoding a large waveform report and at encoding the form body of a bulk
+# update_subjects() request, to decide whether opting in to a faster codec than json is worth its wire-format changes.
+#
+#     python -m benchmarks.codec [update count]
+#
+
+import json
+import random
+import sys
+import timeit
+
+from taranoscsfpapi.rendering import *
+
+
+def main(count=10000):
+    random.seed(1)
+    report = {'s': 0, 'r': 0, 'rw': [{'m': {'_po': 'po~%d' % i},
+                                      'w': [[round(random.random(), 6) for _ in range(64)] for _ in range(8)]}
+                                     for i in range(500)]}
+    report_data = json.dumps(report).encode('utf-8')
+    updates = [SubjectUpdate('s~%d' % i, position=[random.uniform(-1, 1), random.uniform(-1, 1)], rotation=[0.5])
+               for i in range(count)]
+    for name, codec in codecs.items():
+        loads_time = min(timeit.repeat(lambda: codec.loads(report_data), number=5, repeat=3)) / 5
+        encode_time = min(timeit.repeat(lambda: encode_form(updates, 'us', codec), number=3, repeat=3)) / 3
+        print('%-7s  loads %d KB report %7.2f ms   encode_form %d updates %7.1f ms' %
+              (name, len(report_data) // 1024, loads_time * 1e3, count, encode_time * 1e3))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
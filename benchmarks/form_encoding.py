@@ -0,0 +1,61 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Time and peak memory of encode_form(), which percent-encodes the JSON of all the request args in bulk, against
+# url-encoding each arg with urllib.parse.urlencode() as the senders used to, for bulk create_subjects() bodies.
+#
+#     python -m benchmarks.form_encoding [request count ...]
+#
+
+import sys
+import time
+import tracemalloc
+import urllib.parse
+
+from taranoscsfpapi.rendering import *
+
+
+def urlencode_form(args, form_header, codec=JsonCodec):
+    form_data = urllib.parse.urlencode([(form_header, codec.dumps(arg() if callable(arg) else arg)) for arg in args])
+    return bytes(form_data, 'utf-8') if form_data else None
+
+
+def main(*counts):
+    for count in counts or (1000, 10000, 100000):
+        requests = [SubjectConstructor(tag='subject %d' % i,
+                                       name='N\u00e4m\u00e9 %d' % i,
+                                       description='a "quoted" desc & more')() for i in range(count)]
+        if encode_form(requests, 'cs') != urlencode_form(requests, 'cs'):
+            raise SystemExit('encode_form() and urlencode() disagree')
+        for name, encode in (('urlencode', urlencode_form), ('encode_form', encode_form)):
+            best_time = None
+            for _ in range(3):
+                started = time.perf_counter()
+                body = encode(requests, 'cs')
+                elapsed = time.perf_counter() - started
+                best_time = elapsed if best_time is None else min(best_time, elapsed)
+            tracemalloc.start()
+            encode(requests, 'cs')
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print('%6d requests  %-11s %8.1f ms   peak %6.1f MB   body %6.2f MB' %
+                  (count, name, best_time * 1e3, peak / 1e6, len(body) / 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
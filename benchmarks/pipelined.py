@@ -0,0 +1,66 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Throughput of the urllib, pooled and pipelined transports against the stand-in server, for sequential and fanned
+# out update_subject() calls and for a single thread submitting pipelined requests.  The stand-in server runs in this
+# process and shares its GIL, so absolute rates are low; compare the transports relative to each other.
+#
+#     python -m benchmarks.pipelined [request count]
+#
+
+import sys
+import time
+
+from taranoscsfpapi.rendering import *
+from tests.standin import StandinServer
+
+
+def main(count=2000):
+    with StandinServer() as server:
+        field_key = 'f~a-default'
+        calls = [(update_subject, {'field_key': field_key, 'key': 's~%d' % i, 'position': [0.1, 0.2]})
+                 for i in range(count)]
+        for transport_name in ('urllib', 'pooled', 'pipelined'):
+            session = Session(server.url)
+            session.transport_name = transport_name
+            started = time.perf_counter()
+            for i in range(count // 4):
+                update_subject(field_key=field_key, key='s~%d' % i, position=[0.1, 0.2], session=session)
+            sequential_rate = count // 4 / (time.perf_counter() - started)
+            started = time.perf_counter()
+            results = fan_out(calls, max_concurrency=32, session=session)
+            fan_out_rate = count / (time.perf_counter() - started)
+            if not all(result.ok for result in results):
+                raise SystemExit('%s: requests failed' % transport_name)
+            session.close()
+            print('%-9s  sequential %6.0f req/s   fan_out(32) %6.0f req/s' %
+                  (transport_name, sequential_rate, fan_out_rate))
+
+        transport = PipelinedTransport(server.url)
+        body = encode_form([SubjectUpdate('s~1', position=[0.1, 0.2])], 'us')
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        started = time.perf_counter()
+        futures = [transport.submit('PUT', 'trp/f/%s/s' % field_key, body, headers) for _ in range(count)]
+        for future in futures:
+            future.result()
+        print('pipelined  submit() from one thread %6.0f req/s' % (count / (time.perf_counter() - started)))
+        transport.close()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,84 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Memory retained by a large report_subjects() reply decoded into slotted SubjectReport records, against the parsed
+# dicts, and the time taken to decode it and to read attributes from records and dicts.
+#
+#     python -m benchmarks.report_records [report count]
+#
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from taranoscsfpapi.rendering import *
+
+
+def subject_report(i, count):
+    return {'m': {'_s': 's~%d' % i, 't': 'tag%d' % i, 'n': 'subject %d' % i, 'd': 'desc'},
+            'a': {'dpe': {'dc': {'ct': 'x'}}},
+            'r': {'sm': 'm~%d' % i},
+            's': {'p': ['%.3f' % (i / count), '0.25'], 'r': ['0.5']}}
+
+
+def retained_memory(build):
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, current, peak
+
+
+def best_time(function, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e3
+
+
+def main(count=50000):
+    text = json.dumps({'s': 0, 'r': 0, 'rs': [subject_report(i, count) for i in range(count)]})
+
+    dicts, dict_memory, _ = retained_memory(lambda: json.loads(text)['rs'])
+    del dicts
+    records, record_memory, record_peak = retained_memory(lambda: decode_reports(SubjectReport,
+                                                                                 json.loads(text)['rs']))
+    dicts = json.loads(text)['rs']
+    if decode_reports(SubjectReport, dicts) != records:
+        raise SystemExit('records differ')
+    print('%d reports retained: dicts %.1f MB, records %.1f MB (peak while decoding %.1f MB)' %
+          (count, dict_memory / 1e6, record_memory / 1e6, record_peak / 1e6))
+    print('json.loads %.1f ms, decode_reports %.1f ms' %
+          (best_time(lambda: json.loads(text)), best_time(lambda: decode_reports(SubjectReport, dicts))))
+    print('name and position: dicts %.1f ms, records %.1f ms' %
+          (best_time(lambda: [(report['m']['n'], report['s']['p']) for report in dicts]),
+           best_time(lambda: [(record.name, record.position) for record in records])))
+    print('optional badge:    dicts %.1f ms, records %.1f ms' %
+          (best_time(lambda: [report.get('m', {}).get('b') for report in dicts]),
+           best_time(lambda: [record.badge for record in records])))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,86 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Memory taken by queued request objects, whose classes keep their attributes in __slots__: bytes per object (the
+# object itself and its __dict__, if any), and the peak RSS of a process holding a queue of them, measured in a child
+# process of its own for each class.  The same classes without __slots__, keeping their attributes in a __dict__ as
+# they did before, are measured as the baseline, and the request dicts the objects serialize to alongside, for scale.
+#
+#     python -m benchmarks.request_memory [queue length]
+#
+
+import gc
+import resource
+import subprocess
+import sys
+
+from taranoscsfpapi.rendering import *
+from taranoscsfpapi.signaling import *
+
+request_makers = {
+    'SubjectUpdate': lambda cls, i: cls(key='s~%d' % (i % 1000), position=[0.1, 0.2], rotation=[0.5]),
+    'SignalInputUpdate': lambda cls, i: cls(key='i~%d' % (i % 1000), name='n'),
+    'FieldEmitterCall': lambda cls, i: cls(key='e~%d' % (i % 1000), macro={'m': 'x'})}
+
+
+def unslotted(cls):
+    # The same class without __slots__ (and the member descriptors made for them), so with a __dict__ per object:
+    namespace = {name: value for name, value in vars(cls).items() if name != '__slots__' and name not in cls.__slots__}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def request_class(class_name, form):
+    cls = globals()[class_name]
+    return unslotted(cls) if form == 'unslotted' else cls
+
+
+def object_size(obj):
+    return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else 0)
+
+
+def peak_rss(class_name, count, form):
+    # Run in a child process: build a queue of count requests, and report the RSS before and after in MB.
+    make, cls = request_makers[class_name], request_class(class_name, form)
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue = [make(cls, i)() if form == 'dict' else make(cls, i) for i in range(count)]
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print('%.0f %.0f %d' % (base / 1024, peak / 1024, len(queue)))
+
+
+def main(count=1000000):
+    for class_name, make in request_makers.items():
+        sizes = []
+        for form in ('slotted', 'unslotted'):
+            cls = request_class(class_name, form)
+            requests = [make(cls, i) for i in range(1000)]
+            gc.collect()
+            sizes.append(sum(object_size(request) for request in requests) / len(requests))
+        rss = []
+        for form in ('slotted', 'unslotted', 'dict'):
+            command = [sys.executable, '-m', 'benchmarks.request_memory', '--rss', class_name, str(count), form]
+            output = subprocess.run(command, capture_output=True, check=True, text=True).stdout.split()
+            rss.append(float(output[1]) - float(output[0]))
+        print('%-17s  %4.0f B/object slotted, %4.0f unslotted   %d queued: RSS +%.0f MB slotted, +%.0f MB unslotted, '
+              '+%.0f MB as dicts' % (class_name, sizes[0], sizes[1], count, rss[0], rss[1], rss[2]))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--rss']:
+        peak_rss(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main(*map(int, sys.argv[1:]))
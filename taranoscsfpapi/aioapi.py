@@ -0,0 +1,90 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Asynchronous counterpart of the Pseudo-API.  The aiorendering, aiosignaling and aiomanagement modules mirror every
+# public function of their synchronous counterparts as a coroutine, sharing the same Constructor, Update, Call and
+# Query classes; they are generated from the synchronous modules by tools/generate_aio.py.  Requests are sent through
+# AioSender, which multiplexes them over a bounded pool of persistent connections so that any number of calls may be
+# gathered on one event loop.
+#
+
+import asyncio
+import contextlib
+
+from taranoscsfpapi.api import *
+from taranoscsfpapi.aiosender import *
+
+
+async def fan_out(calls, *, max_concurrency=8, session=None, timeout=None):
+    """
+    Make many asynchronous API calls (typically report_* calls) concurrently.
+
+    :param calls: List of (coroutine function, kwargs dict) tuples, e.g. (report_subject, {'key': key})
+    :param max_concurrency: Maximum number of calls in flight at once
+    :param session: AsyncSender to pass to calls that don't specify one
+    :param timeout: Seconds allowed for all of the calls, or None to only be bound by any enclosing request_deadline()
+    :return: List of FanOutResults, in call order; a failed call's result holds its exception in error
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def make_call(call):
+        function, kwargs = call
+        if session and 'session' not in kwargs:
+            kwargs = dict(kwargs, session=session)
+        async with semaphore:
+            try:
+                return FanOutResult(value=await function(**kwargs))
+            except Exception as exc:
+                return FanOutResult(error=exc)
+
+    with request_deadline(timeout) if timeout is not None else contextlib.nullcontext():
+        return list(await asyncio.gather(*[make_call(call) for call in calls]))
+
+
+async def get_server_defaults(*, session=None):
+    """
+    Fetch the default field and trunk keys of a sender's cell.
+
+    :param session: AsyncSender to use (defaults to AioSender, whose defaults are kept in the default session)
+    """
+    defaults = session if session else Globals
+
+    try:
+        response_dict = await aio_session_of(session).get('tmp/c')
+        cell_report = handle_response(response_dict, 'rc')
+        defaults.fk = cell_report['mf']['_f']
+        defaults.tk = cell_report['mt']['_t']
+
+    except PapiException as e:
+        print('get_server_defaults() failed (%s)' % e.__repr__)
+        raise
+
+
+async def papi_init(server_url=None, is_verbose=False):
+    """
+    Initialize the asynchronous Pseudo-API.
+
+    :param server_url: URL of the Taranos Server
+    """
+    AioSender.configure(server_url, is_verbose)
+
+    try:
+        await get_server_defaults()
+
+    except PapiException as e:
+        print('taranoscsfpapi init failed (%s)' % e.__repr__)
@@ -0,0 +1,58 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Generated from management.py by tools/generate_aio.py: do not edit by hand.
+#
+
+from taranoscsfpapi.management import *
+from taranoscsfpapi.aioapi import *
+
+
+#
+# Cell:
+#
+
+# Destroy:
+
+async def destroy_cell(*, is_testing=False, session=None):
+    """
+    Destroy (reset) the currently associated simulation cell.
+
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Cell destruction report
+    """
+    response_dict = await aio_session_of(session).put(CellDestructor(is_testing), 'dc', 'tmp/c', method='DELETE')
+
+    await get_server_defaults(session=session)
+
+    return handle_response(response_dict, None)
+
+
+# Report:
+
+async def report_cell(*, sections=None, session=None):
+    """
+    Report the currently associated cell's configuration.
+
+    :param sections: Reporting sections
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Cell configuration report
+    """
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('tmp/c%s' % query())
+    return handle_response(response_dict, 'rc')
@@ -0,0 +1,1047 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Generated from rendering.py by tools/generate_aio.py: do not edit by hand.
+#
+
+from taranoscsfpapi.rendering import *
+from taranoscsfpapi.aioapi import *
+
+
+#
+# Field:
+#
+
+# Create:
+
+async def create_fields(*, constructors, session=None):
+    """
+    Create new fields.
+
+    :param constructors: Field constructor list
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Field creation reports
+    """
+    response_dict = await aio_session_of(session).put(constructors, 'cf', 'trp/f', method='POST')
+    return handle_response(response_dict, 'rf')
+
+
+async def create_field(*, session=None, **kwargs):
+    """
+    Create a new field.
+
+    :param kwargs: Field constructor arguments
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Field creation report
+    """
+    return (await create_fields(constructors=[FieldConstructor(**kwargs)], session=session))[0]
+
+
+# Destroy:
+
+async def destroy_fields(*, destructors, session=None):
+    """
+    Destroy fields.
+
+    :param destructors: Field destructor list
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Field destruction reports
+    """
+    response_dict = await aio_session_of(session).put(destructors, 'df', 'trp/f', method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_field(*, key=None, session=None, **kwargs):
+    """
+    Destroy a field.
+
+    :param key: Field key
+    :param kwargs: Field destructor arguments
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Field destruction report
+    """
+    if not key:
+        key = fk(session=session)
+    return await destroy_fields(destructors=[FieldDestructor(key, **kwargs)], session=session)
+
+
+# Report:
+
+async def report_fields(*, keys, sections=None, session=None):
+    query = FieldQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f%s' % query())
+    return handle_response(response_dict, 'rf')
+
+
+async def report_field(*, key=None, sections=None, session=None):
+    if not key:
+        key = fk(session=session)
+    result = await report_fields(keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_fields(*, updates, session=None):
+    response_dict = await aio_session_of(session).put(updates, 'uf', 'trp/f')
+    return handle_response(response_dict, None)
+
+
+async def update_field(*, key=None, session=None, **kwargs):
+    if not key:
+        key = fk(session=session)
+    return await update_fields(updates=[FieldUpdate(key, **kwargs)], session=session)
+
+
+#
+# Field Emitter:
+#
+
+# Create:
+
+async def create_field_emitters(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'cfe', 'trp/f/%s/fe' % field_key, method='POST')
+    return handle_response(response_dict, 'rfe')
+
+
+async def create_field_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_field_emitters(field_key=field_key,
+                                        constructors=[FieldEmitterConstructor(**kwargs)],
+                                        session=session))[0]
+
+
+# Destroy:
+
+async def destroy_field_emitters(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dfe', 'trp/f/%s/fe' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_field_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_field_emitters(field_key=field_key,
+                                        destructors=[FieldEmitterDestructor(**kwargs)],
+                                        session=session)
+
+
+# Report:
+
+async def report_field_emitters(*, field_key=None, keys, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = FieldEmitterQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/fe%s' % (field_key, query()))
+    return handle_response(response_dict, 'rfe')
+
+
+async def report_field_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_field_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_field_emitters(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'ufe', 'trp/f/%s/fe' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_field_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_field_emitters(field_key=field_key, updates=[FieldEmitterUpdate(**kwargs)], session=session)
+
+
+# Call:
+
+async def call_field_emitters(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mfe', 'trp/f/%s/fe/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_field_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_field_emitters(field_key=field_key, calls=[FieldEmitterCall(**kwargs)], session=session)
+
+
+#
+# Field Oscillator:
+#
+
+# Report:
+
+async def report_field_oscillators(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = FieldOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/fo%s' % (field_key, query()))
+    return handle_response(response_dict, 'rfo')
+
+
+async def report_field_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = FieldOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/fe/%s/fo%s' % (field_key, emitter_key, query()))
+    return handle_response(response_dict, 'rfo')
+
+
+async def report_field_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_field_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_field_oscillators(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'ufo', 'trp/f/%s/fo' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_field_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_field_oscillators(field_key=field_key,
+                                          updates=[FieldOscillatorUpdate(**kwargs)],
+                                          session=session)
+
+
+# Call:
+
+async def call_field_oscillators(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mfo', 'trp/f/%s/fo/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_field_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_field_oscillators(field_key=field_key, calls=[FieldOscillatorCall(**kwargs)], session=session)
+
+
+#
+# Subject:
+#
+
+# Create:
+
+async def create_subjects(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'cs', 'trp/f/%s/s' % field_key, method='POST')
+    return handle_response(response_dict, 'rs')
+
+
+async def create_subject(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_subjects(field_key=field_key,
+                                  constructors=[SubjectConstructor(**kwargs)],
+                                  session=session))[0]
+
+
+# Destroy:
+
+async def destroy_subjects(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'ds', 'trp/f/%s/s' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_subject(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_subjects(field_key=field_key, destructors=[SubjectDestructor(**kwargs)], session=session)
+
+
+# Report:
+
+async def report_subjects(*, field_key=None, keys, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/s%s' % (field_key, query()))
+    return handle_response(response_dict, 'rs')
+
+
+async def report_subject(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_subjects(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_subjects(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'us', 'trp/f/%s/s' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_subject(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_subjects(field_key=field_key, updates=[SubjectUpdate(**kwargs)], session=session)
+
+
+async def update_subjects_columnar(*, field_key=None, keys, positions=None, rotations=None, names=None, session=None):
+    """
+    Update a batch of subjects given as columns, without making an update object per subject.
+
+    :param field_key: Field key
+    :param keys: Subject keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :param names: Sequence of N subject names, or None
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Subject update report
+    """
+    updates = SpatialUpdateBatch(keys, positions, rotations, names)
+    return await update_subjects(field_key=field_key, updates=updates, session=session)
+
+
+#
+# Subject Emitter:
+#
+
+# Create:
+
+async def create_subject_emitters(*, field_key=None, subject_key, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(
+                  constructors, 'cse', 'trp/f/%s/s/%s/se' % (field_key, subject_key), method='POST')
+    return handle_response(response_dict, 'rse')
+
+
+async def create_subject_emitter(*, field_key=None, subject_key, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_subject_emitters(field_key=field_key,
+                                          subject_key=subject_key,
+                                          constructors=[SubjectEmitterConstructor(**kwargs)],
+                                          session=session))[0]
+
+
+# Destroy:
+
+async def destroy_subject_emitters(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dse', 'trp/f/%s/se' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_subject_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_subject_emitters(field_key=field_key,
+                                          destructors=[SubjectEmitterDestructor(**kwargs)],
+                                          session=session)
+
+
+# Report:
+
+async def report_subject_emitters(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectEmitterQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/se%s' % (field_key, query()))
+    return handle_response(response_dict, 'rse')
+
+
+async def report_subject_emitters_of_subject(*, field_key=None, subject_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectEmitterQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/s/%s/se%s' % (field_key, subject_key, query()))
+    return handle_response(response_dict, 'rse')
+
+
+async def report_subject_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_subject_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_subject_emitters(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'use', 'trp/f/%s/se' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_subject_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_subject_emitters(field_key=field_key,
+                                         updates=[SubjectEmitterUpdate(**kwargs)],
+                                         session=session)
+
+
+# Call:
+
+async def call_subject_emitters(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_subject_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_subject_emitters(field_key=field_key, calls=[SubjectEmitterCall(**kwargs)], session=session)
+
+
+#
+# Subject Oscillator:
+#
+
+# Report:
+
+async def report_subject_oscillators(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/so%s' % (field_key, query()))
+    return handle_response(response_dict, 'rso')
+
+
+async def report_subject_oscillators_of_emitter(*,
+                                                field_key=None,
+                                                emitter_key,
+                                                keys=None,
+                                                sections=None,
+                                                session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/se/%s/so%s' % (field_key, emitter_key, query()))
+    return handle_response(response_dict, 'rso')
+
+
+async def report_subject_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_subject_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_subject_oscillators(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'uso', 'trp/f/%s/so' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_subject_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_subject_oscillators(field_key=field_key,
+                                            updates=[SubjectOscillatorUpdate(**kwargs)],
+                                            session=session)
+
+
+# Call:
+
+async def call_subject_oscillators(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mso', 'trp/f/%s/so/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_subject_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_subject_oscillators(field_key=field_key,
+                                          calls=[SubjectOscillatorCall(**kwargs)],
+                                          session=session)
+
+
+#
+# Probe:
+#
+
+# Create:
+
+async def create_probes(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'cp', 'trp/f/%s/p' % field_key, method='POST')
+    return handle_response(response_dict, 'rp')
+
+
+async def create_probe(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_probes(field_key=field_key, constructors=[ProbeConstructor(**kwargs)], session=session))[0]
+
+
+# Destroy:
+
+async def destroy_probes(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dp', 'trp/f/%s/p' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_probe(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_probes(field_key=field_key, destructors=[ProbeDestructor(**kwargs)], session=session)
+
+
+# Report:
+
+async def report_probes(*, field_key=None, keys, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/p%s' % (field_key, query()))
+    return handle_response(response_dict, 'rp')
+
+
+async def report_probe(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_probes(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_probes(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'up', 'trp/f/%s/p' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_probe(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_probes(field_key=field_key, updates=[ProbeUpdate(**kwargs)], session=session)
+
+
+async def update_probes_columnar(*, field_key=None, keys, positions=None, rotations=None, names=None, session=None):
+    """
+    Update a batch of probes given as columns, without making an update object per probe.
+
+    :param field_key: Field key
+    :param keys: Probe keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :param names: Sequence of N probe names, or None
+    :param session: AsyncSender to use (defaults to AioSender)
+    :return: Probe update report
+    """
+    updates = SpatialUpdateBatch(keys, positions, rotations, names)
+    return await update_probes(field_key=field_key, updates=updates, session=session)
+
+
+#
+# Probe Emitter:
+#
+
+# Create:
+
+async def create_probe_emitters(*, field_key=None, probe_key, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(
+                  constructors, 'cpe', 'trp/f/%s/p/%s/pe' % (field_key, probe_key), method='POST')
+    return handle_response(response_dict, 'rpe')
+
+
+async def create_probe_emitter(*, field_key=None, probe_key, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_probe_emitters(field_key=field_key,
+                                        probe_key=probe_key,
+                                        constructors=[ProbeEmitterConstructor(**kwargs)],
+                                        session=session))[0]
+
+
+# Destroy:
+
+async def destroy_probe_emitters(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dpe', 'trp/f/%s/pe' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_probe_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_probe_emitters(field_key=field_key,
+                                        destructors=[ProbeEmitterDestructor(**kwargs)],
+                                        session=session)
+
+
+# Report:
+
+async def report_probe_emitters(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeEmitterQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pe%s' % (field_key, query()))
+    return handle_response(response_dict, 'rpe')
+
+
+async def report_probe_emitters_of_probe(*, field_key=None, probe_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeEmitterQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/s/%s/pe%s' % (field_key, probe_key, query()))
+    return handle_response(response_dict, 'rpe')
+
+
+async def report_probe_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_probe_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_probe_emitters(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'upe', 'trp/f/%s/pe' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_probe_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_probe_emitters(field_key=field_key, updates=[ProbeEmitterUpdate(**kwargs)], session=session)
+
+
+# Call:
+
+async def call_probe_emitters(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_probe_emitter(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_probe_emitters(field_key=field_key, calls=[ProbeEmitterCall(**kwargs)], session=session)
+
+
+#
+# Probe Oscillator:
+#
+
+# Report:
+
+async def report_probe_oscillators(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/po%s' % (field_key, query()))
+    return handle_response(response_dict, 'rpo')
+
+
+async def report_probe_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeOscillatorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pe/%s/po%s' % (field_key, emitter_key, query()))
+    return handle_response(response_dict, 'rpo')
+
+
+async def report_probe_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_probe_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_probe_oscillators(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'upo', 'trp/f/%s/po' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_probe_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_probe_oscillators(field_key=field_key,
+                                          updates=[ProbeOscillatorUpdate(**kwargs)],
+                                          session=session)
+
+
+# Call:
+
+async def call_probe_oscillators(*, field_key=None, calls, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(calls, 'mpo', 'trp/f/%s/po/m' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def call_probe_oscillator(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await call_probe_oscillators(field_key=field_key, calls=[ProbeOscillatorCall(**kwargs)], session=session)
+
+
+#
+# Probe Collector:
+#
+
+# Create:
+
+async def create_probe_collectors(*, field_key=None, probe_key, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(
+                  constructors, 'cpc', 'trp/f/%s/p/%s/pc' % (field_key, probe_key), method='POST')
+    return handle_response(response_dict, 'rpc')
+
+
+async def create_probe_collector(*, field_key=None, probe_key, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return (await create_probe_collectors(field_key=field_key,
+                                          probe_key=probe_key,
+                                          constructors=[ProbeCollectorConstructor(**kwargs)],
+                                          session=session))[0]
+
+
+# Destroy:
+
+async def destroy_probe_collectors(*, field_key=None, destructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dpc', 'trp/f/%s/pc' % field_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_probe_collector(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await destroy_probe_collectors(field_key=field_key,
+                                          destructors=[ProbeCollectorDestructor(**kwargs)],
+                                          session=session)
+
+
+# Lookup:
+
+async def lookup_probe_collector(*, field_key=None, alias, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pca/%s' % (field_key, alias))
+    return handle_response(response_dict, 'lpc')
+
+
+# Report:
+
+async def report_probe_collectors(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeCollectorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pc%s' % (field_key, query()))
+    return handle_response(response_dict, 'rpc')
+
+
+async def report_probe_collectors_of_probe(*, field_key=None, probe_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeCollectorQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/s/%s/pc%s' % (field_key, probe_key, query()))
+    return handle_response(response_dict, 'rpc')
+
+
+async def report_probe_collector(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_probe_collectors(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_probe_collectors(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'upc', 'trp/f/%s/pc' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_probe_collector(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_probe_collectors(field_key=field_key,
+                                         updates=[ProbeCollectorUpdate(**kwargs)],
+                                         session=session)
+
+
+#
+# Emitter Patch:
+#
+
+# Report:
+
+async def report_emitter_patches(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = EmitterPatchQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/smpe%s' % (field_key, query()))
+    return handle_response(response_dict, 'rsmpe')
+
+
+async def report_emitter_patch(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_emitter_patches(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+async def report_patch_of_field_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/fe/%s/smpe%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpe')[0]
+
+
+async def report_patch_of_subject_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/se/%s/smpe%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpe')[0]
+
+
+async def report_patch_of_probe_emitter(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pe/%s/smpe%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpe')[0]
+
+
+# Update:
+
+async def update_emitter_patches(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmpe', 'trp/f/%s/smpe' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_emitter_patch(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_emitter_patches(field_key=field_key, updates=[EmitterPatchUpdate(**kwargs)], session=session)
+
+
+#
+# Oscillator Patch:
+#
+
+# Report:
+
+async def report_oscillator_patches(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = OscillatorPatchQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/smpo%s' % (field_key, query()))
+    return handle_response(response_dict, 'rsmpo')
+
+
+async def report_oscillator_patch(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_oscillator_patches(field_key=field_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+async def report_patch_of_field_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/fe/%s/smpo%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpo')[0]
+
+
+async def report_patch_of_subject_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/se/%s/smpo%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpo')[0]
+
+
+async def report_patch_of_probe_oscillator(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pe/%s/smpo%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rsmpo')[0]
+
+
+# Update:
+
+async def update_oscillator_patches(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmpo', 'trp/f/%s/smpo' % field_key)
+    return handle_response(response_dict, None)
+
+
+async def update_oscillator_patch(*, field_key=None, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_oscillator_patches(field_key=field_key,
+                                           updates=[OscillatorPatchUpdate(**kwargs)],
+                                           session=session)
+
+
+#
+# Oscillator Patch Envelope:
+#
+
+# Report:
+
+async def report_oscillator_patch_envelopes(*, field_key=None, patch_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = OscillatorPatchEnvelopeQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/smpo/%s/e%s' % (field_key, patch_key, query()))
+    return handle_response(response_dict, 'resmpo')
+
+
+async def report_oscillator_patch_envelope(*, field_key=None, patch_key, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = await report_oscillator_patch_envelopes(field_key=field_key,
+                                                     patch_key=patch_key,
+                                                     keys=[key],
+                                                     sections=sections,
+                                                     session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_oscillator_patch_envelopes(*, field_key=None, patch_key, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmpoe', 'trp/f/%s/smpo/%s/e' % (field_key, patch_key))
+    return handle_response(response_dict, None)
+
+
+async def update_oscillator_patch_envelope(*, field_key=None, patch_key, session=None, **kwargs):
+    if not field_key:
+        field_key = fk(session=session)
+    return await update_oscillator_patch_envelopes(field_key=field_key,
+                                                   patch_key=patch_key,
+                                                   updates=[OscillatorPatchEnvelopeUpdate(**kwargs)],
+                                                   session=session)
+
+
+#
+# Waveforms
+#
+
+# Report:
+
+async def report_waveforms(*,
+                     field_key=None,
+                     field_geometry=None,
+                     antipode_distance=None,
+                     position=None,
+                     rotation=None,
+                     acoustic_a=None,
+                     squelch_threshold=None,
+                     lobe_range=None,
+                     lobe_range_poles=None,
+                     lobe_bearing_poles=None,
+                     sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SamplerQuery(field_geometry=field_geometry,
+                         antipode_distance=antipode_distance,
+                         collector_position=position,
+                         collector_rotation=rotation,
+                         acoustic_a=acoustic_a,
+                         squelch_threshold=squelch_threshold,
+                         lobe_range=lobe_range,
+                         lobe_range_poles=lobe_range_poles,
+                         lobe_bearing_poles=lobe_bearing_poles,
+                         sections=sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/w%s' % (field_key, query()))
+    return handle_response(response_dict, 'rw')
+
+
+async def report_waveforms_at_probe(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/p/%s/w%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rw')
+
+
+async def report_waveforms_at_probe_collector(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = CommonSectionsOnlyQuery(sections)
+    response_dict = await aio_session_of(session).get('trp/f/%s/pc/%s/w%s' % (field_key, key, query()))
+    return handle_response(response_dict, 'rw')
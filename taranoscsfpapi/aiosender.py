@@ -0,0 +1,375 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import collections
+import time
+import urllib.parse
+
+from taranoscsfpapi.sender import *
+
+
+class AsyncConnectionPool:
+    """
+    Bounded pool of persistent HTTP/1.1 connections to a single server, for use from one asyncio event loop.
+
+    At most max_connections connections are open at once; further requests wait for a connection to be released, so
+    any number of concurrent calls can be gathered without exhausting sockets.  Connections idle for longer than
+    idle_timeout seconds are evicted.  A request sent over a reused connection that turns out to have been dropped by
+    the server is retried over a fresh connection if it could not be written, or if its method is idempotent; once a
+    POST or PUT has been written the server may have acted on it, so the error is raised instead.
+    """
+
+    _idempotent_methods = ('GET', 'HEAD', 'DELETE')
+
+    _broken_connection_errors = (asyncio.IncompleteReadError,
+                                 BrokenPipeError,
+                                 ConnectionAbortedError,
+                                 ConnectionResetError)
+
+    def __init__(self, server_url, max_connections=10, idle_timeout=30.0):
+        url_parts = urllib.parse.urlsplit(server_url)
+        self._is_secure = url_parts.scheme == 'https'
+        self._host = url_parts.hostname
+        self._port = url_parts.port if url_parts.port else (443 if self._is_secure else 80)
+        self._host_header = url_parts.netloc
+        self._path_prefix = url_parts.path.rstrip('/')
+        self._idle_timeout = idle_timeout
+        self._idle = collections.deque()
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._created_count = 0
+        self._reused_count = 0
+        self._evicted_count = 0
+        self._reconnect_count = 0
+        self._waiting_count = 0
+        self._active_count = 0
+
+    async def _acquire(self):
+        now = time.monotonic()
+        while self._idle and now - self._idle[0][2] > self._idle_timeout:
+            _, writer, _ = self._idle.popleft()
+            writer.close()
+            self._evicted_count += 1
+        if self._idle:
+            reader, writer, _ = self._idle.pop()
+            self._reused_count += 1
+            return reader, writer, True
+        reader, writer = await asyncio.open_connection(self._host, self._port, ssl=True if self._is_secure else None)
+        self._created_count += 1
+        return reader, writer, False
+
+    def _release(self, reader, writer, is_reusable):
+        if is_reusable:
+            self._idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+
+    async def _write_request(self, writer, method, path, body, headers):
+        head = ['%s %s HTTP/1.1' % (method, self._path_prefix + '/' + path),
+                'Host: %s' % self._host_header,
+                'Content-Length: %d' % (len(body) if body else 0)]
+        head += ['%s: %s' % (name, value) for name, value in headers.items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        if body:
+            writer.write(body)
+        await writer.drain()
+
+    async def _read_response(self, reader, method):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by server')
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        will_close = (response_headers.get('connection', '').lower() == 'close' or
+                      (version == 'HTTP/1.0' and response_headers.get('connection', '').lower() != 'keep-alive'))
+        if method == 'HEAD' or int(status) in (204, 304) or 100 <= int(status) < 200:
+            data = b''
+        elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            data = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            data = await reader.read()
+            will_close = True
+        return int(status), reason, response_headers, data, will_close
+
+    async def request(self, method, path, body=None, headers=None):
+        """
+        Send a request over a pooled connection.
+
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :return: (status, reason, response headers, response body bytes) tuple
+        """
+        self._waiting_count += 1
+        async with self._semaphore:
+            self._waiting_count -= 1
+            self._active_count += 1
+            try:
+                while True:
+                    reader, writer, is_reused = await self._acquire()
+                    is_sent = False
+                    try:
+                        await self._write_request(writer, method, path, body, headers or {})
+                        is_sent = True
+                        status, reason, response_headers, data, will_close = await self._read_response(reader, method)
+                    except self._broken_connection_errors:
+                        self._release(reader, writer, False)
+                        if is_reused and (not is_sent or method in self._idempotent_methods):
+                            self._reconnect_count += 1
+                            continue
+                        raise
+                    except BaseException:
+                        self._release(reader, writer, False)
+                        raise
+                    self._release(reader, writer, not will_close)
+                    return status, reason, response_headers, data
+            finally:
+                self._active_count -= 1
+
+    def close(self):
+        while self._idle:
+            self._idle.popleft()[1].close()
+
+    def stats(self):
+        return {
+            'active': self._active_count,
+            'waiting': self._waiting_count,
+            'idle': len(self._idle),
+            'created': self._created_count,
+            'reused': self._reused_count,
+            'evicted': self._evicted_count,
+            'reconnected': self._reconnect_count}
+
+
+class AsyncLoopbackTransport(LoopbackTransport):
+    """
+    Asynchronous LoopbackTransport, handing requests straight to a Python callable without touching the network.
+    """
+    async def request(self, method, path, body=None, headers=None, timeout=None):
+        return LoopbackTransport.request(self, method, path, body, headers, timeout)
+
+
+class AsyncInflightGets(InflightGets):
+    """
+    InflightGets for an AsyncSender: concurrent identical GET requests made by tasks of the same event loop share one
+    request, which is sent from a task of its own so that cancelling any of its callers leaves the others waiting.
+    """
+    async def call(self, api_spec, fetch):
+        timeout = deadline_timeout(None)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._flights.get(api_spec)
+            if task is None or task.get_loop() is not loop:
+                task = self._flights[api_spec] = loop.create_task(fetch())
+                task.add_done_callback(lambda task: self._land(api_spec, task))
+                self.sent += 1
+            else:
+                self.shared += 1
+        done, _ = await asyncio.wait((task,), timeout=timeout)
+        if not done:
+            raise DeadlineExceeded('request deadline exceeded')
+        return task.result()
+
+
+class AsyncSender(BaseSession):
+    """
+    Non-blocking counterpart of Session for use with asyncio.
+
+    The module-level AioSender is used by the asynchronous API functions unless they are passed another instance.
+    Unless configured otherwise, its server URL and default field and trunk keys are those of the default session.
+    """
+
+    # Before Python 3.11, asyncio.TimeoutError (raised by asyncio.wait_for()) is not a TimeoutError:
+    _retried_errors = BaseSession._retried_errors + (asyncio.IncompleteReadError, asyncio.TimeoutError)
+    _timeout_errors = (TimeoutError, asyncio.TimeoutError)
+
+    default_max_connections = 10
+    default_idle_timeout = 30.0
+
+    def __init__(self, server_url=None, is_verbose=False):
+        super().__init__(server_url, is_verbose)
+        self._pools = {}
+        self._loop = None
+        self.max_connections = AsyncSender.default_max_connections
+        self.idle_timeout = AsyncSender.default_idle_timeout
+
+    def configure(self, server_url=None, is_verbose=False):
+        self._server_url = server_url
+        self._is_verbose = is_verbose
+
+    @property
+    def server_url(self):
+        return self._server_url if self._server_url else session_of(None).server_url
+
+    def use_transport(self, transport):
+        """
+        Send all requests through the given asynchronous transport, such as an AsyncLoopbackTransport, instead of
+        over pooled connections.
+
+        :param transport: Transport, or None to go back to pooled connections
+        """
+        self._fixed_transport = transport
+
+    def transport(self, server_url=None):
+        return self._fixed_transport if self._fixed_transport is not None else self.pool(server_url)
+
+    def pool(self, server_url=None):
+        """
+        Get the connection pool for a server in the running event loop, creating it on first use.
+
+        :param server_url: URL of the Taranos Server (defaults to the current server URL)
+        :return: Connection pool
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._loop is not None and not self._loop.is_closed():
+                self.close()
+            self._pools.clear()
+            self._loop = loop
+        if not server_url:
+            server_url = self.server_url
+        pool = self._pools.get(server_url)
+        if pool is None:
+            pool = AsyncConnectionPool(server_url, self.max_connections, self.idle_timeout)
+            self._pools[server_url] = pool
+        return pool
+
+    def pool_stats(self):
+        return {server_url: pool.stats() for server_url, pool in self._pools.items()}
+
+    def transport_stats(self):
+        if self._fixed_transport is not None:
+            return {'fixed': self._fixed_transport.stats()}
+        return self.pool_stats()
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    async def _send(self, method, api_spec, body, headers, timeout):
+        """
+        Send a request through the circuit breaker, retrying it as the retry policy allows.
+
+        :return: (status, reason, response headers, response body bytes) tuple
+        """
+        attempt = 0
+        while True:
+            call_timeout = self._begin_attempt(timeout)
+            attempt += 1
+            try:
+                result = await asyncio.wait_for(self.transport().request(method, api_spec, body, headers),
+                                                call_timeout)
+            except Exception as exc:
+                delay = self._error_retry_delay(method, attempt, exc)
+                if delay is None:
+                    raise
+            except BaseException:   # Cancelled.
+                self.breaker.abandon_request()
+                raise
+            else:
+                delay = self._status_retry_delay(method, attempt, result[0])
+                if delay is None:
+                    return result
+            await asyncio.sleep(delay)
+
+    async def request(self, method, api_spec, data=None, timeout=None):
+        response_dict = {}
+        try:
+            request = self._begin_request(method, api_spec, data)
+            try:
+                response = await self._send(method, api_spec, request.body, request.headers,
+                                            timeout if timeout else self.timeout)
+            except Exception as exc:
+                self._record(request, None, None, exc)
+                raise
+            response_dict = self._end_request(request, *response)
+        except self._timeout_errors + (CircuitOpenError,):
+            raise
+        except Exception as exc:
+            print(exc)
+        return response_dict
+
+    async def get(self, api_spec, timeout=None):
+        report_cache = self.report_cache
+        if report_cache is None:
+            return await self._fetch(api_spec, timeout)
+        generation = report_cache.generation_of(api_spec)
+        response_dict = report_cache.get(api_spec)
+        if response_dict is None:
+            response_dict = await self._fetch(api_spec, timeout)
+            report_cache.put(api_spec, response_dict, generation)
+        return response_dict
+
+    async def _fetch(self, api_spec, timeout):
+        inflight_gets = self.inflight_gets
+        if inflight_gets is not None:
+            return await inflight_gets.call(api_spec, lambda: self._send_get(api_spec, timeout))
+        return await self._send_get(api_spec, timeout)
+
+    async def _send_get(self, api_spec, timeout):
+        api_specs = self.split_query(api_spec)
+        if len(api_specs) == 1:
+            return await self.request('GET', api_spec, timeout=timeout)
+        semaphore = asyncio.Semaphore(max(1, self.query_concurrency))
+
+        async def get_part(part_api_spec):
+            async with semaphore:
+                return await self.request('GET', part_api_spec, timeout=timeout)
+
+        return merge_responses(await asyncio.gather(*[get_part(part_api_spec) for part_api_spec in api_specs]))
+
+    async def put(self, args, form_header, api_spec, method='PUT', timeout=None):
+        try:
+            return await self.request(method, api_spec, self._encode_put(args, form_header), timeout)
+        finally:
+            self._end_put(api_spec, method, args)
+
+AioSender = AsyncSender()
+
+
+def aio_session_of(session):
+    """
+    Resolve the asynchronous sender an API call should use.
+
+    :param session: AsyncSender passed to the API call, or None
+    :return: The given sender, or AioSender
+    """
+    return session if session else AioSender
@@ -0,0 +1,724 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Generated from signaling.py by tools/generate_aio.py: do not edit by hand.
+#
+
+from taranoscsfpapi.signaling import *
+from taranoscsfpapi.aioapi import *
+
+
+#
+# Signal Trunk:
+#
+
+# Create:
+
+async def create_trunks(*, constructors, session=None):
+    response_dict = await aio_session_of(session).put(constructors, 'ct', 'tsp/t', method='POST')
+    return handle_response(response_dict, 'rt')
+
+
+async def create_trunk(*, session=None, **kwargs):
+    return (await create_trunks(constructors=[TrunkConstructor(**kwargs)], session=session))[0]
+
+
+# Destroy:
+
+async def destroy_trunks(*, destructors, session=None):
+    response_dict = await aio_session_of(session).put(destructors, 'dt', 'tsp/t', method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_trunk(*, key=None, session=None, **kwargs):
+    if not key:
+        key = tk(session=session)
+    return await destroy_trunks(destructors=[TrunkDestructor(key, **kwargs)], session=session)
+
+
+# Report:
+
+async def report_trunks(*, keys, sections=None, session=None):
+    query = TrunkQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t%s' % query())
+    return handle_response(response_dict, 'rt')
+
+
+async def report_trunk(*, key=None, sections=None, session=None):
+    if not key:
+        key = tk(session=session)
+    result = await report_trunks(keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_trunks(*, updates, session=None):
+    response_dict = await aio_session_of(session).put(updates, 'ut', 'tsp/t')
+    return handle_response(response_dict, None)
+
+
+async def update_trunk(*, key=None, session=None, **kwargs):
+    if not key:
+        key = tk(session=session)
+    return await update_trunks(updates=[TrunkUpdate(key, **kwargs)], session=session)
+
+
+#
+# Signal Interface:
+#
+
+# Create:
+
+async def create_signal_interfaces(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csi', 'tsp/t/%s/si' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsi')
+
+
+async def create_signal_interface(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_interfaces(trunk_key=trunk_key,
+                                           constructors=[SignalInterfaceConstructor(**kwargs)],
+                                           session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_interfaces(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsi', 'tsp/t/%s/si' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_interface(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_interfaces(trunk_key=trunk_key,
+                                           destructors=[SignalInterfaceDestructor(**kwargs)],
+                                           session=session)
+
+
+# Report:
+
+async def report_signal_interfaces(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalInterfaceQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/si%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsi')
+
+
+async def report_signal_interface(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_interfaces(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_interfaces(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usi', 'tsp/t/%s/si' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_interface(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_interfaces(trunk_key=trunk_key,
+                                          updates=[SignalInterfaceUpdate(**kwargs)],
+                                          session=session)
+
+
+#
+# Signal Port:
+#
+
+# Create:
+
+async def create_signal_ports(*, trunk_key=None, interface_key, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(
+                  constructors, 'csp', 'tsp/t/%s/si/%s/sp' % (trunk_key, interface_key), method='POST')
+    return handle_response(response_dict, 'rsp')
+
+
+async def create_signal_port(*, trunk_key=None, interface_key, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_ports(trunk_key=trunk_key,
+                                      interface_key=interface_key,
+                                      constructors=[SignalPortConstructor(**kwargs)],
+                                      session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_ports(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsp', 'tsp/t/%s/sp' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_port(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_ports(trunk_key=trunk_key,
+                                      destructors=[SignalPortDestructor(**kwargs)],
+                                      session=session)
+
+
+# Lookup:
+
+async def lookup_signal_port(*, trunk_key=None, alias, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/spa/%s' % (trunk_key, alias))
+    return handle_response(response_dict, 'lsp')
+
+
+# Report:
+
+async def report_signal_ports(*, trunk_key=None, interface_key, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalPortQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/si/%s/sp%s' % (trunk_key, interface_key, query()))
+    return handle_response(response_dict, 'rsp')
+
+
+async def report_signal_port(*, trunk_key=None, interface_key, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_ports(trunk_key=trunk_key,
+                                       interface_key=interface_key,
+                                       keys=[key],
+                                       sections=sections,
+                                       session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_ports(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usp', 'tsp/t/%s/sp' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_port(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_ports(trunk_key=trunk_key, updates=[SignalPortUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Source:
+#
+
+# Create:
+
+async def create_signal_sources(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'css', 'tsp/t/%s/ss' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rss')
+
+
+async def create_signal_source(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_sources(trunk_key=trunk_key,
+                                        constructors=[SignalSourceConstructor(**kwargs)],
+                                        session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_sources(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dss', 'tsp/t/%s/ss' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_source(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_sources(trunk_key=trunk_key,
+                                        destructors=[SignalSourceDestructor(**kwargs)],
+                                        session=session)
+
+
+# Report:
+
+async def report_signal_sources(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalSourceQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/ss%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rss')
+
+
+async def report_signal_source(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_sources(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_sources(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'uss', 'tsp/t/%s/ss' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_source(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_sources(trunk_key=trunk_key, updates=[SignalSourceUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Sink:
+#
+
+# Create:
+
+async def create_signal_sinks(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csk', 'tsp/t/%s/sk' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsk')
+
+
+async def create_signal_sink(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_sinks(trunk_key=trunk_key,
+                                      constructors=[SignalSinkConstructor(**kwargs)],
+                                      session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_sinks(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsk', 'tsp/t/%s/sk' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_sink(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_sinks(trunk_key=trunk_key,
+                                      destructors=[SignalSinkDestructor(**kwargs)],
+                                      session=session)
+
+
+# Report:
+
+async def report_signal_sinks(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalSinkQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/sk%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsk')
+
+
+async def report_signal_sink(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_sinks(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_sinks(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usk', 'tsp/t/%s/sk' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_sink(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_sinks(trunk_key=trunk_key, updates=[SignalSinkUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Link:
+#
+
+# Create:
+
+async def create_signal_links(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csl', 'tsp/t/%s/sl' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsl')
+
+
+async def create_signal_link(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_links(trunk_key=trunk_key,
+                                      constructors=[SignalLinkConstructor(**kwargs)],
+                                      session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_links(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsl', 'tsp/t/%s/sl' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_link(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_links(trunk_key=trunk_key,
+                                      destructors=[SignalLinkDestructor(**kwargs)],
+                                      session=session)
+
+
+# Report:
+
+async def report_signal_links(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalLinkQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/sl%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsl')
+
+
+async def report_signal_link(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_links(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_links(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usl', 'tsp/t/%s/sl' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_link(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_links(trunk_key=trunk_key, updates=[SignalLinkUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Tap:
+#
+
+# Create:
+
+async def create_signal_taps(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'cst', 'tsp/t/%s/st' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rst')
+
+
+async def create_signal_tap(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_taps(trunk_key=trunk_key,
+                                     constructors=[SignalTapConstructor(**kwargs)],
+                                     session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_taps(*, trunk_key=None, destructors=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dst', 'tsp/t/%s/st' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_tap(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_taps(trunk_key=trunk_key, destructors=[SignalTapDestructor(**kwargs)], session=session)
+
+
+# Report:
+
+async def report_signal_taps(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalTapQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/st%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rst')
+
+
+async def report_signal_tap(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_taps(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_taps(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'ust', 'tsp/t/%s/st' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_tap(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_taps(trunk_key=trunk_key, updates=[SignalTapUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Input:
+#
+
+# Create:
+
+async def create_signal_inputs(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csmi', 'tsp/t/%s/smi' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsmi')
+
+
+async def create_signal_input(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_inputs(trunk_key=trunk_key,
+                                       constructors=[SignalInputConstructor(**kwargs)],
+                                       session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_inputs(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsmi', 'tsp/t/%s/smi' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_input(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_inputs(trunk_key=trunk_key,
+                                       destructors=[SignalInputDestructor(**kwargs)],
+                                       session=session)
+
+
+# Report:
+
+async def report_signal_inputs(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalInputQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/smi%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsmi')
+
+
+async def report_signal_input(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_inputs(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_inputs(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmi', 'tsp/t/%s/smi' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_input(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_inputs(trunk_key=trunk_key, updates=[SignalInputUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Bridge:
+#
+
+# Create:
+
+async def create_signal_bridges(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csmb', 'tsp/t/%s/smb' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsmb')
+
+
+async def create_signal_bridge(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_bridges(trunk_key=trunk_key,
+                                        constructors=[SignalBridgeConstructor(**kwargs)],
+                                        session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_bridges(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsmb', 'tsp/t/%s/smb' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_bridge(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_bridges(trunk_key=trunk_key,
+                                        destructors=[SignalBridgeDestructor(**kwargs)],
+                                        session=session)
+
+
+# Report:
+
+async def report_signal_bridges(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalBridgeQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/smb%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsmb')
+
+
+async def report_signal_bridge(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_bridges(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_bridges(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmb', 'tsp/t/%s/smb' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_bridge(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_bridges(trunk_key=trunk_key, updates=[SignalBridgeUpdate(**kwargs)], session=session)
+
+
+#
+# Signal Output:
+#
+
+# Create:
+
+async def create_signal_outputs(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(constructors, 'csmo', 'tsp/t/%s/smo' % trunk_key, method='POST')
+    return handle_response(response_dict, 'rsmo')
+
+
+async def create_signal_output(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return (await create_signal_outputs(trunk_key=trunk_key,
+                                        constructors=[SignalOutputConstructor(**kwargs)],
+                                        session=session))[0]
+
+
+# Destroy:
+
+async def destroy_signal_outputs(*, trunk_key=None, destructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(destructors, 'dsmo', 'tsp/t/%s/smo' % trunk_key, method='DELETE')
+    return handle_response(response_dict, None)
+
+
+async def destroy_signal_output(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await destroy_signal_outputs(trunk_key=trunk_key,
+                                        destructors=[SignalOutputDestructor(**kwargs)],
+                                        session=session)
+
+
+# Report:
+
+async def report_signal_outputs(*, trunk_key=None, keys, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    query = SignalOutputQuery(keys, sections)
+    response_dict = await aio_session_of(session).get('tsp/t/%s/smo%s' % (trunk_key, query()))
+    return handle_response(response_dict, 'rsmo')
+
+
+async def report_signal_output(*, trunk_key=None, key, sections=None, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    result = await report_signal_outputs(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
+    return None if not result else result[0]
+
+
+# Update:
+
+async def update_signal_outputs(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = await aio_session_of(session).put(updates, 'usmo', 'tsp/t/%s/smo' % trunk_key)
+    return handle_response(response_dict, None)
+
+
+async def update_signal_output(*, trunk_key=None, session=None, **kwargs):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    return await update_signal_outputs(trunk_key=trunk_key, updates=[SignalOutputUpdate(**kwargs)], session=session)
@@ -21,6 +21,14 @@
 # its network interfacing code is naive and would require significant enhancement to be considered "production-ready".
 #
 
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import http.client
+import threading
+import time
+
 from taranoscsfpapi.sender import *
 
 
@@ -227,6 +235,8 @@ class PapiException (Exception):
         
         
 class CommonQuery:
+    __slots__ = ('keys', 'sections')
+
     def __init__(self,
                  keys,
                  sections=None):
@@ -234,19 +244,15 @@ class CommonQuery:
         self.sections = check_string_arg(sections)
 
     def __call__(self):
-        query = ''
-        if self.keys:
-            query += '?'
-            for key in self.keys:
-                query += 'k=%s' % key
-                if key != self.keys[-1]:
-                    query += '&'
+        params = ['k=%s' % key for key in self.keys] if self.keys else []
         if self.sections:
-            query += ('%ss=' % ('&' if self.keys else '?') + self.sections)
-        return query
+            params.append('s=' + self.sections)
+        return '?' + '&'.join(params) if params else ''
 
 
 class CommonSectionsOnlyQuery:
+    __slots__ = ('sections',)
+
     def __init__(self,
                  sections=None):
         self.sections = check_string_arg(sections)
@@ -258,6 +264,163 @@ class CommonSectionsOnlyQuery:
         return query
 
 
+def compile_request_serializer(request_spec):
+    """
+    Compile a request class's field spec into its serializer.
+
+    Each spec entry is an (attribute, path) or (attribute, path, is_required) tuple, where path is the dot-separated
+    wire path of the attribute's value in the request dict, e.g. 'm.t' or 's'.  Required attributes are always
+    serialized, the others only when they are truthy, and keys are added in spec order.  The serializer is generated
+    as straight-line code once per class, and builds the same dict as the equivalent hand-written __call__ would.
+
+    :param request_spec: Request field spec
+    :return: Serializer function, for use as the request class's __call__ method
+    """
+    entries = []
+    for entry in request_spec:
+        attribute, path = entry[:2]
+        steps = path.split('.')
+        if not attribute.isidentifier() or len(steps) > 2 or not all(steps):
+            raise PapiException(-1, 'request spec entry invalid: %r' % (entry,))
+        entries.append((attribute, steps, len(entry) > 2 and bool(entry[2])))
+
+    # Leading required entries make up the initial dict literal:
+    head = {}
+    while entries and entries[0][2]:
+        attribute, steps, _ = entries.pop(0)
+        if len(steps) == 1:
+            head[steps[0]] = 'self.%s' % attribute
+        else:
+            head.setdefault(steps[0], {})[steps[1]] = 'self.%s' % attribute
+
+    sections = {}
+    lines = []
+    for key, value in head.items():
+        if type(value) is dict:
+            sections[key] = 'section_%d' % len(sections)
+            lines.append('%s = {%s}' % (sections[key], ', '.join('%r: %s' % item for item in value.items())))
+    lines.append('request_dict = {%s}' % ', '.join('%r: %s' % (key, sections.get(key, value))
+                                                 for key, value in head.items()))
+    created = set(sections)
+    for attribute, steps, is_required in entries:
+        indent = ''
+        if not is_required:
+            lines.append('value = self.%s' % attribute)
+            lines.append('if value:')
+            indent = '    '
+        value = 'self.%s' % attribute if is_required else 'value'
+        if len(steps) == 1:
+            lines.append('%srequest_dict[%r] = %s' % (indent, steps[0], value))
+            continue
+        if steps[0] not in sections:
+            sections[steps[0]] = 'section_%d' % len(sections)
+            lines.insert(0, '%s = None' % sections[steps[0]])
+        section = sections[steps[0]]
+        if steps[0] not in created:
+            lines.append('%sif %s is None:' % (indent, section))
+            lines.append('%s    %s = request_dict[%r] = {}' % (indent, section, steps[0]))
+            if is_required:
+                created.add(steps[0])
+        lines.append('%s%s[%r] = %s' % (indent, section, steps[1], value))
+    lines.append('return request_dict')
+
+    namespace = {}
+    source = 'def __call__(self):\n' + ''.join('    %s\n' % line for line in lines)
+    exec(compile(source, '<request serializer>', 'exec'), namespace)
+    serializer = namespace['__call__']
+    serializer.request_spec = tuple(request_spec)
+    return serializer
+
+
+def compile_report_decoder(report_spec):
+    """
+    Compile a report record class's field spec into its decoder.
+
+    Each spec entry is an (attribute, path) tuple, where path is the dot-separated wire path of the attribute's value
+    in the report dict, e.g. 'm.n' or 's.p'.  Alternative paths may be joined with '|', in which case the first one
+    present is used, e.g. 'm._fe|m._se|m._pe' for an emitter key.  The decoder is generated as straight-line code once
+    per class, and builds a record from a report dict (or lazy ObjectView) in one pass over its sections, setting
+    every attribute whose value is absent to None.
+
+    :param report_spec: Report field spec
+    :return: Decoder class method, for use as the record class's decode method
+    """
+    sections = {}
+    lines = []
+    for entry in report_spec:
+        attribute, path = entry
+        alternatives = [alternative.split('.') for alternative in path.split('|')]
+        if not attribute.isidentifier() or not all(len(steps) <= 2 and all(steps) for steps in alternatives):
+            raise PapiException(-1, 'report spec entry invalid: %r' % (entry,))
+        getters = []
+        for steps in alternatives:
+            if len(steps) == 1:
+                getters.append('report.get(%r)' % steps[0])
+                continue
+            if steps[0] not in sections:
+                sections[steps[0]] = 'section_%d' % len(sections)
+                lines.append('%s = report.get(%r) or empty' % (sections[steps[0]], steps[0]))
+            getters.append('%s.get(%r)' % (sections[steps[0]], steps[1]))
+        if len(getters) == 1:
+            lines.append('record.%s = %s' % (attribute, getters[0]))
+            continue
+        lines.append('value = %s' % getters[0])
+        for getter in getters[1:]:
+            lines.append('if value is None:')
+            lines.append('    value = %s' % getter)
+        lines.append('record.%s = value' % attribute)
+    lines.insert(0, 'record = new(cls)')
+    lines.append('return record')
+
+    namespace = {'new': object.__new__, 'empty': {}}
+    source = 'def decode(cls, report):\n' + ''.join('    %s\n' % line for line in lines)
+    exec(compile(source, '<report decoder>', 'exec'), namespace)
+    decoder = namespace['decode']
+    decoder.report_spec = tuple(report_spec)
+    return classmethod(decoder)
+
+
+class ReportRecord:
+    """
+    Base of the compact, slotted report record classes (FieldReport, SubjectReport, SignalPortReport, ...).
+
+    A record holds the attributes listed in its class's report_spec, and nothing else: report content outside the
+    spec, such as child reports, is dropped.  Records are built from report dicts by the class's decode method, or by
+    decode_reports().
+    """
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for attribute in self.__slots__:
+            setattr(self, attribute, kwargs.pop(attribute, None))
+        if kwargs:
+            raise PapiException(-1, 'report attribute invalid: %s' % ', '.join(kwargs))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute) for attribute in self.__slots__)
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__,
+                           ', '.join('%s=%r' % (attribute, getattr(self, attribute))
+                                     for attribute in self.__slots__
+                                     if getattr(self, attribute) is not None))
+
+
+def decode_reports(record_class, reports):
+    """
+    Decode reports into records.
+
+    :param record_class: Report record class, e.g. SubjectReport
+    :param reports: Report list, or other iterable of reports (e.g. from iter_report_subjects()); may be None
+    :return: Record list, in report order (None if reports is None)
+    """
+    if reports is None:
+        return None
+    return list(map(record_class.decode, reports))
+
+
 def check_integer_arg(value):
     if value:
         if not isinstance(value, int):
@@ -323,21 +486,404 @@ def handle_response(response_dict, reply_key):
             raise PapiException(result_code, response_dict['e'])
 
 
-class Globals:
-    fk = None   # Default field key.
-    tk = None   # Default trunk key.
+def stream_response(session, api_spec, reply_key):
+    """
+    Send a GET request, and process the response from the Taranos Server incrementally, as its body is read.
+
+    A request whose URL would be too long is split as Session.get() splits it, and the parts are sent one after
+    another.  An unsuccessful response is only raised once its reply list, if any, has been read.
+
+    :param session: Session
+    :param api_spec: Request path (and query) relative to the server URL
+    :param reply_key: Expected reply key
+    :return: Generator of the elements of the list indexed by the reply key, each yielded as soon as it is parsed
+    :raise PapiException: Also if the session cannot stream responses, as an AsyncSender cannot
+    """
+    if not hasattr(session, 'stream'):
+        raise PapiException(-1, 'session cannot stream responses; use a Session, not an AsyncSender')
+    return _stream_parts(session, api_spec, reply_key)
+
+
+def _stream_parts(session, api_spec, reply_key):
+    for part_api_spec in session.split_query(api_spec):
+        members = {}
+        chunks = session.stream(part_api_spec)
+        try:
+            yield from iter_array_member(chunks, reply_key, members)
+        except (http.client.HTTPException, ValueError):
+            raise PapiException(-1, 'invalid response received')
+        finally:
+            chunks.close()
+        handle_response(members, None)
+
 
-Globals = Globals()
+class FanOutResult:
+    """
+    Outcome of one call made by fan_out().
+    """
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
 
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return 'FanOutResult(value=%r, error=%r)' % (self.value, self.error)
+
+
+def fan_out(calls, *, max_concurrency=8, session=None, timeout=None):
+    """
+    Make many API calls (typically report_* calls) concurrently on a thread pool.
 
-def get_server_defaults():
-    global Globals
+    :param calls: List of (function, kwargs dict) tuples, e.g. (report_subject, {'key': key})
+    :param max_concurrency: Maximum number of calls in flight at once
+    :param session: Session to pass to calls that don't specify one
+    :param timeout: Seconds allowed for all of the calls, or None to only be bound by any enclosing request_deadline()
+    :return: List of FanOutResults, in call order; a failed call's result holds its exception in error
+    """
+    def make_call(call):
+        function, kwargs = call
+        if session and 'session' not in kwargs:
+            kwargs = dict(kwargs, session=session)
+        try:
+            return FanOutResult(value=function(**kwargs))
+        except Exception as exc:
+            return FanOutResult(error=exc)
+
+    if not calls:
+        return []
+    with request_deadline(timeout) if timeout is not None else contextlib.nullcontext():
+        if max_concurrency <= 1 or len(calls) == 1:
+            return [make_call(call) for call in calls]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(calls))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, make_call, call) for call in calls]
+            return [future.result() for future in futures]
+
+
+class Coalescer:
+    """
+    Groups singular update and call requests (update_subject(), call_field_emitter(), update_signal_port(), ...) into
+    plural requests.
+
+    While a session's coalescer is set, its singular update and call functions return a concurrent.futures.Future
+    instead of sending a request.  Requests for the same endpoint and field or trunk key are held until window seconds
+    have passed since the first of them (if window is not None), max_batch_size of them are held, or flush() is
+    called, and are then sent as one plural request.  Each future gets the plural request's result, or the exception
+    it raised.
+
+    A plural request is sent in the context of the first request it holds, whichever thread sends it, so it is bound
+    by the request_deadline() its requests were made under; requests made under different deadlines are held apart.
+    """
+    def __init__(self, window=0.005, max_batch_size=256):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batches = {}
+        self._timer = None
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._batch_count = 0
+
+    def submit(self, function, items_name, item, **kwargs):
+        """
+        Hold a request for sending in a plural request.
+
+        :param function: Plural API function, e.g. update_subjects
+        :param items_name: Name of the plural function's list arg, e.g. 'updates'
+        :param item: Request arg, e.g. a SubjectUpdate
+        :param kwargs: Other args of the plural function, e.g. field_key and session
+        :return: Future
+        """
+        future = concurrent.futures.Future()
+        batch_key = (function, items_name, tuple(sorted(kwargs.items())), current_deadline())
+        full_batch = None
+        with self._lock:
+            self._request_count += 1
+            batch = self._batches.get(batch_key)
+            if batch is None:
+                batch = self._batches[batch_key] = (contextvars.copy_context(), [])
+            batch[1].append((item, future))
+            if len(batch[1]) >= self.max_batch_size:
+                full_batch = self._batches.pop(batch_key)
+            elif self.window is not None and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full_batch:
+            self._send(batch_key, full_batch)
+        return future
+
+    def flush(self):
+        """
+        Send all held requests now.
+        """
+        with self._lock:
+            batches = self._batches
+            self._batches = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for batch_key, batch in batches.items():
+            self._send(batch_key, batch)
+
+    def _send(self, batch_key, batch):
+        function, items_name, kwargs, _ = batch_key
+        context, batch = batch
+        with self._lock:
+            self._batch_count += 1
+        try:
+            result = context.run(function, **{items_name: [item for item, _ in batch]}, **dict(kwargs))
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        is_per_item = type(result) is list and len(result) == len(batch)
+        for i, (_, future) in enumerate(batch):
+            future.set_result(result[i] if is_per_item else result)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self._request_count,
+                'batches': self._batch_count,
+                'held': sum(len(batch) for _, batch in self._batches.values())}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+def coalesce(function, items_name, item, **kwargs):
+    """
+    Make a singular request through a plural API function, via the session's coalescer if it has one.
+
+    :param function: Plural API function, e.g. update_subjects
+    :param items_name: Name of the plural function's list arg, e.g. 'updates'
+    :param item: Request arg, e.g. a SubjectUpdate
+    :param kwargs: Other args of the plural function, e.g. field_key and session
+    :return: Result of the plural function, or a Future of it if the session has a coalescer
+    """
+    coalescer = session_of(kwargs.get('session')).coalescer
+    if coalescer is None:
+        return function(**{items_name: [item]}, **kwargs)
+    return coalescer.submit(function, items_name, item, **kwargs)
+
+
+class ReportCache:
+    """
+    Bounded LRU cache of report responses, consulted by a session's GET requests while it is the session's
+    report_cache.
+
+    Responses are cached by request path and query, i.e. by endpoint, keys and sections, and only if successful.
+    Each one expires ttl seconds after it was received, or ttls[code] seconds after if ttls has an entry for its
+    endpoint's entity code (e.g. 's' for subjects, 'sp' for signal ports); a TTL of 0 keeps that entity type out of
+    the cache.  Create, destroy, update and call requests sent through the session invalidate the responses they may
+    have made stale (see invalidate()).  Cached responses are shared by all of their callers, so must not be modified.
+
+    A response is not stored if its field or trunk (or, for a top-level endpoint, its collection) has been
+    invalidated since it was requested: callers read generation_of() before sending the request, and pass it to
+    put().
+    """
+    default_ttls = {'w': 0.0}   # Waveforms change continuously.
+
+    def __init__(self, max_size=1024, ttl=1.0, ttls=None, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = dict(ReportCache.default_ttls, **ttls) if ttls else dict(ReportCache.default_ttls)
+        self._clock = clock
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0            # Count of invalidations of the whole cache.
+        self._scope_generations = {}    # Count of invalidations per field or trunk key, or collection path.
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _parse(api_spec):
+        """
+        :return: (path, entity code, keys in the path, frozenset of the queried keys or None for all) tuple
+        """
+        path, _, query = api_spec.partition('?')
+        steps = path.split('/')
+        code = steps[-1] if len(steps) % 2 == 0 else steps[-2]
+        keys = frozenset(param[2:] for param in query.split('&') if param.startswith('k=')) if query else None
+        return path, code, steps[2::2], keys or None
+
+    @staticmethod
+    def _scope(path, path_keys):
+        # The field or trunk a response belongs to, or for a top-level endpoint its collection (e.g. 'trp/f'):
+        return path_keys[0] if path_keys else '/'.join(path.split('/', 2)[:2])
+
+    def generation_of(self, api_spec):
+        """
+        Get the generation of a response's scope, to be read before requesting it and passed to put().
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :return: Generation
+        """
+        path, _, path_keys, _ = ReportCache._parse(api_spec)
+        scope = ReportCache._scope(path, path_keys)
+        with self._lock:
+            return self._generation, self._scope_generations.get(scope, 0)
+
+    def get(self, api_spec):
+        """
+        :param api_spec: Request path (and query) relative to the server URL
+        :return: Cached response dict, or None
+        """
+        with self._lock:
+            entry = self._entries.get(api_spec)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[api_spec]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(api_spec)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, api_spec, response_dict, generation):
+        """
+        Cache a response, unless it is unsuccessful, its entity type is not cached, or its scope has been invalidated
+        since it was requested.
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :param response_dict: Response dict
+        :param generation: generation_of() the response, read before the request was sent
+        """
+        if not response_dict or response_dict.get('s') != 0 or response_dict.get('r') != 0:
+            return
+        parsed = ReportCache._parse(api_spec)
+        ttl = self.ttls.get(parsed[1], self.ttl)
+        if not ttl:
+            return
+        scope = ReportCache._scope(parsed[0], parsed[2])
+        with self._lock:
+            if generation != (self._generation, self._scope_generations.get(scope, 0)):
+                return
+            self._entries[api_spec] = (self._clock() + ttl, response_dict) + parsed
+            self._entries.move_to_end(api_spec)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _request_keys(args):
+        if isinstance(args, FormBatch):
+            args = args.request_dicts()
+        elif type(args) is not list:
+            args = [args]
+        keys = set()
+        for arg in args:
+            key = getattr(arg, 'key', None)
+            if key is None:
+                request_dict = arg() if callable(arg) else arg
+                if type(request_dict) is not dict:
+                    return None
+                key = request_dict.get('k')
+                if key is None:
+                    key = request_dict.get('m', {}).get('k')
+                if not isinstance(key, str):
+                    return None
+            keys.add(key)
+        return frozenset(keys)
+
+    def invalidate(self, api_spec, method, args):
+        """
+        Drop the cached responses a create (POST), destroy (DELETE), update or call (PUT) request may have made stale.
+        These are the responses for:
+
+        - the same entity type in the same field or trunk, except those for the same endpoint not querying any of the
+          request's keys (for an update or call whose keys are known)
+        - any endpoint under an entity the request addresses, e.g. trp/f/<field key>/s/<subject key>/pe when a
+          subject is updated
+        - for a create, destroy or call, any endpoint in the same field or trunk, and the field or trunk's own report
+          (a call's macro may create or change other elements, e.g. a field emitter's create_channel adds
+          oscillators and patches to the field)
+        - for a cell destroy, everything
+
+        :param api_spec: Request path relative to the server URL
+        :param method: HTTP method
+        :param args: Request args, as passed to Session.put()
+        """
+        is_call = api_spec.endswith('/m')
+        if is_call:
+            # Call requests are sent to their entity type's endpoint plus '/m':
+            api_spec = api_spec[:-2]
+        path, code, path_keys, _ = ReportCache._parse(api_spec)
+        is_structural = is_call or method in ('POST', 'DELETE')
+        keys = None if method == 'POST' else ReportCache._request_keys(args)
+        owner_path = '/'.join(path.split('/', 2)[:2])
+        owner_key = path_keys[0] if path_keys else None
+        depth = len(path_keys)
+        scopes = {owner_key} if owner_key is not None else set(keys or ())
+        if owner_key is None or is_structural:
+            scopes.add(owner_path)
+        with self._lock:
+            if path.startswith('tmp/'):
+                self._generation += 1
+                stale = list(self._entries)
+            else:
+                stale = []
+                for entry_spec, (_, _, entry_path, entry_code, entry_path_keys, entry_keys) in self._entries.items():
+                    if keys is not None and not keys.isdisjoint(entry_path_keys):
+                        stale.append(entry_spec)
+                    elif entry_code == code and entry_path_keys[:depth] == path_keys:
+                        if (keys is None or entry_keys is None or entry_path != path or
+                                not keys.isdisjoint(entry_keys)):
+                            stale.append(entry_spec)
+                    elif is_structural and owner_key is not None:
+                        if (entry_path_keys[:1] == [owner_key] or
+                                entry_path == owner_path and (entry_keys is None or owner_key in entry_keys)):
+                            stale.append(entry_spec)
+            for entry_spec in stale:
+                _, _, entry_path, _, entry_path_keys, _ = self._entries.pop(entry_spec)
+                scopes.add(ReportCache._scope(entry_path, entry_path_keys))
+            for scope in scopes:
+                self._scope_generations[scope] = self._scope_generations.get(scope, 0) + 1
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'expirations': self.expirations,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations}
+
+
+Globals = session_of(None)   # Default session, holding the default field key (fk) and trunk key (tk).
+
+
+def get_server_defaults(*, session=None):
+    """
+    Fetch the default field and trunk keys of a session's cell.
+
+    :param session: Session to use (defaults to the default session)
+    """
+    session = session_of(session)
 
     try:
-        response_dict = Sender.get('tmp/c')
+        response_dict = session.get('tmp/c')
         cell_report = handle_response(response_dict, 'rc')
-        Globals.fk = cell_report['mf']['_f']
-        Globals.tk = cell_report['mt']['_t']
+        session.fk = cell_report['mf']['_f']
+        session.tk = cell_report['mt']['_t']
 
     except PapiException as e:
         print('get_server_defaults() failed (%s)' % e.__repr__)
@@ -357,3 +903,15 @@ def papi_init(server_url=None, is_verbose=False):
 
     except PapiException as e:
         print('taranoscsfpapi init failed (%s)' % e.__repr__)
+
+
+def papi_session(server_url=None, is_verbose=False):
+    """
+    Open a new session with a Taranos Server.
+
+    :param server_url: URL of the Taranos Server
+    :return: Session, with its default field and trunk keys fetched from the server
+    """
+    session = Session(server_url, is_verbose)
+    get_server_defaults(session=session)
+    return session
@@ -0,0 +1,113 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# JSON codecs used by the senders to encode request args and decode responses.  The standard library json module is
+# used by default.  orjson and ujson are faster, but opt-in: they encode compactly and turn NaN into null, and args
+# they cannot encode (such as numpy scalars, non-string dict keys or integers wider than 64 bits) are encoded with json
+# instead.
+#
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec:
+    """
+    Codec backed by the standard library json module.
+    """
+    name = 'json'
+
+    @staticmethod
+    def dumps(obj):
+        return json.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    Codec backed by orjson, which encodes to and parses from bytes.
+    """
+    name = 'orjson'
+
+    @staticmethod
+    def dumps(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+        return json.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+
+class UjsonCodec:
+    """
+    Codec backed by ujson.
+    """
+    name = 'ujson'
+
+    @staticmethod
+    def dumps(obj):
+        try:
+            return ujson.dumps(obj, ensure_ascii=False)
+        except (TypeError, OverflowError):
+            pass
+        return json.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(data)
+
+
+codecs = {JsonCodec.name: JsonCodec}
+if ujson:
+    codecs[UjsonCodec.name] = UjsonCodec
+if orjson:
+    codecs[OrjsonCodec.name] = OrjsonCodec
+
+
+def get_codec(name=None):
+    """
+    Get a JSON codec.
+
+    :param name: Codec name ('orjson', 'ujson' or 'json'), 'fastest' for the fastest installed codec, or None for json
+    :return: Codec
+    """
+    if name is None:
+        return JsonCodec
+    if name == 'fastest':
+        for name in (OrjsonCodec.name, UjsonCodec.name, JsonCodec.name):
+            if name in codecs:
+                return codecs[name]
+    if name not in codecs:
+        raise ValueError('JSON codec unavailable: %s' % name)
+    return codecs[name]
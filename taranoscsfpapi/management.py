@@ -25,6 +25,8 @@ from taranoscsfpapi.api import *
 # Destroy:
 
 class CellDestructor:
+    __slots__ = ('is_testing',)
+
     def __init__(self,
                  is_testing):
         self.is_testing = is_testing
@@ -36,28 +38,30 @@ class CellDestructor:
         return request_dict
 
 
-def destroy_cell(*, is_testing=False):
+def destroy_cell(*, is_testing=False, session=None):
     """
     Destroy (reset) the currently associated simulation cell.
 
+    :param session: Session to use (defaults to the default session)
     :return: Cell destruction report
     """
-    response_dict = Sender.put(CellDestructor(is_testing), 'dc', 'tmp/c', method='DELETE')
+    response_dict = session_of(session).put(CellDestructor(is_testing), 'dc', 'tmp/c', method='DELETE')
 
-    get_server_defaults()
+    get_server_defaults(session=session)
 
     return handle_response(response_dict, None)
 
 
 # Report:
 
-def report_cell(*, sections=None):
+def report_cell(*, sections=None, session=None):
     """
     Report the currently associated cell's configuration.
 
     :param sections: Reporting sections
+    :param session: Session to use (defaults to the default session)
     :return: Cell configuration report
     """
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('tmp/c%s' % query())
+    response_dict = session_of(session).get('tmp/c%s' % query())
     return handle_response(response_dict, 'rc')
@@ -17,6 +17,11 @@
 
 from taranoscsfpapi.api import *
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class DestructorScopes:
     Shallow = 's'
@@ -76,16 +81,18 @@ def check_scope_arg(scope):
         return None
 
 
-def fk(new_value=None):
+def fk(new_value=None, *, session=None):
     """
     Get/set the default field key.
 
     :param new_value: New default field key
+    :param session: Session whose default field key to get/set (defaults to the default session)
     :return: Current default field key
     """
+    session = session_of(session)
     if new_value:
-        Globals.fk = new_value
-    return Globals.fk
+        session.fk = new_value
+    return session.fk
 
 
 #
@@ -95,6 +102,22 @@ def fk(new_value=None):
 # Create:
 
 class FieldConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'acoustic_c', 'acoustic_rho', 'antipode_distance', 'geometry',
+                 'trunk_key', 'modulator_key', 'patch_def')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('acoustic_c', 'a.ac'),
+        ('acoustic_rho', 'a.ar'),
+        ('antipode_distance', 'a.ad'),
+        ('geometry', 'a.g'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'),
+        ('trunk_key', 'r.t'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -119,130 +142,128 @@ class FieldConstructor:
         self.modulator_key = check_key_arg(modulator_key)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {'t': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.acoustic_c:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['ac'] = self.acoustic_c
-        if self.acoustic_rho:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['ar'] = self.acoustic_rho
-        if self.antipode_distance:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['ad'] = self.antipode_distance
-        if self.geometry:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['g'] = self.geometry
-        if self.patch_def:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['dpe'] = self.patch_def
-        if self.modulator_key:
-            if 'r' not in request_dict:
-                request_dict['r'] = {}
-            request_dict['r']['sm'] = self.modulator_key
-        if self.trunk_key:
-            if 'r' not in request_dict:
-                request_dict['r'] = {}
-            request_dict['r']['t'] = self.trunk_key
-        return request_dict
-
-
-def create_fields(*, constructors):
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_fields(*, constructors, session=None):
     """
     Create new fields.
 
     :param constructors: Field constructor list
+    :param session: Session to use (defaults to the default session)
     :return: Field creation reports
     """
-    response_dict = Sender.put(constructors, 'cf', 'trp/f', method='POST')
+    response_dict = session_of(session).put(constructors, 'cf', 'trp/f', method='POST')
     return handle_response(response_dict, 'rf')
 
 
-def create_field(**kwargs):
+def create_field(*, session=None, **kwargs):
     """
     Create a new field.
 
     :param kwargs: Field constructor arguments
+    :param session: Session to use (defaults to the default session)
     :return: Field creation report
     """
-    return create_fields(constructors=[FieldConstructor(**kwargs)])[0]
+    return create_fields(constructors=[FieldConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class FieldDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_fields(*, destructors):
+def destroy_fields(*, destructors, session=None):
     """
     Destroy fields.
 
     :param destructors: Field destructor list
+    :param session: Session to use (defaults to the default session)
     :return: Field destruction reports
     """
-    response_dict = Sender.put(destructors, 'df', 'trp/f', method='DELETE')
+    response_dict = session_of(session).put(destructors, 'df', 'trp/f', method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_field(*, key=None, **kwargs):
+def destroy_field(*, key=None, session=None, **kwargs):
     """
     Destroy a field.
 
     :param key: Field key
     :param kwargs: Field destructor arguments
+    :param session: Session to use (defaults to the default session)
     :return: Field destruction report
     """
     if not key:
-        key = fk()
-    return destroy_fields(destructors=[FieldDestructor(key, **kwargs)])
+        key = fk(session=session)
+    return destroy_fields(destructors=[FieldDestructor(key, **kwargs)], session=session)
 
 
 # Report:
 
 class FieldQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class FieldReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'acoustic_c', 'acoustic_rho', 'antipode_distance',
+                 'geometry', 'patch_def', 'modulator_key', 'trunk_key')
 
+    report_spec = (
+        ('key', 'm._f'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('acoustic_c', 'a.ac'),
+        ('acoustic_rho', 'a.ar'),
+        ('antipode_distance', 'a.ad'),
+        ('geometry', 'a.g'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'),
+        ('trunk_key', 'r.t'))
 
-def report_fields(*, keys, sections=None):
+    decode = compile_report_decoder(report_spec)
+
+
+def report_fields(*, keys, sections=None, session=None):
     query = FieldQuery(keys, sections)
-    response_dict = Sender.get('trp/f%s' % query())
+    response_dict = session_of(session).get('trp/f%s' % query())
     return handle_response(response_dict, 'rf')
 
 
-def report_field(*, key=None, sections=None):
+def report_field(*, key=None, sections=None, session=None):
     if not key:
-        key = fk()
-    result = report_fields(keys=[key], sections=sections)
+        key = fk(session=session)
+    result = report_fields(keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class FieldUpdate:
+    __slots__ = ('key', 'name', 'description', 'probe_updates', 'subject_updates')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('probe_updates', 'up'),
+        ('subject_updates', 'us'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -259,30 +280,18 @@ class FieldUpdate:
             raise PapiException(-1, 'subject updates arg invalid')
         self.subject_updates = subject_updates
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.probe_updates:
-            request_dict['up'] = self.probe_updates
-        if self.subject_updates:
-            request_dict['us'] = self.subject_updates
-        return request_dict
-
-
-def update_fields(*, updates):
-    response_dict = Sender.put(updates, 'uf', 'trp/f')
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_fields(*, updates, session=None):
+    response_dict = session_of(session).put(updates, 'uf', 'trp/f')
     return handle_response(response_dict, None)
 
 
-def update_field(*, key=None, **kwargs):
+def update_field(*, key=None, session=None, **kwargs):
     if not key:
-        key = fk()
-    return update_fields(updates=[FieldUpdate(key, **kwargs)])
+        key = fk(session=session)
+    return coalesce(update_fields, 'updates', FieldUpdate(key, **kwargs), session=session)
 
 
 #
@@ -292,6 +301,16 @@ def update_field(*, key=None, **kwargs):
 # Create:
 
 class FieldEmitterConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'modulator_key', 'patch_def')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -306,91 +325,101 @@ class FieldEmitterConstructor:
         self.modulator_key = check_key_arg(modulator_key)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {'dpe': self.patch_def}
-        if self.modulator_key:
-            request_dict['r'] = {'sm': self.modulator_key}
-        return request_dict
-
-
-def create_field_emitters(*, field_key=None, constructors):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(constructors, 'cfe', 'trp/f/%s/fe' % field_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_field_emitters(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(constructors, 'cfe', 'trp/f/%s/fe' % field_key, method='POST')
     return handle_response(response_dict, 'rfe')
 
 
-def create_field_emitter(*, field_key=None, **kwargs):
+def create_field_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return create_field_emitters(field_key=field_key, constructors=[FieldEmitterConstructor(**kwargs)])[0]
+        field_key = fk(session=session)
+    return create_field_emitters(field_key=field_key,
+                                 constructors=[FieldEmitterConstructor(**kwargs)],
+                                 session=session)[0]
 
 
 # Destroy:
 
 class FieldEmitterDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_field_emitters(*, field_key=None, destructors):
+def destroy_field_emitters(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'dfe', 'trp/f/%s/fe' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'dfe', 'trp/f/%s/fe' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_field_emitter(*, field_key=None, **kwargs):
+def destroy_field_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_field_emitters(field_key=field_key, destructors=[FieldEmitterDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_field_emitters(field_key=field_key, destructors=[FieldEmitterDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class FieldEmitterQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
 
+class EmitterReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'patch_def', 'modulator_key')
 
-def report_field_emitters(*, field_key=None, keys, sections=None):
+    report_spec = (
+        ('key', 'm._fe|m._se|m._pe'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'))
+
+    decode = compile_report_decoder(report_spec)
+
+
+def report_field_emitters(*, field_key=None, keys, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = FieldEmitterQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/fe%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/fe%s' % (field_key, query()))
     return handle_response(response_dict, 'rfe')
 
 
-def report_field_emitter(*, field_key=None, key, sections=None):
+def report_field_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_field_emitters(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_field_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class FieldEmitterUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -399,57 +428,55 @@ class FieldEmitterUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_field_emitters(*, field_key=None, updates):
+def update_field_emitters(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'ufe', 'trp/f/%s/fe' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'ufe', 'trp/f/%s/fe' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_field_emitter(*, field_key=None, **kwargs):
+def update_field_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_field_emitters(field_key=field_key, updates=[FieldEmitterUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_field_emitters,
+                    'updates',
+                    FieldEmitterUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class FieldEmitterCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_field_emitters(*, field_key=None, calls):
+def call_field_emitters(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mfe', 'trp/f/%s/fe/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mfe', 'trp/f/%s/fe/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_field_emitter(*, field_key=None, **kwargs):
+def call_field_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_field_emitters(field_key=field_key, calls=[FieldEmitterCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_field_emitters, 'calls', FieldEmitterCall(**kwargs), field_key=field_key, session=session)
 
 
 #
@@ -459,35 +486,62 @@ def call_field_emitter(*, field_key=None, **kwargs):
 # Report:
 
 class FieldOscillatorQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class OscillatorReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description')
 
+    report_spec = (
+        ('key', 'm._fo|m._so|m._po'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
 
-def report_field_oscillators(*, field_key=None, keys=None, sections=None):
+    decode = compile_report_decoder(report_spec)
+
+
+def report_field_oscillators(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = FieldOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/fo%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/fo%s' % (field_key, query()))
     return handle_response(response_dict, 'rfo')
 
 
-def report_field_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None):
+def iter_report_field_oscillators(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = FieldOscillatorQuery(keys, sections)
+    return stream_response(session_of(session), 'trp/f/%s/fo%s' % (field_key, query()), 'rfo')
+
+
+def report_field_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = FieldOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/fe/%s/fo%s' % (field_key, emitter_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/fe/%s/fo%s' % (field_key, emitter_key, query()))
     return handle_response(response_dict, 'rfo')
 
 
-def report_field_oscillator(*, field_key=None, key, sections=None):
+def report_field_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_field_oscillators(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_field_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class FieldOscillatorUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -496,57 +550,59 @@ class FieldOscillatorUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_field_oscillators(*, field_key=None, updates):
+def update_field_oscillators(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'ufo', 'trp/f/%s/fo' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'ufo', 'trp/f/%s/fo' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_field_oscillator(*, field_key=None, **kwargs):
+def update_field_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_field_oscillators(field_key=field_key, updates=[FieldOscillatorUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_field_oscillators,
+                    'updates',
+                    FieldOscillatorUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class FieldOscillatorCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_field_oscillators(*, field_key=None, calls):
+def call_field_oscillators(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mfo', 'trp/f/%s/fo/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mfo', 'trp/f/%s/fo/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_field_oscillator(*, field_key=None, **kwargs):
+def call_field_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_field_oscillators(field_key=field_key, calls=[FieldOscillatorCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_field_oscillators,
+                    'calls',
+                    FieldOscillatorCall(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -556,6 +612,18 @@ def call_field_oscillator(*, field_key=None, **kwargs):
 # Create:
 
 class SubjectConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'modulator_key', 'patch_def', 'position', 'rotation')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -574,99 +642,110 @@ class SubjectConstructor:
         self.position = check_position_arg(position)
         self.rotation = check_rotation_arg(rotation)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {'dpe': self.patch_def}
-        if self.modulator_key:
-            request_dict['r'] = {'sm': self.modulator_key}
-        if self.position:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['p'] = self.position
-        if self.rotation:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['r'] = self.rotation
-        return request_dict
-
-
-def create_subjects(*, field_key=None, constructors):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(constructors, 'cs', 'trp/f/%s/s' % field_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_subjects(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(constructors, 'cs', 'trp/f/%s/s' % field_key, method='POST')
     return handle_response(response_dict, 'rs')
 
 
-def create_subject(*, field_key=None, **kwargs):
+def create_subject(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return create_subjects(field_key=field_key, constructors=[SubjectConstructor(**kwargs)])[0]
+        field_key = fk(session=session)
+    return create_subjects(field_key=field_key, constructors=[SubjectConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class SubjectDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_subjects(*, field_key=None, destructors):
+def destroy_subjects(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'ds', 'trp/f/%s/s' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'ds', 'trp/f/%s/s' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_subject(*, field_key=None, **kwargs):
+def destroy_subject(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_subjects(field_key=field_key, destructors=[SubjectDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_subjects(field_key=field_key, destructors=[SubjectDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SubjectQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class SubjectReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'patch_def', 'modulator_key', 'position', 'rotation')
+
+    report_spec = (
+        ('key', 'm._s'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
+
+    decode = compile_report_decoder(report_spec)
 
 
-def report_subjects(*, field_key=None, keys, sections=None):
+def report_subjects(*, field_key=None, keys, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SubjectQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/s%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/s%s' % (field_key, query()))
     return handle_response(response_dict, 'rs')
 
 
-def report_subject(*, field_key=None, key, sections=None):
+def iter_report_subjects(*, field_key=None, keys, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_subjects(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    query = SubjectQuery(keys, sections)
+    return stream_response(session_of(session), 'trp/f/%s/s%s' % (field_key, query()), 'rs')
+
+
+def report_subject(*, field_key=None, key, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    result = report_subjects(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SubjectUpdate:
+    __slots__ = ('key', 'name', 'description', 'position', 'rotation')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -679,36 +758,187 @@ class SubjectUpdate:
         self.position = check_position_arg(position)
         self.rotation = check_rotation_arg(rotation)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.position:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['p'] = self.position
-        if self.rotation:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['r'] = self.rotation
-        return request_dict
-
-
-def update_subjects(*, field_key=None, updates):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'us', 'trp/f/%s/s' % field_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_subjects(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'us', 'trp/f/%s/s' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_subject(*, field_key=None, **kwargs):
+def update_subject(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_subjects(field_key=field_key, updates=[SubjectUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_subjects, 'updates', SubjectUpdate(**kwargs), field_key=field_key, session=session)
+
+
+def check_position_args(positions):
+    """
+    Validate and format a batch of positions at once.
+
+    A NumPy array of positions is bounds-checked in one vectorized pass, and its values are formatted in bulk.
+
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions as check_position_arg() accepts
+    :return: List of N formatted positions
+    """
+    if numpy is not None and isinstance(positions, numpy.ndarray):
+        return _check_array_rows(positions, 2, 'position args invalid')
+    return [check_position_arg(position) for position in positions]
+
+
+def check_rotation_args(rotations):
+    """
+    Validate and format a batch of rotations at once.
+
+    A NumPy array of rotations is bounds-checked in one vectorized pass, and its values are formatted in bulk.
+
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations as check_rotation_arg() accepts
+    :return: List of N formatted rotations
+    """
+    if numpy is not None and isinstance(rotations, numpy.ndarray):
+        return _check_array_rows(rotations.reshape(-1, 1) if rotations.ndim == 1 else rotations, 1,
+                                 'rotation args invalid')
+    return [check_rotation_arg(rotation) for rotation in rotations]
+
+
+def _check_array_rows(array, width, text):
+    if array.ndim != 2 or array.shape[1] != width or array.dtype.kind not in 'fiu':
+        raise PapiException(-1, text)
+    if array.size and ((array < -1.0) | (array > 1.0)).any():
+        raise PapiException(-1, text)
+    # tolist() yields Python numbers, which str() formats exactly as check_position_arg() and check_rotation_arg() do:
+    strings = map(str, array.ravel().tolist())
+    if width == 1:
+        return [[string] for string in strings]
+    return list(map(list, zip(*[strings] * width)))
+
+
+def _check_spatial_columns(keys, positions, rotations, names=None):
+    keys = [check_key_arg(key) for key in keys]
+    positions = check_position_args(positions) if positions is not None else [None] * len(keys)
+    rotations = check_rotation_args(rotations) if rotations is not None else [None] * len(keys)
+    names = [check_string_arg(name) for name in names] if names is not None else None
+    if (len(positions) != len(keys) or len(rotations) != len(keys) or
+            names is not None and len(names) != len(keys)):
+        raise PapiException(-1, 'positions, rotations or names arg length invalid')
+    return keys, positions, rotations, names
+
+
+def _make_spatial_updates(update_class, keys, positions, rotations):
+    keys, positions, rotations, _ = _check_spatial_columns(keys, positions, rotations)
+    updates = []
+    for key, position, rotation in zip(keys, positions, rotations):
+        # The args are validated already, so the updates are filled in directly:
+        update = update_class.__new__(update_class)
+        update.key = key
+        update.name = None
+        update.description = None
+        update.position = position
+        update.rotation = rotation
+        updates.append(update)
+    return updates
+
+
+class SpatialUpdateBatch(FormBatch):
+    """
+    Subject or probe updates given as columns, for the same request dicts that SubjectUpdate and ProbeUpdate make.
+
+    Unless the batch has names, its form body is written straight from the key, position and rotation columns through
+    a per-codec row template, without making the request dicts at all.
+    """
+    __slots__ = ('_keys', '_positions', '_rotations', '_names')
+
+    def __init__(self, keys, positions=None, rotations=None, names=None):
+        columns = _check_spatial_columns(keys, positions, rotations, names)
+        self._keys, self._positions, self._rotations, self._names = columns
+
+    def __len__(self):
+        return len(self._keys)
+
+    def request_dicts(self):
+        metas = [{'k': key} for key in self._keys]
+        if self._names is not None:
+            for meta, name in zip(metas, self._names):
+                if name:
+                    meta['n'] = name
+        request_dicts = [{'m': meta} for meta in metas]
+        for request_dict, position, rotation in zip(request_dicts, self._positions, self._rotations):
+            if position:
+                request_dict['s'] = {'p': position, 'r': rotation} if rotation else {'p': position}
+            elif rotation:
+                request_dict['s'] = {'r': rotation}
+        return request_dicts
+
+    def encode(self, form_header, codec):
+        # The row template only applies if every row has the same fields, and no field needs escaping:
+        count = len(self._keys)
+        is_positioned = count and None not in self._positions
+        is_rotated = count and None not in self._rotations
+        if (not count or self._names is not None or
+                not is_positioned and self._positions.count(None) != count or
+                not is_rotated and self._rotations.count(None) != count):
+            return None
+        columns = [self._keys]
+        if is_positioned:
+            columns.extend(zip(*self._positions))
+        if is_rotated:
+            columns.extend(zip(*self._rotations))
+        if not all(FormBatch.is_form_safe(column) for column in columns):
+            return None
+
+        # Encode one row of placeholders, and split it into the pieces between the columns:
+        placeholders = ['COLUMN%d' % i for i in range(len(columns))]
+        sample = {'m': {'k': placeholders[0]}}
+        if is_positioned:
+            sample['s'] = {'p': placeholders[1:3]}
+        if is_rotated:
+            sample.setdefault('s', {})['r'] = placeholders[-1:]
+        pieces = [encode_form([sample], form_header, codec).decode('ascii')]
+        for placeholder in placeholders:
+            split_piece = pieces.pop().split(placeholder)
+            if len(split_piece) != 2:
+                return None
+            pieces.extend(split_piece)
+        pieces[-1] += '&'
+
+        # Interleave the pieces and the columns, row after row, and join them all at once:
+        stride = len(pieces) + len(columns)
+        parts = [''] * (stride * count)
+        for i, piece in enumerate(pieces):
+            parts[2 * i::stride] = [piece] * count
+        for i, column in enumerate(columns):
+            parts[2 * i + 1::stride] = column
+        return ''.join(parts)[:-1].encode('ascii')
+
+
+def make_subject_updates(keys, positions=None, rotations=None):
+    """
+    Make position/rotation updates for a batch of subjects, validating the positions and rotations in bulk.
+
+    :param keys: Subject keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :return: List of N subject updates, for update_subjects()
+    """
+    return _make_spatial_updates(SubjectUpdate, keys, positions, rotations)
+
+
+def update_subjects_columnar(*, field_key=None, keys, positions=None, rotations=None, names=None, session=None):
+    """
+    Update a batch of subjects given as columns, without making an update object per subject.
+
+    :param field_key: Field key
+    :param keys: Subject keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :param names: Sequence of N subject names, or None
+    :param session: Session to use (defaults to the default session)
+    :return: Subject update report
+    """
+    updates = SpatialUpdateBatch(keys, positions, rotations, names)
+    return update_subjects(field_key=field_key, updates=updates, session=session)
 
 
 #
@@ -718,6 +948,16 @@ def update_subject(*, field_key=None, **kwargs):
 # Create:
 
 class SubjectEmitterConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'modulator_key', 'patch_def')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -732,102 +972,98 @@ class SubjectEmitterConstructor:
         self.modulator_key = check_key_arg(modulator_key)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {'dpe': self.patch_def}
-        if self.modulator_key:
-            request_dict['r'] = {'sm': self.modulator_key}
-        return request_dict
-
-
-def create_subject_emitters(*, field_key=None, subject_key, constructors):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_subject_emitters(*, field_key=None, subject_key, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(
         constructors, 'cse', 'trp/f/%s/s/%s/se' % (field_key, subject_key), method='POST')
     return handle_response(response_dict, 'rse')
 
 
-def create_subject_emitter(*, field_key=None, subject_key, **kwargs):
+def create_subject_emitter(*, field_key=None, subject_key, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     return create_subject_emitters(field_key=field_key,
                                    subject_key=subject_key,
-                                   constructors=[SubjectEmitterConstructor(**kwargs)])[0]
+                                   constructors=[SubjectEmitterConstructor(**kwargs)],
+                                   session=session)[0]
 
 
 # Destroy:
 
 class SubjectEmitterDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_subject_emitters(*, field_key=None, destructors):
+def destroy_subject_emitters(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'dse', 'trp/f/%s/se' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'dse', 'trp/f/%s/se' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_subject_emitter(*, field_key=None, **kwargs):
+def destroy_subject_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_subject_emitters(field_key=field_key, destructors=[SubjectEmitterDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_subject_emitters(field_key=field_key,
+                                    destructors=[SubjectEmitterDestructor(**kwargs)],
+                                    session=session)
 
 
 # Report:
 
 class SubjectEmitterQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_subject_emitters(*, field_key=None, keys=None, sections=None):
+def report_subject_emitters(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SubjectEmitterQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/se%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/se%s' % (field_key, query()))
     return handle_response(response_dict, 'rse')
 
 
-def report_subject_emitters_of_subject(*, field_key=None, subject_key, keys=None, sections=None):
+def report_subject_emitters_of_subject(*, field_key=None, subject_key, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SubjectEmitterQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/s/%s/se%s' % (field_key, subject_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/s/%s/se%s' % (field_key, subject_key, query()))
     return handle_response(response_dict, 'rse')
 
 
-def report_subject_emitter(*, field_key=None, key, sections=None):
+def report_subject_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_subject_emitters(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_subject_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SubjectEmitterUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -836,57 +1072,55 @@ class SubjectEmitterUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_subject_emitters(*, field_key=None, updates):
+def update_subject_emitters(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'use', 'trp/f/%s/se' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'use', 'trp/f/%s/se' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_subject_emitter(*, field_key=None, **kwargs):
+def update_subject_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_subject_emitters(field_key=field_key, updates=[SubjectEmitterUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_subject_emitters,
+                    'updates',
+                    SubjectEmitterUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class SubjectEmitterCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_subject_emitters(*, field_key=None, calls):
+def call_subject_emitters(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_subject_emitter(*, field_key=None, **kwargs):
+def call_subject_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_subject_emitters(field_key=field_key, calls=[SubjectEmitterCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_subject_emitters, 'calls', SubjectEmitterCall(**kwargs), field_key=field_key, session=session)
 
 
 #
@@ -896,35 +1130,49 @@ def call_subject_emitter(*, field_key=None, **kwargs):
 # Report:
 
 class SubjectOscillatorQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_subject_oscillators(*, field_key=None, keys=None, sections=None):
+def report_subject_oscillators(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SubjectOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/so%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/so%s' % (field_key, query()))
     return handle_response(response_dict, 'rso')
 
 
-def report_subject_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None):
+def iter_report_subject_oscillators(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = SubjectOscillatorQuery(keys, sections)
+    return stream_response(session_of(session), 'trp/f/%s/so%s' % (field_key, query()), 'rso')
+
+
+def report_subject_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SubjectOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/se/%s/so%s' % (field_key, emitter_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/se/%s/so%s' % (field_key, emitter_key, query()))
     return handle_response(response_dict, 'rso')
 
 
-def report_subject_oscillator(*, field_key=None, key, sections=None):
+def report_subject_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_subject_oscillators(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_subject_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SubjectOscillatorUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -933,57 +1181,59 @@ class SubjectOscillatorUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_subject_oscillators(*, field_key=None, updates):
+def update_subject_oscillators(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'uso', 'trp/f/%s/so' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'uso', 'trp/f/%s/so' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_subject_oscillator(*, field_key=None, **kwargs):
+def update_subject_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_subject_oscillators(field_key=field_key, updates=[SubjectOscillatorUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_subject_oscillators,
+                    'updates',
+                    SubjectOscillatorUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class SubjectOscillatorCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_subject_oscillators(*, field_key=None, calls):
+def call_subject_oscillators(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mso', 'trp/f/%s/so/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mso', 'trp/f/%s/so/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_subject_oscillator(*, field_key=None, **kwargs):
+def call_subject_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_subject_oscillators(field_key=field_key, calls=[SubjectOscillatorCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_subject_oscillators,
+                    'calls',
+                    SubjectOscillatorCall(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -993,6 +1243,22 @@ def call_subject_oscillator(*, field_key=None, **kwargs):
 # Create:
 
 class ProbeConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'position', 'rotation', 'acoustic_a', 'squelch_threshold',
+                 'lobe_range', 'lobe_range_poles', 'lobe_bearing_poles')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('acoustic_a', 'a.aa'),
+        ('squelch_threshold', 'a.st'),
+        ('lobe_range', 'a.lr'),
+        ('lobe_range_poles', 'a.lrp'),
+        ('lobe_bearing_poles', 'a.lbp'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -1017,115 +1283,107 @@ class ProbeConstructor:
         self.lobe_range_poles = check_string_arg(lobe_range_poles)
         self.lobe_bearing_poles = check_string_arg(lobe_bearing_poles)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.acoustic_a:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['aa'] = self.acoustic_a
-        if self.squelch_threshold:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['st'] = self.squelch_threshold
-        if self.lobe_range:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lr'] = self.lobe_range
-        if self.lobe_range_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lrp'] = self.lobe_range_poles
-        if self.lobe_bearing_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lbp'] = self.lobe_bearing_poles
-        if self.position:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['p'] = self.position
-        if self.rotation:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['r'] = self.rotation
-        return request_dict
-
-
-def create_probes(*, field_key=None, constructors):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(constructors, 'cp', 'trp/f/%s/p' % field_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_probes(*, field_key=None, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(constructors, 'cp', 'trp/f/%s/p' % field_key, method='POST')
     return handle_response(response_dict, 'rp')
 
 
-def create_probe(*, field_key=None, **kwargs):
+def create_probe(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return create_probes(field_key=field_key, constructors=[ProbeConstructor(**kwargs)])[0]
+        field_key = fk(session=session)
+    return create_probes(field_key=field_key, constructors=[ProbeConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class ProbeDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
   
-def destroy_probes(*, field_key=None, destructors):
+def destroy_probes(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'dp', 'trp/f/%s/p' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'dp', 'trp/f/%s/p' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_probe(*, field_key=None, **kwargs):
+def destroy_probe(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_probes(field_key=field_key, destructors=[ProbeDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_probes(field_key=field_key, destructors=[ProbeDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class ProbeQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class ProbeReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'acoustic_a', 'squelch_threshold', 'lobe_range',
+                 'lobe_range_poles', 'lobe_bearing_poles', 'position', 'rotation')
+
+    report_spec = (
+        ('key', 'm._p'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('acoustic_a', 'a.aa'),
+        ('squelch_threshold', 'a.st'),
+        ('lobe_range', 'a.lr'),
+        ('lobe_range_poles', 'a.lrp'),
+        ('lobe_bearing_poles', 'a.lbp'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
 
+    decode = compile_report_decoder(report_spec)
 
-def report_probes(*, field_key=None, keys, sections=None):
+
+def report_probes(*, field_key=None, keys, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/p%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/p%s' % (field_key, query()))
     return handle_response(response_dict, 'rp')
 
 
-def report_probe(*, field_key=None, key, sections=None):
+def report_probe(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_probes(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_probes(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class ProbeUpdate:
+    __slots__ = ('key', 'name', 'description', 'position', 'rotation')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('position', 's.p'),
+        ('rotation', 's.r'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1138,36 +1396,48 @@ class ProbeUpdate:
         self.position = check_position_arg(position)
         self.rotation = check_rotation_arg(rotation)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.position:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['p'] = self.position
-        if self.rotation:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['r'] = self.rotation
-        return request_dict
-
-
-def update_probes(*, field_key=None, updates):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'up', 'trp/f/%s/p' % field_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_probes(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'up', 'trp/f/%s/p' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_probe(*, field_key=None, **kwargs):
+def update_probe(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_probes(field_key=field_key, updates=[ProbeUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_probes, 'updates', ProbeUpdate(**kwargs), field_key=field_key, session=session)
+
+
+def make_probe_updates(keys, positions=None, rotations=None):
+    """
+    Make position/rotation updates for a batch of probes, validating the positions and rotations in bulk.
+
+    :param keys: Probe keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :return: List of N probe updates, for update_probes()
+    """
+    return _make_spatial_updates(ProbeUpdate, keys, positions, rotations)
+
+
+def update_probes_columnar(*, field_key=None, keys, positions=None, rotations=None, names=None, session=None):
+    """
+    Update a batch of probes given as columns, without making an update object per probe.
+
+    :param field_key: Field key
+    :param keys: Probe keys
+    :param positions: NumPy array of shape (N, 2), or sequence of N positions, or None
+    :param rotations: NumPy array of shape (N, 1) or (N,), or sequence of N rotations, or None
+    :param names: Sequence of N probe names, or None
+    :param session: Session to use (defaults to the default session)
+    :return: Probe update report
+    """
+    updates = SpatialUpdateBatch(keys, positions, rotations, names)
+    return update_probes(field_key=field_key, updates=updates, session=session)
 
 
 #
@@ -1177,6 +1447,16 @@ def update_probe(*, field_key=None, **kwargs):
 # Create:
 
 class ProbeEmitterConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'modulator_key', 'patch_def')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'),
+        ('modulator_key', 'r.sm'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -1191,102 +1471,96 @@ class ProbeEmitterConstructor:
         self.modulator_key = check_key_arg(modulator_key)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {'dpe': self.patch_def}
-        if self.modulator_key:
-            request_dict['r'] = {'sm': self.modulator_key}
-        return request_dict
-
-
-def create_probe_emitters(*, field_key=None, probe_key, constructors):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_probe_emitters(*, field_key=None, probe_key, constructors, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(
         constructors, 'cpe', 'trp/f/%s/p/%s/pe' % (field_key, probe_key), method='POST')
     return handle_response(response_dict, 'rpe')
 
 
-def create_probe_emitter(*, field_key=None, probe_key, **kwargs):
+def create_probe_emitter(*, field_key=None, probe_key, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     return create_probe_emitters(field_key=field_key,
                                  probe_key=probe_key,
-                                 constructors=[ProbeEmitterConstructor(**kwargs)])[0]
+                                 constructors=[ProbeEmitterConstructor(**kwargs)],
+                                 session=session)[0]
 
 
 # Destroy:
 
 class ProbeEmitterDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_probe_emitters(*, field_key=None, destructors):
+def destroy_probe_emitters(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'dpe', 'trp/f/%s/pe' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'dpe', 'trp/f/%s/pe' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_probe_emitter(*, field_key=None, **kwargs):
+def destroy_probe_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_probe_emitters(field_key=field_key, destructors=[ProbeEmitterDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_probe_emitters(field_key=field_key, destructors=[ProbeEmitterDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class ProbeEmitterQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_probe_emitters(*, field_key=None, keys=None, sections=None):
+def report_probe_emitters(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeEmitterQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/pe%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/pe%s' % (field_key, query()))
     return handle_response(response_dict, 'rpe')
 
 
-def report_probe_emitters_of_probe(*, field_key=None, probe_key, keys=None, sections=None):
+def report_probe_emitters_of_probe(*, field_key=None, probe_key, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeEmitterQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/s/%s/pe%s' % (field_key, probe_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/s/%s/pe%s' % (field_key, probe_key, query()))
     return handle_response(response_dict, 'rpe')
 
 
-def report_probe_emitter(*, field_key=None, key, sections=None):
+def report_probe_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_probe_emitters(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_probe_emitters(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class ProbeEmitterUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1295,57 +1569,55 @@ class ProbeEmitterUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_probe_emitters(*, field_key=None, updates):
+def update_probe_emitters(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'upe', 'trp/f/%s/pe' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'upe', 'trp/f/%s/pe' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_probe_emitter(*, field_key=None, **kwargs):
+def update_probe_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_probe_emitters(field_key=field_key, updates=[ProbeEmitterUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_probe_emitters,
+                    'updates',
+                    ProbeEmitterUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class ProbeEmitterCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_probe_emitters(*, field_key=None, calls):
+def call_probe_emitters(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mse', 'trp/f/%s/se/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_probe_emitter(*, field_key=None, **kwargs):
+def call_probe_emitter(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_probe_emitters(field_key=field_key, calls=[ProbeEmitterCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_probe_emitters, 'calls', ProbeEmitterCall(**kwargs), field_key=field_key, session=session)
 
 
 #
@@ -1355,35 +1627,49 @@ def call_probe_emitter(*, field_key=None, **kwargs):
 # Report:
 
 class ProbeOscillatorQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_probe_oscillators(*, field_key=None, keys=None, sections=None):
+def report_probe_oscillators(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/po%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/po%s' % (field_key, query()))
     return handle_response(response_dict, 'rpo')
 
 
-def report_probe_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None):
+def iter_report_probe_oscillators(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeOscillatorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/pe/%s/po%s' % (field_key, emitter_key, query()))
+    return stream_response(session_of(session), 'trp/f/%s/po%s' % (field_key, query()), 'rpo')
+
+
+def report_probe_oscillators_of_emitter(*, field_key=None, emitter_key, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeOscillatorQuery(keys, sections)
+    response_dict = session_of(session).get('trp/f/%s/pe/%s/po%s' % (field_key, emitter_key, query()))
     return handle_response(response_dict, 'rpo')
 
 
-def report_probe_oscillator(*, field_key=None, key, sections=None):
+def report_probe_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_probe_oscillators(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_probe_oscillators(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class ProbeOscillatorUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1392,57 +1678,59 @@ class ProbeOscillatorUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_probe_oscillators(*, field_key=None, updates):
+def update_probe_oscillators(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'upo', 'trp/f/%s/po' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'upo', 'trp/f/%s/po' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_probe_oscillator(*, field_key=None, **kwargs):
+def update_probe_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_probe_oscillators(field_key=field_key, updates=[ProbeOscillatorUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_probe_oscillators,
+                    'updates',
+                    ProbeOscillatorUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 # Call:
 
 class ProbeOscillatorCall:
+    __slots__ = ('key', 'macro')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('macro', 'm', True))
+
     def __init__(self,
                  key,
                  macro):
         self.key = check_key_arg(key)
         self.macro = check_macro_arg(macro)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'm': self.macro}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def call_probe_oscillators(*, field_key=None, calls):
+def call_probe_oscillators(*, field_key=None, calls, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(calls, 'mpo', 'trp/f/%s/po/m' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(calls, 'mpo', 'trp/f/%s/po/m' % field_key)
     return handle_response(response_dict, None)
 
 
-def call_probe_oscillator(*, field_key=None, **kwargs):
+def call_probe_oscillator(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return call_probe_oscillators(field_key=field_key, calls=[ProbeOscillatorCall(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(call_probe_oscillators,
+                    'calls',
+                    ProbeOscillatorCall(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -1452,6 +1740,21 @@ def call_probe_oscillator(*, field_key=None, **kwargs):
 # Create:
 
 class ProbeCollectorConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'alias', 'acoustic_a', 'squelch_threshold', 'lobe_range',
+                 'lobe_range_poles', 'lobe_bearing_poles')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('alias', 'm.a'),
+        ('acoustic_a', 'a.aa'),
+        ('squelch_threshold', 'a.st'),
+        ('lobe_range', 'a.lr'),
+        ('lobe_range_poles', 'a.lrp'),
+        ('lobe_bearing_poles', 'a.lbp'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -1474,129 +1777,120 @@ class ProbeCollectorConstructor:
         self.lobe_range_poles = check_string_arg(lobe_range_poles)
         self.lobe_bearing_poles = check_string_arg(lobe_bearing_poles)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.alias:
-            request_dict['m']['a'] = self.alias
-        if self.acoustic_a:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['aa'] = self.acoustic_a
-        if self.squelch_threshold:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['st'] = self.squelch_threshold
-        if self.lobe_range:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lr'] = self.lobe_range
-        if self.lobe_range_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lrp'] = self.lobe_range_poles
-        if self.lobe_bearing_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lbp'] = self.lobe_bearing_poles
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def create_probe_collectors(*, field_key=None, probe_key, constructors):
+def create_probe_collectors(*, field_key=None, probe_key, constructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(
         constructors, 'cpc', 'trp/f/%s/p/%s/pc' % (field_key, probe_key), method='POST')
     return handle_response(response_dict, 'rpc')
 
 
-def create_probe_collector(*, field_key=None, probe_key, **kwargs):
+def create_probe_collector(*, field_key=None, probe_key, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     return create_probe_collectors(field_key=field_key,
                                    probe_key=probe_key,
-                                   constructors=[ProbeCollectorConstructor(**kwargs)])[0]
+                                   constructors=[ProbeCollectorConstructor(**kwargs)],
+                                   session=session)[0]
 
 
 # Destroy:
 
 class ProbeCollectorDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('scope', 's'))
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_scope_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.scope:
-            request_dict['s'] = self.scope
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_probe_collectors(*, field_key=None, destructors):
+def destroy_probe_collectors(*, field_key=None, destructors, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(destructors, 'dpc', 'trp/f/%s/pc' % field_key, method='DELETE')
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(destructors, 'dpc', 'trp/f/%s/pc' % field_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_probe_collector(*, field_key=None, **kwargs):
+def destroy_probe_collector(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return destroy_probe_collectors(field_key=field_key, destructors=[ProbeCollectorDestructor(**kwargs)])
+        field_key = fk(session=session)
+    return destroy_probe_collectors(field_key=field_key,
+                                    destructors=[ProbeCollectorDestructor(**kwargs)],
+                                    session=session)
 
 
 # Lookup:
 
-def lookup_probe_collector(*, field_key=None, alias):
+def lookup_probe_collector(*, field_key=None, alias, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.get('trp/f/%s/pca/%s' % (field_key, alias))
+        field_key = fk(session=session)
+    response_dict = session_of(session).get('trp/f/%s/pca/%s' % (field_key, alias))
     return handle_response(response_dict, 'lpc')
 
 
 # Report:
 
 class ProbeCollectorQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_probe_collectors(*, field_key=None, keys=None, sections=None):
+def report_probe_collectors(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeCollectorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/pc%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/pc%s' % (field_key, query()))
     return handle_response(response_dict, 'rpc')
 
 
-def report_probe_collectors_of_probe(*, field_key=None, probe_key, keys=None, sections=None):
+def iter_report_probe_collectors(*, field_key=None, keys=None, sections=None, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    query = ProbeCollectorQuery(keys, sections)
+    return stream_response(session_of(session), 'trp/f/%s/pc%s' % (field_key, query()), 'rpc')
+
+
+def report_probe_collectors_of_probe(*, field_key=None, probe_key, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = ProbeCollectorQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/s/%s/pc%s' % (field_key, probe_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/s/%s/pc%s' % (field_key, probe_key, query()))
     return handle_response(response_dict, 'rpc')
 
 
-def report_probe_collector(*, field_key=None, key, sections=None):
+def report_probe_collector(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_probe_collectors(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_probe_collectors(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class ProbeCollectorUpdate:
+    __slots__ = ('key', 'name', 'description', 'acoustic_a', 'squelch_threshold', 'lobe_range', 'lobe_range_poles',
+                 'lobe_bearing_poles')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('acoustic_a', 'a.aa'),
+        ('squelch_threshold', 'a.st'),
+        ('lobe_range', 'a.lr'),
+        ('lobe_range_poles', 'a.lrp'),
+        ('lobe_bearing_poles', 'a.lbp'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1615,48 +1909,24 @@ class ProbeCollectorUpdate:
         self.lobe_range_poles = check_string_arg(lobe_range_poles)
         self.lobe_bearing_poles = check_string_arg(lobe_bearing_poles)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.acoustic_a:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['aa'] = self.acoustic_a
-        if self.squelch_threshold:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['st'] = self.squelch_threshold
-        if self.lobe_range:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lr'] = self.lobe_range
-        if self.lobe_range_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lrp'] = self.lobe_range_poles
-        if self.lobe_bearing_poles:
-            if 'a' not in request_dict:
-                request_dict['a'] = {}
-            request_dict['a']['lbp'] = self.lobe_bearing_poles
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_probe_collectors(*, field_key=None, updates):
+def update_probe_collectors(*, field_key=None, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'upc', 'trp/f/%s/pc' % field_key)
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'upc', 'trp/f/%s/pc' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_probe_collector(*, field_key=None, **kwargs):
+def update_probe_collector(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_probe_collectors(field_key=field_key, updates=[ProbeCollectorUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_probe_collectors,
+                    'updates',
+                    ProbeCollectorUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -1666,51 +1936,73 @@ def update_probe_collector(*, field_key=None, **kwargs):
 # Report:
 
 class EmitterPatchQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class EmitterPatchReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'patch_def')
+
+    report_spec = (
+        ('key', 'm._smpe'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'))
+
+    decode = compile_report_decoder(report_spec)
 
 
-def report_emitter_patches(*, field_key=None, keys=None, sections=None):
+def report_emitter_patches(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = EmitterPatchQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/smpe%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/smpe%s' % (field_key, query()))
     return handle_response(response_dict, 'rsmpe')
 
 
-def report_emitter_patch(*, field_key=None, key, sections=None):
+def report_emitter_patch(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_emitter_patches(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_emitter_patches(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
-def report_patch_of_field_emitter(*, field_key=None, key, sections=None):
+def report_patch_of_field_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/fe/%s/smpe%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/fe/%s/smpe%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpe')[0]
 
 
-def report_patch_of_subject_emitter(*, field_key=None, key, sections=None):
+def report_patch_of_subject_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/se/%s/smpe%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/se/%s/smpe%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpe')[0]
 
 
-def report_patch_of_probe_emitter(*, field_key=None, key, sections=None):
+def report_patch_of_probe_emitter(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/pe/%s/smpe%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/pe/%s/smpe%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpe')[0]
 
 
 # Update:
 
 class EmitterPatchUpdate:
+    __slots__ = ('key', 'name', 'description', 'patch_def')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1721,31 +2013,24 @@ class EmitterPatchUpdate:
         self.description = check_string_arg(description)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {}
-            request_dict['a']['dpe'] = self.patch_def
-        return request_dict
-
-
-def update_emitter_patches(*, field_key=None, updates):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'usmpe', 'trp/f/%s/smpe' % field_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_emitter_patches(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'usmpe', 'trp/f/%s/smpe' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_emitter_patch(*, field_key=None, **kwargs):
+def update_emitter_patch(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_emitter_patches(field_key=field_key, updates=[EmitterPatchUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_emitter_patches,
+                    'updates',
+                    EmitterPatchUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -1755,51 +2040,73 @@ def update_emitter_patch(*, field_key=None, **kwargs):
 # Report:
 
 class OscillatorPatchQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
 
+class OscillatorPatchReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'patch_def')
 
-def report_oscillator_patches(*, field_key=None, keys=None, sections=None):
+    report_spec = (
+        ('key', 'm._smpo'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpe'))
+
+    decode = compile_report_decoder(report_spec)
+
+
+def report_oscillator_patches(*, field_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = OscillatorPatchQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/smpo%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/smpo%s' % (field_key, query()))
     return handle_response(response_dict, 'rsmpo')
 
 
-def report_oscillator_patch(*, field_key=None, key, sections=None):
+def report_oscillator_patch(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_oscillator_patches(field_key=field_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_oscillator_patches(field_key=field_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
-def report_patch_of_field_oscillator(*, field_key=None, key, sections=None):
+def report_patch_of_field_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/fe/%s/smpo%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/fe/%s/smpo%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpo')[0]
 
 
-def report_patch_of_subject_oscillator(*, field_key=None, key, sections=None):
+def report_patch_of_subject_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/se/%s/smpo%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/se/%s/smpo%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpo')[0]
 
 
-def report_patch_of_probe_oscillator(*, field_key=None, key, sections=None):
+def report_patch_of_probe_oscillator(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/pe/%s/smpo%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/pe/%s/smpo%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rsmpo')[0]
 
 
 # Update:
 
 class OscillatorPatchUpdate:
+    __slots__ = ('key', 'name', 'description', 'patch_def')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('patch_def', 'a.dpo'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1810,31 +2117,24 @@ class OscillatorPatchUpdate:
         self.description = check_string_arg(description)
         self.patch_def = check_patch_def_arg(patch_def)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.patch_def:
-            request_dict['a'] = {}
-            request_dict['a']['dpo'] = self.patch_def
-        return request_dict
-
-
-def update_oscillator_patches(*, field_key=None, updates):
-    if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'usmpo', 'trp/f/%s/smpo' % field_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_oscillator_patches(*, field_key=None, updates, session=None):
+    if not field_key:
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'usmpo', 'trp/f/%s/smpo' % field_key)
     return handle_response(response_dict, None)
 
 
-def update_oscillator_patch(*, field_key=None, **kwargs):
+def update_oscillator_patch(*, field_key=None, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_oscillator_patches(field_key=field_key, updates=[OscillatorPatchUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_oscillator_patches,
+                    'updates',
+                    OscillatorPatchUpdate(**kwargs),
+                    field_key=field_key,
+                    session=session)
 
 
 #
@@ -1844,53 +2144,62 @@ def update_oscillator_patch(*, field_key=None, **kwargs):
 # Report:
 
 class OscillatorPatchEnvelopeQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_oscillator_patch_envelopes(*, field_key=None, patch_key=None, keys=None, sections=None):
+def report_oscillator_patch_envelopes(*, field_key=None, patch_key=None, keys=None, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = OscillatorPatchEnvelopeQuery(keys, sections)
-    response_dict = Sender.get('trp/f/%s/smpo/%s/e%s' % (field_key, patch_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/smpo/%s/e%s' % (field_key, patch_key, query()))
     return handle_response(response_dict, 'resmpo')
 
 
-def report_oscillator_patch_envelope(*, field_key=None, patch_key, key, sections=None):
+def report_oscillator_patch_envelope(*, field_key=None, patch_key, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
-    result = report_oscillator_patch_envelopes(field_key=field_key, patch_key=patch_key, keys=[key], sections=sections)
+        field_key = fk(session=session)
+    result = report_oscillator_patch_envelopes(field_key=field_key,
+                                               patch_key=patch_key,
+                                               keys=[key],
+                                               sections=sections,
+                                               session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class OscillatorPatchEnvelopeUpdate:
+    __slots__ = ('key', 'envelope_def')
+
+    request_spec = (
+        ('key', 'k', True),
+        ('envelope_def', 'de', True))
+
     def __init__(self,
                  key,
                  envelope_def):
         self.key = check_string_arg(key)
         self.envelope_def = check_envelope_def_arg(envelope_def)
 
-    def __call__(self):
-        request_dict = {
-            'k': self.key,
-            'de': self.envelope_def}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_oscillator_patch_envelopes(*, field_key=None, patch_key, updates):
+def update_oscillator_patch_envelopes(*, field_key=None, patch_key, updates, session=None):
     if not field_key:
-        field_key = fk()
-    response_dict = Sender.put(updates, 'usmpoe', 'trp/f/%s/smpo/%s/e' % (field_key, patch_key))
+        field_key = fk(session=session)
+    response_dict = session_of(session).put(updates, 'usmpoe', 'trp/f/%s/smpo/%s/e' % (field_key, patch_key))
     return handle_response(response_dict, None)
 
 
-def update_oscillator_patch_envelope(*, field_key=None, patch_key, **kwargs):
+def update_oscillator_patch_envelope(*, field_key=None, patch_key, session=None, **kwargs):
     if not field_key:
-        field_key = fk()
-    return update_oscillator_patch_envelopes(field_key=field_key,
-                                             patch_key=patch_key,
-                                             updates=[OscillatorPatchEnvelopeUpdate(**kwargs)])
+        field_key = fk(session=session)
+    return coalesce(update_oscillator_patch_envelopes,
+                    'updates',
+                    OscillatorPatchEnvelopeUpdate(**kwargs),
+                    field_key=field_key,
+                    patch_key=patch_key,
+                    session=session)
 
 
 #
@@ -1900,6 +2209,9 @@ def update_oscillator_patch_envelope(*, field_key=None, patch_key, **kwargs):
 # Report:
 
 class SamplerQuery:
+    __slots__ = ('field_geometry', 'antipode_distance', 'collector_position', 'collector_rotation', 'acoustic_a',
+                 'squelch_threshold', 'lobe_range', 'lobe_range_poles', 'lobe_bearing_poles', 'sections')
+
     def __init__(self,
                  field_geometry=None,
                  antipode_distance=None,
@@ -1962,9 +2274,9 @@ def report_waveforms(*,
                      lobe_range=None,
                      lobe_range_poles=None,
                      lobe_bearing_poles=None,
-                     sections=None):
+                     sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = SamplerQuery(field_geometry=field_geometry,
                          antipode_distance=antipode_distance,
                          collector_position=position,
@@ -1975,23 +2287,23 @@ def report_waveforms(*,
                          lobe_range_poles=lobe_range_poles,
                          lobe_bearing_poles=lobe_bearing_poles,
                          sections=sections)
-    response_dict = Sender.get('trp/f/%s/w%s' % (field_key, query()))
+    response_dict = session_of(session).get('trp/f/%s/w%s' % (field_key, query()))
     return handle_response(response_dict, 'rw')
 
 
-def report_waveforms_at_probe(*, field_key=None, key, sections=None):
+def report_waveforms_at_probe(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/p/%s/w%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/p/%s/w%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rw')
 
 
-def report_waveforms_at_probe_collector(*, field_key=None, key, sections=None):
+def report_waveforms_at_probe_collector(*, field_key=None, key, sections=None, session=None):
     if not field_key:
-        field_key = fk()
+        field_key = fk(session=session)
     query = CommonSectionsOnlyQuery(sections)
-    response_dict = Sender.get('trp/f/%s/pc/%s/w%s' % (field_key, key, query()))
+    response_dict = session_of(session).get('trp/f/%s/pc/%s/w%s' % (field_key, key, query()))
     return handle_response(response_dict, 'rw')
 
 
@@ -0,0 +1,191 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Replay of traffic recorded with Session.start_recording(), for load testing a Taranos Server.  Recorded requests are
+# re-issued at their original pace, a multiple of it or as fast as possible, and their responses compared with the
+# recorded ones.
+#
+
+import concurrent.futures
+import gzip
+import json
+import threading
+import time
+
+from taranoscsfpapi.api import *
+
+
+class TrafficRecord:
+    """
+    One recorded request and its response, or the error it failed with (in which case status and response_data are
+    None).
+    """
+    def __init__(self, timestamp, method, api_spec, request_data, status, response_data, latency, error=None):
+        self.timestamp = timestamp
+        self.method = method
+        self.api_spec = api_spec
+        self.request_data = request_data
+        self.status = status
+        self.response_data = response_data
+        self.latency = latency
+        self.error = error
+
+
+def read_traffic(path):
+    """
+    Read a traffic recording.
+
+    :param path: Path of the recording file
+    :return: Iterator of TrafficRecords, in the order they were recorded
+    """
+    with (gzip.open(path, 'rt', encoding='utf-8') if path.endswith('.gz') else open(path, encoding='utf-8')) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield TrafficRecord(record['t'],
+                                record['m'],
+                                record['a'],
+                                record['b'].encode('utf-8') if record['b'] is not None else None,
+                                record['s'],
+                                record['r'].encode('utf-8') if record['r'] is not None else None,
+                                record['l'],
+                                record.get('e'))
+
+
+class ReplayReport:
+    """
+    Outcome of a traffic replay.
+    """
+    def __init__(self):
+        self.request_count = 0
+        self.error_count = 0
+        self.mismatch_count = 0
+        self.mismatches = []   # (record, response dict) tuples of the first mismatched responses.
+        self.errors = []       # (record, exception) tuples of the first requests that failed.
+        self.latencies = []
+        self.elapsed = 0.0
+        self.max_lag = 0.0     # Longest time a request was sent behind schedule.
+
+    @property
+    def throughput(self):
+        return self.request_count / self.elapsed if self.elapsed else 0.0
+
+    def latency_percentile(self, percent):
+        """
+        Get a response latency percentile.
+
+        :param percent: Percentile, from 0 to 100
+        :return: Latency in seconds, or None if no requests were replayed
+        """
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, max(0, int(round(percent / 100 * len(latencies))) - 1))]
+
+    def report(self):
+        return {
+            'requests': self.request_count,
+            'errors': self.error_count,
+            'mismatches': self.mismatch_count,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'latency_p50': self.latency_percentile(50),
+            'latency_p90': self.latency_percentile(90),
+            'latency_p99': self.latency_percentile(99),
+            'latency_max': max(self.latencies) if self.latencies else None,
+            'max_lag': self.max_lag}
+
+
+def replay_traffic(path, *, session=None, speed=1.0, max_concurrency=16, compare=None, max_mismatches=100):
+    """
+    Replay recorded traffic against a Taranos Server.
+
+    Requests are sent concurrently over the session's transport, each at its recorded offset from the first request
+    divided by speed.  A request whose response can't be had (a failed or timed out request) counts as an error, as
+    does one whose recorded response can't be decoded or compared; one whose response differs from the recorded
+    response counts as a mismatch.  Requests that were recorded failing are replayed, but their responses aren't
+    compared.
+
+    :param path: Path of the recording file
+    :param session: Session to send the requests with (defaults to the default session)
+    :param speed: Pace relative to the recording (1.0 for the recorded pace, 10.0 for ten times faster), or None to
+        send requests as fast as max_concurrency allows
+    :param max_concurrency: Maximum number of requests in flight at once
+    :param compare: Function taking the recorded and replayed response dicts and returning whether they match
+        (defaults to equality)
+    :param max_mismatches: Maximum number of mismatched responses, and of errors, to keep in the report
+    :return: ReplayReport
+    """
+    session = session_of(session)
+    if compare is None:
+        compare = lambda expected, actual: expected == actual
+    report = ReplayReport()
+    lock = threading.Lock()
+    in_flight = threading.BoundedSemaphore(max_concurrency)
+
+    def replay_one(record):
+        try:
+            started = time.perf_counter()
+            response_dict = None
+            error = None
+            is_mismatch = False
+            try:
+                response_dict = session.request(record.method, record.api_spec, record.request_data)
+            except Exception as exc:
+                error = exc
+            latency = time.perf_counter() - started
+            if error is None and record.status is not None:
+                try:
+                    expected_dict = session.codec.loads(record.response_data) if record.status < 400 else {}
+                    if response_dict == {} and expected_dict != {}:
+                        error = PapiException(-1, 'no response to replayed request')
+                    else:
+                        is_mismatch = not compare(expected_dict, response_dict)
+                except Exception as exc:
+                    error = exc
+            with lock:
+                report.request_count += 1
+                report.latencies.append(latency)
+                if error is not None:
+                    report.error_count += 1
+                    if len(report.errors) < max_mismatches:
+                        report.errors.append((record, error))
+                elif is_mismatch:
+                    report.mismatch_count += 1
+                    if len(report.mismatches) < max_mismatches:
+                        report.mismatches.append((record, response_dict))
+        finally:
+            in_flight.release()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        start = time.perf_counter()
+        first_timestamp = None
+        for record in read_traffic(path):
+            if speed:
+                if first_timestamp is None:
+                    first_timestamp = record.timestamp
+                delay = (record.timestamp - first_timestamp) / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                elif -delay > report.max_lag:
+                    report.max_lag = -delay
+            in_flight.acquire()
+            executor.submit(replay_one, record)
+    report.elapsed = time.perf_counter() - start
+    return report
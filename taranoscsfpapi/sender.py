@@ -16,95 +16,1819 @@
 #
 
 
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import gzip
+import http.client
+import io
 import json
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
 
+from taranoscsfpapi.codec import *
+from taranoscsfpapi.views import *
 
-class SingleSender:
 
+_form_safe_bytes = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~'
+_form_escapes = [b'%%%02X' % byte for byte in range(256)]
 
-    default_server_url = 'http://localhost:9000'
 
-    class __InnerSender:
+class FrozenRequest:
+    """
+    Immutable request, serialized once when it is frozen.
 
-        def __init__(self, server_url=None, is_verbose=False):
-            self._is_verbose = is_verbose
-            self._last_request_data = None
-            self._last_request_data_unquoted = None
-            self._last_request_url = None
-            self._last_response_string = None
-            self._request_count = 0
-            self._server_url = server_url if server_url else SingleSender.default_server_url
+    Sending the same frozen request again skips re-validating, re-building and re-encoding it: its JSON payload is kept
+    here, and its url-encoded form of the payload is kept in the sending session's payload cache.  Frozen requests are
+    equal, and hash alike, when their payloads are equal.
+    """
+    __slots__ = ('payload', '_codec')
+
+    def __init__(self, request, codec=None):
+        """
+        :param request: Request object (or request dict) to freeze
+        :param codec: JSON codec to encode the request with (defaults to json)
+        """
+        codec = codec if codec is not None else get_codec()
+        payload = codec.dumps(request() if callable(request) else request)
+        object.__setattr__(self, 'payload', payload if type(payload) is bytes else payload.encode('utf-8'))
+        object.__setattr__(self, '_codec', codec)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('frozen request is immutable')
+
+    def __call__(self):
+        return self._codec.loads(self.payload)
+
+    def __eq__(self, other):
+        return type(other) is FrozenRequest and other.payload == self.payload
+
+    def __hash__(self):
+        return hash(self.payload)
+
+    def __repr__(self):
+        return 'FrozenRequest(%s)' % self.payload.decode('utf-8', 'replace')
+
+
+class PayloadCache:
+    """
+    Bounded LRU cache of url-encoded request payloads, keyed by their JSON payloads.
+    """
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._fragments = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, payload):
+        with self._lock:
+            fragment = self._fragments.get(payload)
+            if fragment is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._fragments.move_to_end(payload)
+            return fragment
+
+    def put(self, payload, fragment):
+        with self._lock:
+            self._fragments[payload] = fragment
+            self._fragments.move_to_end(payload)
+            while len(self._fragments) > self.max_size:
+                self._fragments.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._fragments),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+
+class FormBatch:
+    """
+    Batch of requests that may know a faster way to form-encode itself than request dict by request dict.
+
+    Subclasses implement request_dicts(), for anything that needs the requests themselves, and may override encode().
+    """
+    __slots__ = ()
+
+    def request_dicts(self):
+        """
+        :return: List of the batch's request dicts
+        """
+        raise NotImplementedError
+
+    def encode(self, form_header, codec):
+        """
+        Encode the batch as a url-encoded form body.
+
+        :param form_header: Form field name
+        :param codec: JSON codec
+        :return: Form body bytes, or None to have the request dicts encoded one by one
+        """
+        return None
+
+    @staticmethod
+    def is_form_safe(strings):
+        """
+        Check that strings need no JSON escaping nor percent-encoding.
+
+        :param strings: Iterable of strings
+        :return: True if every string is made of letters, digits and '_.-~' only
+        """
+        try:
+            return not ''.join(strings).encode('ascii').translate(None, _form_safe_bytes)
+        except (TypeError, UnicodeEncodeError):
+            return False
+
+
+def encode_form(args, form_header, codec=JsonCodec, payload_cache=None):
+    """
+    Encode request args as a url-encoded form body.
+
+    The JSON of all the args is joined into one buffer, separated by NUL bytes (which JSON text never contains), and
+    the buffer is then percent-encoded in bulk: each distinct unsafe byte it contains is replaced throughout in one
+    pass, and the NUL separators become the '&<form_header>=' separators.  The result is the same as that of
+    urllib.parse.urlencode(), without quoting each byte in Python.  The encoded payloads of frozen requests are taken
+    from, or added to, the payload cache, and spliced into the body.
+
+    :param args: Request arg, list of request args, FormBatch or None; callable args are called to get their request
+                 dicts
+    :param form_header: Form field name
+    :param codec: JSON codec
+    :param payload_cache: PayloadCache for the encoded payloads of FrozenRequest args, or None
+    :return: Form body bytes, or None if there are no args
+    """
+    if args is None:
+        return None
+    if isinstance(args, FormBatch):
+        form_data = args.encode(form_header, codec)
+        if form_data is not None:
+            return form_data
+        args = args.request_dicts()
+    elif type(args) is not list:
+        args = [args]
+    if not args:
+        return None
+
+    dumps = codec.dumps
+    arg_jsos = []
+    fragments = None   # Per-arg encoded payloads, once a frozen request turns up.
+    for index, arg in enumerate(args):
+        if type(arg) is FrozenRequest:
+            if fragments is None:
+                fragments = [None] * len(args)
+            fragment = payload_cache.get(arg.payload) if payload_cache is not None else None
+            if fragment is not None:
+                fragments[index] = fragment
+                continue
+            arg_jsos.append(arg.payload)
+        else:
+            arg_jso = dumps(arg() if callable(arg) else arg)
+            arg_jsos.append(arg_jso if type(arg_jso) is bytes else arg_jso.encode('utf-8'))
+
+    form_header = urllib.parse.quote_plus(form_header).encode('ascii')
+    data = _quote_form_bytes(b'\x00'.join(arg_jsos)) if arg_jsos else b''
+    if fragments is None:
+        if len(arg_jsos) > 1:
+            data = data.replace(b'\x00', b'&' + form_header + b'=')
+        return form_header + b'=' + data
+
+    if arg_jsos:
+        encoded_payloads = iter(data.split(b'\x00'))
+        for index, fragment in enumerate(fragments):
+            if fragment is None:
+                fragment = fragments[index] = next(encoded_payloads)
+                if payload_cache is not None and type(args[index]) is FrozenRequest:
+                    payload_cache.put(args[index].payload, fragment)
+    return form_header + b'=' + (b'&' + form_header + b'=').join(fragments)
+
+
+def _quote_form_bytes(data):
+    # Percent-encode data as quote_plus() would, except for NUL bytes, which are left as they are.
+    unsafe_bytes = set(data.translate(None, _form_safe_bytes))
+    if 0x25 in unsafe_bytes:
+        data = data.replace(b'%', b'%25')
+        unsafe_bytes.discard(0x25)
+    unsafe_bytes.discard(0x00)
+    is_spaced = 0x20 in unsafe_bytes
+    unsafe_bytes.discard(0x20)
+    for byte in unsafe_bytes:
+        data = data.replace(bytes((byte,)), _form_escapes[byte])
+    if is_spaced:
+        data = data.replace(b' ', b'+')
+    return data
+
+
+def split_query_keys(api_spec, max_length):
+    """
+    Split a request spec whose repeated 'k' query parameters make it too long into request specs that each fit.
+
+    Each part keeps the spec's other query parameters, and a consecutive run of its keys, so that the reports fetched
+    by the parts are in key order when their reply lists are concatenated.
+
+    :param api_spec: Request path and query
+    :param max_length: Maximum length of each part
+    :return: List of request specs; just api_spec if it fits or has no keys to split
+    """
+    if len(api_spec) <= max_length:
+        return [api_spec]
+    path, _, query = api_spec.partition('?')
+    key_params = []
+    other_params = []
+    for param in query.split('&'):
+        (key_params if param.startswith('k=') else other_params).append(param)
+    if len(key_params) < 2:
+        return [api_spec]
+
+    base_length = len(path) + sum(len(param) + 1 for param in other_params)
+    api_specs = []
+    chunk = []
+    length = base_length
+    for param in key_params:
+        if chunk and length + len(param) + 1 > max_length:
+            api_specs.append('%s?%s' % (path, '&'.join(chunk + other_params)))
+            chunk = []
+            length = base_length
+        chunk.append(param)
+        length += len(param) + 1
+    api_specs.append('%s?%s' % (path, '&'.join(chunk + other_params)))
+    return api_specs
+
+
+def merge_responses(response_dicts):
+    """
+    Merge the responses to the parts of a split request.
+
+    :param response_dicts: Response dicts, in part order
+    :return: The first unsuccessful response if there is one, else the first response with the reply lists of all the
+        responses concatenated
+    """
+    if len(response_dicts) == 1:
+        return response_dicts[0]
+    for response_dict in response_dicts:
+        if not response_dict or response_dict.get('s') != 0 or response_dict.get('r') != 0:
+            return response_dict
+    merged = dict(response_dicts[0])
+    for name, value in merged.items():
+        if isinstance(value, (list, ArrayView)):
+            merged[name] = [item for response_dict in response_dicts for item in response_dict.get(name, [])]
+    return merged
+
+
+def compress_body(data, threshold):
+    """
+    Gzip a request body if it is at least threshold bytes long.
+
+    :param data: Request body bytes, or None
+    :param threshold: Minimum body size to compress, or None to never compress
+    :return: (body bytes, content encoding or None) tuple
+    """
+    if data and threshold is not None and len(data) >= threshold:
+        return gzip.compress(data, compresslevel=6), 'gzip'
+    return data, None
+
+
+def decode_content(data, content_encoding):
+    """
+    Decompress a response body according to its Content-Encoding.
+
+    :param data: Response body bytes
+    :param content_encoding: Content-Encoding header value, or None
+    :return: Decompressed response body bytes
+    """
+    if not content_encoding or content_encoding == 'identity':
+        return data
+    if content_encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(data)
+    if content_encoding == 'deflate':
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    raise http.client.HTTPException('unsupported content encoding: %s' % content_encoding)
+
+
+def decode_content_chunks(chunks, content_encoding, max_chunk_size=65536):
+    """
+    Decompress a response body, read in chunks, according to its Content-Encoding.
+
+    :param chunks: Iterable of response body bytes chunks
+    :param content_encoding: Content-Encoding header value, or None
+    :param max_chunk_size: Maximum size of the decompressed chunks
+    :return: Generator of decompressed response body bytes chunks
+    """
+    if not content_encoding or content_encoding == 'identity':
+        yield from chunks
+        return
+    head = b''
+    if content_encoding in ('gzip', 'x-gzip'):
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif content_encoding == 'deflate':
+        decompressor = None   # Chosen by the first two bytes: zlib-wrapped or raw deflate data.
+    else:
+        raise http.client.HTTPException('unsupported content encoding: %s' % content_encoding)
+    for chunk in chunks:
+        if decompressor is None:
+            head += chunk
+            if len(head) < 2:
+                continue
+            is_wrapped = head[0] & 0x0f == 8 and (head[0] << 8 | head[1]) % 31 == 0
+            decompressor = zlib.decompressobj(zlib.MAX_WBITS if is_wrapped else -zlib.MAX_WBITS)
+            chunk = head
+        data = decompressor.decompress(chunk, max_chunk_size)
+        while True:
+            if data:
+                yield data
+            if not decompressor.unconsumed_tail:
+                break
+            data = decompressor.decompress(decompressor.unconsumed_tail, max_chunk_size)
+    if decompressor is None:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        data = decompressor.decompress(head)
+    else:
+        data = b''
+    data += decompressor.flush()
+    if data:
+        yield data
+
+
+class CompressionStats:
+    """
+    Running totals of request and response body sizes before and after compression.
+    """
+    def __init__(self):
+        self.requests_compressed = 0
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.responses_compressed = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+
+    def record_request(self, data, body, content_encoding):
+        if data:
+            self.request_bytes += len(data)
+            self.request_wire_bytes += len(body)
+            if content_encoding:
+                self.requests_compressed += 1
+
+    def record_response(self, wire_data, data, content_encoding):
+        self.record_response_size(len(wire_data), len(data), content_encoding)
+
+    def record_response_size(self, wire_size, size, content_encoding):
+        self.response_bytes += size
+        self.response_wire_bytes += wire_size
+        if content_encoding and content_encoding != 'identity':
+            self.responses_compressed += 1
+
+    def report(self):
+        return {
+            'requests_compressed': self.requests_compressed,
+            'request_bytes': self.request_bytes,
+            'request_wire_bytes': self.request_wire_bytes,
+            'request_ratio': self.request_bytes / self.request_wire_bytes if self.request_wire_bytes else 1.0,
+            'responses_compressed': self.responses_compressed,
+            'response_bytes': self.response_bytes,
+            'response_wire_bytes': self.response_wire_bytes,
+            'response_ratio': self.response_bytes / self.response_wire_bytes if self.response_wire_bytes else 1.0}
+
+
+class JournalEntry:
+    """
+    Record of one request and its response.  The request body is only unquoted when it is reported.
+    """
+    def __init__(self, number, method, url, request_data, response_data, is_truncated=False):
+        self.number = number
+        self.method = method
+        self.url = url
+        self.request_data = request_data
+        self.response_data = response_data
+        self.is_truncated = is_truncated
+
+    @property
+    def request_data_unquoted(self):
+        return urllib.parse.unquote_plus(self.request_data.decode('utf-8', 'replace')) if self.request_data else None
+
+    @property
+    def response_string(self):
+        return self.response_data.decode('utf-8', 'replace') if self.response_data is not None else None
+
+    def report(self):
+        text = '\n' + 'Request #' + str(self.number) + '\n'
+        text += '|request url : ' + str(self.url) + '\n'
+        text += '|request body: ' + str(self.request_data_unquoted) + '\n'
+        text += '|response    : ' + str(self.response_string)
+        if self.is_truncated:
+            text += '\n|(truncated)'
+        return text
+
+
+class RequestJournal:
+    """
+    Bounded ring buffer of the most recent requests made by a sender.
+
+    Request and response bodies longer than max_body_size bytes are truncated before they are kept.
+    """
+    def __init__(self, size=16, max_body_size=65536):
+        self._entries = collections.deque(maxlen=size)
+        self.max_body_size = max_body_size
+
+    def record(self, number, method, url, request_data, response_data):
+        max_body_size = self.max_body_size
+        is_truncated = False
+        if max_body_size is not None:
+            if request_data and len(request_data) > max_body_size:
+                request_data = request_data[:max_body_size]
+                is_truncated = True
+            if response_data and len(response_data) > max_body_size:
+                response_data = response_data[:max_body_size]
+                is_truncated = True
+        self._entries.append(JournalEntry(number, method, url, request_data, response_data, is_truncated))
+
+    def last(self):
+        try:
+            return self._entries[-1]
+        except IndexError:
+            return None
+
+    def entries(self):
+        return list(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class TrafficRecorder:
+    """
+    Append-only recording of the requests a sender makes and the responses it gets, for replay by replay_traffic().
+
+    Each exchange is written as one line of JSON holding its start time, method, API spec, request body, response
+    status, response body, latency and error.  A request that failed or timed out without a response is recorded with
+    no status or response body, and the error it failed with.  Files whose names end in '.gz' are gzip-compressed.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = gzip.open(path, 'at', encoding='utf-8') if path.endswith('.gz') else \
+            open(path, 'a', encoding='utf-8')
+        self._record_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def record_count(self):
+        return self._record_count
+
+    def record(self, timestamp, method, api_spec, request_data, status, response_data, latency, error=None):
+        line = json.dumps({
+            't': timestamp,
+            'm': method,
+            'a': api_spec,
+            'b': request_data.decode('utf-8') if request_data else None,
+            's': status,
+            'r': response_data.decode('utf-8', 'replace') if response_data is not None else None,
+            'l': round(latency, 6),
+            'e': error}, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+            self._record_count += 1
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when a request is attempted after the deadline set by request_deadline() has passed.
+    """
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised when a request is refused because the sender's circuit breaker is open.
+    """
+
+
+_deadline = contextvars.ContextVar('taranoscsfpapi_deadline', default=None)
+
+
+@contextlib.contextmanager
+def request_deadline(timeout):
+    """
+    Limit the total time taken by the requests made within a block, including their retries.
+
+    The deadline applies to every request made in the block, including those made by fan_out() on other threads or
+    tasks; a nested deadline can only shorten the enclosing one.
+
+    :param timeout: Seconds from now until the deadline
+    :return: Deadline, in time.monotonic() seconds
+    """
+    deadline = time.monotonic() + timeout
+    enclosing_deadline = _deadline.get()
+    if enclosing_deadline is not None and enclosing_deadline < deadline:
+        deadline = enclosing_deadline
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline():
+    """
+    Get the current deadline, as set by request_deadline().
+
+    :return: Deadline, in time.monotonic() seconds, or None if there is no deadline
+    """
+    return _deadline.get()
+
+
+def deadline_remaining():
+    """
+    Get the time left until the current deadline.
+
+    :return: Seconds until the deadline, or None if there is no deadline
+    """
+    deadline = _deadline.get()
+    return deadline - time.monotonic() if deadline is not None else None
+
+
+def deadline_timeout(timeout):
+    """
+    Clamp a request timeout to the current deadline.
+
+    :param timeout: Request timeout in seconds, or None for no timeout
+    :return: Timeout in seconds, or None for no timeout
+    :raise DeadlineExceeded: If the current deadline has passed
+    """
+    remaining = deadline_remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded('request deadline exceeded')
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class InflightGets:
+    """
+    Table of the GET requests a session has in flight, through which concurrent identical GET requests share one
+    request.
+
+    While a session's inflight_gets is set, a GET request for the same path and query as one already in flight is not
+    sent: its caller waits for the request in flight and gets the same response dict, which must therefore not be
+    modified.  Waiting callers stay bound by their own request deadlines.  A PUT, POST or DELETE request sent through
+    the session detaches the requests then in flight, so that later GET requests are not answered with responses
+    requested before it.
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.shared = 0
+
+    def call(self, api_spec, fetch):
+        """
+        Get a response, sharing the request in flight for the same request spec if there is one.
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :param fetch: Function sending the request, returning its response dict
+        :return: Response dict
+        """
+        timeout = deadline_timeout(None)
+        with self._lock:
+            future = self._flights.get(api_spec)
+            if future is None:
+                flight = self._flights[api_spec] = concurrent.futures.Future()
+                self.sent += 1
+            else:
+                self.shared += 1
+        if future is not None:
+            if not concurrent.futures.wait((future,), timeout).done:
+                raise DeadlineExceeded('request deadline exceeded')
+            return future.result()
+        try:
+            response_dict = fetch()
+        except BaseException as exc:
+            self._land(api_spec, flight)
+            flight.set_exception(exc)
+            raise
+        self._land(api_spec, flight)
+        flight.set_result(response_dict)
+        return response_dict
+
+    def _land(self, api_spec, flight):
+        with self._lock:
+            if self._flights.get(api_spec) is flight:
+                del self._flights[api_spec]
+
+    def detach(self):
+        """
+        Stop sharing the requests now in flight with later callers.
+        """
+        with self._lock:
+            self._flights.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'sent': self.sent,
+                'shared': self.shared,
+                'in_flight': len(self._flights)}
+
+
+class RetryPolicy:
+    """
+    Exponential backoff policy for retrying idempotent requests.
+
+    Only requests whose method is in methods are retried, by default only GET reports.  PUT updates set absolute
+    values and could safely be sent twice, but calls are PUT too, and a call's macro (e.g. a field emitter's
+    create_channel) could then be run twice; so, as with ConnectionPool's resending, PUT is only retried if added to
+    methods by a caller sending no calls.  POST constructors are never to be retried, as they could create an
+    element twice.  A request is retried when it fails to reach the server, times out, or gets one of the given HTTP
+    statuses back, for up to max_attempts attempts in all.
+    """
+    def __init__(self,
+                 max_attempts=3,
+                 backoff=0.05,
+                 max_backoff=1.0,
+                 methods=('GET',),
+                 statuses=(502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = methods
+        self.statuses = statuses
+
+    def next_delay(self, method, attempt):
+        """
+        Decide whether to retry a failed request.
+
+        :param method: HTTP method
+        :param attempt: Number of attempts made so far
+        :return: Seconds to wait before retrying, or None if the request is not to be retried
+        """
+        if method not in self.methods or attempt >= self.max_attempts:
+            return None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+        remaining = deadline_remaining()
+        if remaining is not None and remaining <= delay:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while their server is unhealthy.
+
+    After failure_threshold consecutive failed requests the circuit opens, and requests are refused with
+    CircuitOpenError without being sent.  Once reset_timeout seconds have passed a single trial request is let
+    through: if it succeeds the circuit closes again, otherwise it reopens.  A trial request abandoned without an
+    outcome (cancelled or interrupted) lets the next request through as the trial instead.
+    """
+
+    closed = 'closed'
+    open = 'open'
+    half_open = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=5.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitBreaker.closed
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._is_trial_pending = False
+        self._opened_count = 0
+        self._rejected_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        return self._state
+
+    def before_request(self):
+        """
+        Check that a request may be sent.
+
+        :raise CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.closed:
+                return
+            if self._state == CircuitBreaker.open and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = CircuitBreaker.half_open
+            if self._state == CircuitBreaker.half_open and not self._is_trial_pending:
+                self._is_trial_pending = True
+                return
+            self._rejected_count += 1
+        raise CircuitOpenError('circuit open: server unavailable')
+
+    def record_success(self):
+        with self._lock:
+            self._failure_count = 0
+            self._state = CircuitBreaker.closed
+            self._is_trial_pending = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failure_count += 1
+            if self._state == CircuitBreaker.half_open or self._failure_count >= self.failure_threshold:
+                if self._state != CircuitBreaker.open:
+                    self._opened_count += 1
+                self._state = CircuitBreaker.open
+                self._opened_at = time.monotonic()
+                self._is_trial_pending = False
+
+    def abandon_request(self):
+        """
+        Give up on a request let through by before_request() that neither succeeded nor failed.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.half_open:
+                self._is_trial_pending = False
+
+    def reset(self):
+        """
+        Close the circuit, forgetting any failures.
+        """
+        self.record_success()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failure_count,
+                'opened': self._opened_count,
+                'rejected': self._rejected_count}
+
+
+class RequestStats:
+    """
+    Running totals of request attempts, retries and failures.
+    """
+    def __init__(self):
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.deadlines_exceeded = 0
+
+    def report(self):
+        return {
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'deadlines_exceeded': self.deadlines_exceeded}
+
+
+class Transport:
+    """
+    Means by which a session sends requests to a Taranos Server.
+
+    Subclasses implement request(), and may read responses incrementally in stream(), report statistics in stats()
+    and release resources in close().
+    """
+    stream_chunk_size = 65536   # Maximum size of the response body chunks read by stream().
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        """
+        Send a request.
 
-        def report_last_request(self):
-            text = '\n' + 'Request #' + str(self._request_count) + '\n'
-            text += '|request url : ' + str(self._last_request_url) + '\n'
-            text += '|request body: ' + str(self._last_request_data_unquoted) + '\n'
-            text += '|response    : ' + str(self._last_response_string)
-            return text
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :param timeout: Timeout in seconds, or None for no timeout
+        :return: (status, reason, response headers, response body bytes) tuple
+        """
+        raise NotImplementedError
 
-        def request(self, request):
-            response_dict = {}
+    def stream(self, method, path, body=None, headers=None, timeout=None):
+        """
+        Send a request, and read the response body incrementally.
+
+        Transports that cannot read incrementally read the whole body, and hand it on as a single chunk.
+
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :param timeout: Timeout in seconds, or None for no timeout
+        :return: (status, reason, response headers, ResponseChunks) tuple
+        """
+        status, reason, response_headers, data = self.request(method, path, body, headers, timeout)
+        return status, reason, response_headers, ResponseChunks(io.BytesIO(data), len(data) or 1)
+
+    def close(self):
+        pass
+
+    def stats(self):
+        return {}
+
+
+class ResponseChunks:
+    """
+    Iterator over the chunks of a response body as they are read.  The response is closed, and whatever it was read
+    from released, once the body has been read or when the iterator is closed; the iterator must be read to the end
+    or closed.
+    """
+    __slots__ = ('size', '_response', '_chunk_size', '_release')
+
+    def __init__(self, response, chunk_size, release=None):
+        """
+        :param response: Object with read1() and close() methods, reading the response body
+        :param chunk_size: Maximum chunk size
+        :param release: Function called with whether the whole body was read once reading stops, or None
+        """
+        self.size = 0   # Bytes read so far.
+        self._response = response
+        self._chunk_size = chunk_size
+        self._release = release
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._response is None:
+            raise StopIteration
+        try:
+            chunk = self._response.read1(self._chunk_size)
+        except BaseException:
+            self._finish(False)
+            raise
+        if not chunk:
+            self._finish(True)
+            raise StopIteration
+        self.size += len(chunk)
+        return chunk
+
+    def close(self):
+        if self._response is not None:
+            self._finish(False)
+
+    def _finish(self, is_complete):
+        response = self._response
+        self._response = None
+        response.close()
+        if self._release is not None:
+            self._release(is_complete)
+
+
+class UrllibTransport(Transport):
+    """
+    Transport that makes each request over a new connection with urllib.
+    """
+    def __init__(self, server_url):
+        self._server_url = server_url.rstrip('/')
+        self._request_count = 0
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        self._request_count += 1
+        request = urllib.request.Request(self._server_url + '/' + path, body, headers or {}, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status, response.reason, response.headers, response.read()
+        except urllib.error.HTTPError as exc:
+            with exc:
+                return exc.code, exc.reason, exc.headers, exc.read()
+        except urllib.error.URLError as exc:
+            if isinstance(exc.reason, OSError):
+                raise exc.reason
+            raise
+
+    def stream(self, method, path, body=None, headers=None, timeout=None):
+        self._request_count += 1
+        request = urllib.request.Request(self._server_url + '/' + path, body, headers or {}, method=method)
+        try:
+            response = urllib.request.urlopen(request, timeout=timeout)
+        except urllib.error.HTTPError as exc:
+            with exc:
+                data = exc.read()
+            return exc.code, exc.reason, exc.headers, ResponseChunks(io.BytesIO(data), len(data) or 1)
+        except urllib.error.URLError as exc:
+            if isinstance(exc.reason, OSError):
+                raise exc.reason
+            raise
+        return (response.status, response.reason, response.headers,
+                ResponseChunks(response, self.stream_chunk_size))
+
+    def stats(self):
+        return {'requests': self._request_count}
+
+
+class LoopbackTransport(Transport):
+    """
+    Transport that hands requests straight to a Python callable, such as a stand-in Taranos Server, without touching
+    the network.
+
+    The handler is called with the method, path and (decompressed) body bytes of each request, and returns either the
+    response dict or the response body bytes, or a (status, response) tuple.
+    """
+    def __init__(self, handler, codec=JsonCodec):
+        self._handler = handler
+        self._codec = codec
+        self._request_count = 0
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        self._request_count += 1
+        content_encoding = headers.get('Content-Encoding') if headers else None
+        if body and content_encoding:
+            body = decode_content(body, content_encoding)
+        response = self._handler(method, path, body)
+        status = 200
+        if type(response) is tuple:
+            status, response = response
+        if not isinstance(response, (str, bytes)):
+            response = self._codec.dumps(response)
+        if isinstance(response, str):
+            response = response.encode('utf-8')
+        return status, http.client.responses.get(status, ''), {}, response
+
+    def stats(self):
+        return {'requests': self._request_count}
+
+
+class ConnectionPool(Transport):
+    """
+    Transport over a bounded pool of persistent HTTP/1.1 connections to a single server.
+
+    At most max_size idle connections are kept for reuse; connections idle for longer than idle_timeout seconds are
+    evicted.  A request sent over a reused connection that turns out to have been dropped by the server is retried
+    over a fresh connection if it could not be written, or if its method is idempotent; once a POST or PUT has been
+    written the server may have acted on it, so the error is raised instead of sending the request twice.
+    """
+
+    _idempotent_methods = ('GET', 'HEAD', 'DELETE')
+
+    _broken_connection_errors = (http.client.RemoteDisconnected,
+                                 http.client.CannotSendRequest,
+                                 http.client.BadStatusLine,
+                                 BrokenPipeError,
+                                 ConnectionAbortedError,
+                                 ConnectionResetError)
+
+    def __init__(self, server_url, max_size=4, idle_timeout=30.0):
+        url_parts = urllib.parse.urlsplit(server_url)
+        self._is_secure = url_parts.scheme == 'https'
+        self._host = url_parts.hostname
+        self._port = url_parts.port
+        self._path_prefix = url_parts.path.rstrip('/')
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle = collections.deque()
+        self._lock = threading.Lock()
+        self._created_count = 0
+        self._reused_count = 0
+        self._evicted_count = 0
+        self._reconnect_count = 0
+        self._discarded_count = 0
+        self._active_count = 0
+
+    def _connect(self, timeout):
+        if self._is_secure:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _acquire(self, timeout):
+        with self._lock:
+            now = time.monotonic()
+            while self._idle and now - self._idle[0][1] > self._idle_timeout:
+                connection, _ = self._idle.popleft()
+                connection.close()
+                self._evicted_count += 1
+            self._active_count += 1
+            if self._idle:
+                self._reused_count += 1
+                connection = self._idle.pop()[0]
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+            self._created_count += 1
+        return self._connect(timeout), False
+
+    def _release(self, connection, is_reusable):
+        with self._lock:
+            self._active_count -= 1
+            if is_reusable and len(self._idle) < self._max_size:
+                self._idle.append((connection, time.monotonic()))
+                return
+            if is_reusable:
+                self._discarded_count += 1
+        connection.close()
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        """
+        Send a request over a pooled connection.
+
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :param timeout: Socket timeout in seconds, or None for no timeout
+        :return: (status, reason, response headers, response body bytes) tuple
+        """
+        while True:
+            connection, is_reused = self._acquire(timeout)
+            is_sent = False
             try:
-                self._request_count += 1
+                connection.request(method, self._path_prefix + '/' + path, body, headers or {})
+                is_sent = True
+                response = connection.getresponse()
+                data = response.read()
+            except self._broken_connection_errors:
+                self._release(connection, False)
+                if is_reused and (not is_sent or method in self._idempotent_methods):
+                    with self._lock:
+                        self._reconnect_count += 1
+                    continue
+                raise
+            except BaseException:
+                self._release(connection, False)
+                raise
+            self._release(connection, not response.will_close)
+            return response.status, response.reason, response.headers, data
+
+    def stream(self, method, path, body=None, headers=None, timeout=None):
+        """
+        Send a request over a pooled connection, and read the response body incrementally.  The connection is
+        returned to the pool once the body has been read, and closed if the chunks iterator is closed first.
+
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :param timeout: Socket timeout in seconds, or None for no timeout
+        :return: (status, reason, response headers, ResponseChunks) tuple
+        """
+        while True:
+            connection, is_reused = self._acquire(timeout)
+            is_sent = False
+            try:
+                connection.request(method, self._path_prefix + '/' + path, body, headers or {})
+                is_sent = True
+                response = connection.getresponse()
+            except self._broken_connection_errors:
+                self._release(connection, False)
+                if is_reused and (not is_sent or method in self._idempotent_methods):
+                    with self._lock:
+                        self._reconnect_count += 1
+                    continue
+                raise
+            except BaseException:
+                self._release(connection, False)
+                raise
+
+            def release(is_complete, connection=connection, response=response):
+                self._release(connection, is_complete and not response.will_close)
+
+            return (response.status, response.reason, response.headers,
+                    ResponseChunks(response, self.stream_chunk_size, release))
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                self._idle.popleft()[0].close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'active': self._active_count,
+                'idle': len(self._idle),
+                'created': self._created_count,
+                'reused': self._reused_count,
+                'evicted': self._evicted_count,
+                'reconnected': self._reconnect_count,
+                'discarded': self._discarded_count}
+
+
+class PipelinedTransport(Transport):
+    """
+    Transport that pipelines HTTP/1.1 requests over a single persistent connection.
+
+    Requests are written to the connection as soon as they are made, without waiting for the responses to earlier
+    requests, as long as fewer than window requests are awaiting responses; a reader thread matches responses to
+    requests in order.  Requests from many threads (such as those made by fan_out()) share the connection, and
+    submit() lets one thread have many requests in flight.  If the connection fails, or a request times out awaiting
+    its response (which the requests behind it on the connection would have to wait for too), every request awaiting
+    a response fails with it, and the next request opens a new connection.
+    """
+    def __init__(self, server_url, window=32):
+        url_parts = urllib.parse.urlsplit(server_url)
+        self._is_secure = url_parts.scheme == 'https'
+        self._host = url_parts.hostname
+        self._port = url_parts.port if url_parts.port else (443 if self._is_secure else 80)
+        self._host_header = url_parts.netloc
+        self._path_prefix = url_parts.path.rstrip('/')
+        self._window = threading.BoundedSemaphore(window)
+        self._write_lock = threading.Lock()
+        self._connection = None
+        self._connection_count = 0
+        self._request_count = 0
+        self._max_in_flight = 0
+
+    def _connect(self, timeout):
+        sock = socket.create_connection((self._host, self._port), timeout)
+        sock.settimeout(None)   # The reader thread waits for responses for as long as any request does.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._is_secure:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self._host)
+        connection = (sock, collections.deque())
+        threading.Thread(target=self._read_responses, args=(connection,), daemon=True).start()
+        self._connection_count += 1
+        return connection
+
+    def _fail(self, connection, exc):
+        sock, pending = connection
+        with self._write_lock:
+            if self._connection is connection:
+                self._connection = None
+            waiters = list(pending)
+            pending.clear()
+        sock.close()
+        for future, _ in waiters:
+            future.set_exception(exc)
+            self._window.release()
+
+    def _read_responses(self, connection):
+        sock, pending = connection
+        file = sock.makefile('rb')
+        try:
+            while True:
+                status_line = file.readline()
+                if not status_line:
+                    raise ConnectionResetError('connection closed by server')
+                version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+                response_headers = {}
+                while True:
+                    line = file.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    response_headers[name.strip().lower()] = value.strip()
+                with self._write_lock:
+                    future, method = pending.popleft()
+
+                status = int(status)
+                connection_header = response_headers.get('connection', '').lower()
+                will_close = (connection_header == 'close' or
+                              (version == 'HTTP/1.0' and connection_header != 'keep-alive'))
+                if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+                    data = b''
+                elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+                    chunks = []
+                    while True:
+                        size = int(file.readline().split(b';', 1)[0], 16)
+                        if size == 0:
+                            while file.readline() not in (b'\r\n', b'\n', b''):
+                                pass
+                            break
+                        chunks.append(file.read(size))
+                        file.read(2)
+                    data = b''.join(chunks)
+                elif 'content-length' in response_headers:
+                    data = file.read(int(response_headers['content-length']))
+                else:
+                    data = file.read()
+                    will_close = True
+                future.set_result((status, reason, response_headers, data))
+                self._window.release()
+                if will_close:
+                    raise ConnectionResetError('connection closed by server')
+        except (OSError, ValueError, IndexError) as exc:
+            self._fail(connection, exc)
+        finally:
+            file.close()
+
+    def submit(self, method, path, body=None, headers=None, timeout=None):
+        """
+        Send a request without waiting for its response.
+
+        :param method: HTTP method
+        :param path: Request path (and query) relative to the server URL
+        :param body: Request body bytes
+        :param headers: Request headers dict
+        :param timeout: Seconds to wait for room in the window and for connecting, or None to wait indefinitely
+        :return: Future of the (status, reason, response headers, response body bytes) tuple
+        :raise TimeoutError: If the window stays full, or connecting takes, longer than the timeout
+        """
+        return self._submit(method, path, body, headers, timeout)[0]
+
+    def _submit(self, method, path, body, headers, timeout):
+        head = ['%s %s HTTP/1.1' % (method, self._path_prefix + '/' + path),
+                'Host: %s' % self._host_header,
+                'Content-Length: %d' % (len(body) if body else 0)]
+        if headers:
+            head += ['%s: %s' % (name, value) for name, value in headers.items()]
+        data = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1')
+        if body:
+            data += body
+
+        future = concurrent.futures.Future()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        if not self._window.acquire(timeout=timeout):
+            raise TimeoutError('pipelined request window full')
+        with self._write_lock:
+            if self._connection is None:
+                try:
+                    self._connection = self._connect(max(deadline - time.monotonic(), 0.001) if deadline else None)
+                except BaseException:
+                    self._window.release()
+                    raise
+            connection = self._connection
+            connection[1].append((future, method))
+            self._request_count += 1
+            self._max_in_flight = max(self._max_in_flight, len(connection[1]))
+            try:
+                connection[0].sendall(data)
+                send_error = None
+            except OSError as exc:
+                send_error = exc
+        if send_error is not None:
+            self._fail(connection, send_error)
+        return future, connection, deadline
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        future, connection, deadline = self._submit(method, path, body, headers, timeout)
+        try:
+            return future.result(max(deadline - time.monotonic(), 0) if deadline else None)
+        except concurrent.futures.TimeoutError:
+            if future.done():
+                return future.result()
+            # The requests behind this one are stuck behind its response too; free their slots on a new connection:
+            self._fail(connection, TimeoutError('pipelined request timed out'))
+            raise TimeoutError('pipelined request timed out') from None
+
+    def close(self):
+        with self._write_lock:
+            connection = self._connection
+        if connection is not None:
+            self._fail(connection, ConnectionAbortedError('transport closed'))
+
+    def stats(self):
+        with self._write_lock:
+            in_flight = len(self._connection[1]) if self._connection is not None else 0
+        return {
+            'requests': self._request_count,
+            'connections': self._connection_count,
+            'in_flight': in_flight,
+            'max_in_flight': self._max_in_flight}
+
+
+class OutgoingRequest:
+    """
+    Request on its way to the server, as prepared by BaseSession for sending.
+    """
+
+    __slots__ = ('number', 'server_url', 'method', 'api_spec', 'data', 'body', 'body_encoding', 'headers',
+                 'started_at', 'started_counter')
+
+    def __init__(self, number, server_url, method, api_spec, data, body, body_encoding, headers):
+        self.number = number
+        self.server_url = server_url
+        self.method = method
+        self.api_spec = api_spec
+        self.data = data
+        self.body = body
+        self.body_encoding = body_encoding
+        self.headers = headers
+        self.started_at = time.time()
+        self.started_counter = time.perf_counter()
+
+
+class BaseSession:
+    """
+    Request building, retry bookkeeping and response handling shared by Session and AsyncSender, which only differ in
+    how they send requests and wait for them.
+    """
+
+    _retried_errors = (OSError, http.client.HTTPException)   # Failures that the retry policy may retry.
+    _timeout_errors = (TimeoutError,)                          # Failures counted as timeouts, and raised.
+
+    def __init__(self, server_url=None, is_verbose=False):
+        self.fk = None   # Default field key.
+        self.tk = None   # Default trunk key.
+        self._is_verbose = is_verbose
+        self._request_count = 0
+        self._server_url = server_url
+        self._lock = threading.Lock()
+        self._fixed_transport = None
+        self._compression_stats = CompressionStats()
+        self.accept_encoding = SingleSender.default_accept_encoding
+        self.compress_threshold = SingleSender.default_compress_threshold
+        self.codec = get_codec(SingleSender.default_codec_name)
+        self.journal = None   # Set to a RequestJournal to keep the most recent requests.
+        self.recorder = None  # Set to a TrafficRecorder to record all requests.
+        self.report_cache = None   # Set to a ReportCache to answer repeated report requests from memory.
+        self.inflight_gets = None   # Set to an InflightGets to have concurrent identical GET requests share one.
+        self.payload_cache = PayloadCache(SingleSender.default_payload_cache_size)
+        self.max_url_length = SingleSender.default_max_url_length
+        self.query_concurrency = SingleSender.default_query_concurrency
+        self.lazy_responses = False   # Set to True to answer GET requests with lazy response views.
+        self.timeout = SingleSender.default_timeout
+        self.retry_policy = RetryPolicy()   # Set to None to never retry.
+        self.breaker = CircuitBreaker()
+        self._request_stats = RequestStats()
+
+    @property
+    def server_url(self):
+        return self._server_url
+
+    @property
+    def request_count(self):
+        return self._request_count
 
-                response = urllib.request.urlopen(request)
+    def enable_journal(self, size=16, max_body_size=65536):
+        """
+        Start keeping the most recent requests in a ring buffer journal.
 
-                self._last_request_url = request.full_url
-                self._last_request_data = request.data
-                self._last_request_data_unquoted = \
-                    urllib.parse.unquote_plus(request.data.decode('utf-8')) if request.data else None
+        :param size: Number of requests to keep
+        :param max_body_size: Maximum number of request/response body bytes to keep per request
+        :return: Journal
+        """
+        self.journal = RequestJournal(size, max_body_size)
+        return self.journal
 
-                response_string = response.read().decode('utf-8')
-                self._last_response_string = response_string
-                response_dict = json.loads(response_string)
+    def start_recording(self, path):
+        """
+        Start appending every request and its response to a traffic recording file.
 
-                if self._is_verbose:
-                    print(self.report_last_request())
+        :param path: Path of the recording file; names ending in '.gz' are gzip-compressed
+        :return: Recorder
+        """
+        self.stop_recording()
+        self.recorder = TrafficRecorder(path)
+        return self.recorder
 
+    def stop_recording(self):
+        """
+        Stop recording requests, and close the recording file.
+        """
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def report_last_request(self):
+        entry = self.journal.last() if self.journal is not None else None
+        if entry is None:
+            entry = JournalEntry(self._request_count, None, None, None, None)
+        return entry.report()
+
+    def transport_stats(self):
+        raise NotImplementedError
+
+    def stats(self):
+        """
+        Report session statistics.
+
+        :return: Dict of request count, retry, circuit breaker, transport, compression, payload cache, report cache and
+            in-flight GET request stats
+        """
+        with self._lock:
+            request_stats = self._request_stats.report()
+            compression_stats = self._compression_stats.report()
+        return {
+            'requests': self._request_count,
+            'retries': request_stats,
+            'breaker': self.breaker.stats(),
+            'transports': self.transport_stats(),
+            'compression': compression_stats,
+            'payloads': self.payload_cache.stats(),
+            'reports': self.report_cache.stats() if self.report_cache is not None else None,
+            'inflight': self.inflight_gets.stats() if self.inflight_gets is not None else None}
+
+    def split_query(self, api_spec):
+        """
+        Split a GET request whose URL would be longer than max_url_length into requests for consecutive runs of its
+        keys.
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :return: List of request specs
+        """
+        if not self.max_url_length:
+            return [api_spec]
+        return split_query_keys(api_spec, self.max_url_length - len(self.server_url) - 1)
+
+    def _begin_attempt(self, timeout):
+        """
+        Start an attempt at sending a request, once the circuit breaker lets it through.
+
+        :param timeout: Timeout for the attempt in seconds
+        :return: Timeout for the attempt, shortened to the current deadline
+        """
+        stats = self._request_stats
+        try:
+            call_timeout = deadline_timeout(timeout)
+        except DeadlineExceeded:
+            with self._lock:
+                stats.deadlines_exceeded += 1
+            raise
+        self.breaker.before_request()
+        with self._lock:
+            stats.attempts += 1
+        return call_timeout
+
+    def _error_retry_delay(self, method, attempt, exc):
+        """
+        Account for an attempt that failed with an error.
+
+        :return: Seconds to wait before retrying, or None if the error is to be raised
+        """
+        stats = self._request_stats
+        self.breaker.record_failure()
+        with self._lock:
+            stats.failures += 1
+            if isinstance(exc, self._timeout_errors):
+                stats.timeouts += 1
+        if not isinstance(exc, self._retried_errors) or not self.retry_policy:
+            return None
+        delay = self.retry_policy.next_delay(method, attempt)
+        if delay is not None:
+            with self._lock:
+                stats.retries += 1
+        return delay
+
+    def _status_retry_delay(self, method, attempt, status):
+        """
+        Account for an attempt that got a response.
+
+        :return: Seconds to wait before retrying, or None if the response is to be returned
+        """
+        if status < 500:
+            self.breaker.record_success()
+            return None
+        stats = self._request_stats
+        self.breaker.record_failure()
+        with self._lock:
+            stats.failures += 1
+        if not self.retry_policy or status not in self.retry_policy.statuses:
+            return None
+        delay = self.retry_policy.next_delay(method, attempt)
+        if delay is not None:
+            with self._lock:
+                stats.retries += 1
+        return delay
+
+    def _begin_request(self, method, api_spec, data):
+        """
+        Number a request, and build its headers and (compressed) body.
+
+        :return: OutgoingRequest
+        """
+        with self._lock:
+            self._request_count += 1
+            request_number = self._request_count
+        headers = {}
+        if self.accept_encoding:
+            headers['Accept-Encoding'] = self.accept_encoding
+        body, body_encoding = compress_body(data, self.compress_threshold)
+        if data:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            if body_encoding:
+                headers['Content-Encoding'] = body_encoding
+        return OutgoingRequest(request_number, self.server_url, method, api_spec, data, body, body_encoding, headers)
+
+    def _record(self, request, status, response_data, exc=None):
+        """
+        Record a request, if a recorder is set, with its response or the error it failed with.
+        """
+        recorder = self.recorder
+        if recorder is not None:
+            error = None
+            if exc is not None:
+                error = '%s: %s' % (type(exc).__name__, exc) if str(exc) else type(exc).__name__
+            recorder.record(request.started_at, request.method, request.api_spec, request.data, status, response_data,
+                            time.perf_counter() - request.started_counter, error)
+
+    def _end_request(self, request, status, reason, response_headers, wire_data):
+        """
+        Record, journal and decode the response to a request.
+
+        :return: Response dict
+        :raise http.client.HTTPException: If the server answered with an error status
+        """
+        content_encoding = response_headers.get('content-encoding')
+        response_data = decode_content(wire_data, content_encoding)
+        with self._lock:
+            self._compression_stats.record_request(request.data, request.body, request.body_encoding)
+            self._compression_stats.record_response(wire_data, response_data, content_encoding)
+
+        self._record(request, status, response_data)
+
+        journal = self.journal
+        if journal is not None or self._is_verbose:
+            url = '%s/%s' % (request.server_url, request.api_spec)
+            if journal is not None:
+                journal.record(request.number, request.method, url, request.data, response_data)
+            if self._is_verbose:
+                print(JournalEntry(request.number, request.method, url, request.data, response_data).report())
+
+        if status >= 400:
+            raise http.client.HTTPException('HTTP Error %d: %s' % (status, reason))
+
+        if self.lazy_responses and request.method == 'GET':
+            return load_view(response_data, self.codec)
+        return self.codec.loads(response_data)
+
+    def _encode_put(self, args, form_header):
+        return encode_form(args, form_header, self.codec, self.payload_cache)
+
+    def _end_put(self, api_spec, method, args):
+        if self.inflight_gets is not None:
+            self.inflight_gets.detach()
+        if self.report_cache is not None:
+            self.report_cache.invalidate(api_spec, method, args)
+
+
+class Session(BaseSession):
+    """
+    Connection to a Taranos Server.
+
+    Each session has its own server URL, transport, default field and trunk keys and request counters, and may be used
+    from many threads at once.  API functions use the default session unless passed one explicitly.
+
+    Requests are sent over a pooled transport per server unless transport_name is set to 'pipelined' or 'urllib', or
+    another transport (such as a LoopbackTransport) is installed with use_transport().
+    """
+
+    def __init__(self, server_url=None, is_verbose=False):
+        super().__init__(server_url if server_url else SingleSender.default_server_url, is_verbose)
+        self._transports = {}
+        self.transport_name = SingleSender.default_transport_name
+        self.pool_max_size = SingleSender.default_pool_max_size
+        self.pipeline_window = SingleSender.default_pipeline_window
+        self.pool_idle_timeout = SingleSender.default_pool_idle_timeout
+        self.coalescer = None  # Set to a Coalescer to batch singular update and call requests.
+
+    def configure(self, server_url=None, is_verbose=False):
+        with self._lock:
+            self._server_url = server_url if server_url else SingleSender.default_server_url
+            self._is_verbose = is_verbose
+
+    def use_transport(self, transport):
+        """
+        Send all requests through the given transport, whatever the server URL.
+
+        :param transport: Transport, or None to go back to a transport per server
+        """
+        with self._lock:
+            self._fixed_transport = transport
+
+    def _create_transport(self, server_url):
+        if self.transport_name == 'pooled':
+            return ConnectionPool(server_url, self.pool_max_size, self.pool_idle_timeout)
+        if self.transport_name == 'pipelined':
+            return PipelinedTransport(server_url, self.pipeline_window)
+        if self.transport_name == 'urllib':
+            return UrllibTransport(server_url)
+        raise ValueError('unknown transport: %s' % self.transport_name)
+
+    def transport(self, server_url=None):
+        """
+        Get the transport for a server, creating it on first use.
+
+        :param server_url: URL of the Taranos Server (defaults to the session's server URL)
+        :return: Transport
+        """
+        if self._fixed_transport is not None:
+            return self._fixed_transport
+        if not server_url:
+            server_url = self._server_url
+        with self._lock:
+            transport = self._transports.get(server_url)
+            if transport is None:
+                transport = self._create_transport(server_url)
+                self._transports[server_url] = transport
+            return transport
+
+    def transport_stats(self):
+        """
+        Report transport statistics.
+
+        :return: Dict of transport stats dicts keyed by server URL ('fixed' for a transport set by use_transport())
+        """
+        with self._lock:
+            transports = dict(self._transports)
+            if self._fixed_transport is not None:
+                transports = {'fixed': self._fixed_transport}
+        return {server_url: transport.stats() for server_url, transport in transports.items()}
+
+    def close(self):
+        """
+        Close all transports, and their pooled connections.
+        """
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            transport.close()
+
+    def _send(self, server_url, method, api_spec, body, headers, timeout, is_stream=False):
+        """
+        Send a request through the circuit breaker, retrying it as the retry policy allows.
+
+        :return: (status, reason, response headers, response body bytes) tuple; with ResponseChunks in place of the
+            body bytes if is_stream
+        """
+        attempt = 0
+        while True:
+            call_timeout = self._begin_attempt(timeout)
+            attempt += 1
+            try:
+                transport = self.transport(server_url)
+                if is_stream:
+                    result = transport.stream(method, api_spec, body, headers, call_timeout)
+                else:
+                    result = transport.request(method, api_spec, body, headers, call_timeout)
             except Exception as exc:
-                print(exc)
-            return response_dict
-        
-        def get(self, api_spec):
-            url = '%s/%s' % (self._server_url, api_spec)
-
-            request = urllib.request.Request(url)
-            return self.request(request)
-
-        def put(self, args, form_header, api_spec, method='PUT'):
-            if args is None:
-                args = []
-            elif type(args) is not list:
-                args = [args]
-
-            form_list = []
-            for arg in args:
-                arg_jso = json.dumps(arg() if callable(arg) else arg)
-                form_list.append((form_header, arg_jso))
-
-            form_data = None
-            if form_list:
-                form_data = urllib.parse.urlencode(form_list)
-            url = '%s/%s' % (self._server_url, api_spec)
-
-            if form_data:
-                request = urllib.request.Request(url, data=bytes(form_data, 'utf-8'), method=method)
+                delay = self._error_retry_delay(method, attempt, exc)
+                if delay is None:
+                    raise
+            except BaseException:
+                self.breaker.abandon_request()
+                raise
             else:
-                request = urllib.request.Request(url, method=method)
-            return self.request(request)
+                delay = self._status_retry_delay(method, attempt, result[0])
+                if delay is None:
+                    return result
+                if is_stream:
+                    result[3].close()
+            time.sleep(delay)
+
+    def request(self, method, api_spec, data=None, timeout=None):
+        """
+        Send a request to the server.
+
+        Failures are reported and answered with an empty response dict, except for timeouts (TimeoutError, or
+        DeadlineExceeded once the current deadline has passed) and CircuitOpenError, which are raised.
+
+        :param method: HTTP method
+        :param api_spec: Request path (and query) relative to the server URL
+        :param data: Request body bytes
+        :param timeout: Timeout for each attempt in seconds (defaults to the session's timeout)
+        :return: Response dict
+        """
+        response_dict = {}
+        try:
+            request = self._begin_request(method, api_spec, data)
+            try:
+                response = self._send(request.server_url, method, api_spec, request.body, request.headers,
+                                      timeout if timeout else self.timeout)
+            except Exception as exc:
+                self._record(request, None, None, exc)
+                raise
+            response_dict = self._end_request(request, *response)
+        except self._timeout_errors + (CircuitOpenError,):
+            raise
+        except Exception as exc:
+            print(exc)
+        return response_dict
+
+    def get(self, api_spec, timeout=None):
+        """
+        Send a GET request; one whose URL would be longer than max_url_length is split into requests for consecutive
+        runs of its keys, which are sent concurrently and whose responses are merged.
+        If the session has a report cache, a response it holds is returned without sending a request; if it has an
+        in-flight table, an identical GET request already in flight is shared.
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :param timeout: Timeout for each attempt in seconds (defaults to the session's timeout)
+        :return: Response dict
+        """
+        report_cache = self.report_cache
+        if report_cache is None:
+            return self._fetch(api_spec, timeout)
+        generation = report_cache.generation_of(api_spec)
+        response_dict = report_cache.get(api_spec)
+        if response_dict is None:
+            response_dict = self._fetch(api_spec, timeout)
+            report_cache.put(api_spec, response_dict, generation)
+        return response_dict
+
+    def _fetch(self, api_spec, timeout):
+        inflight_gets = self.inflight_gets
+        if inflight_gets is not None:
+            return inflight_gets.call(api_spec, lambda: self._send_get(api_spec, timeout))
+        return self._send_get(api_spec, timeout)
+
+    def _send_get(self, api_spec, timeout):
+        api_specs = self.split_query(api_spec)
+        if len(api_specs) == 1 or self.query_concurrency <= 1:
+            return merge_responses([self.request('GET', api_spec, timeout=timeout) for api_spec in api_specs])
+        max_workers = min(self.query_concurrency, len(api_specs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, self.request, 'GET', api_spec, None, timeout)
+                       for api_spec in api_specs]
+            return merge_responses([future.result() for future in futures])
+
+    def stream(self, api_spec, timeout=None):
+        """
+        Send a GET request, and read the response body incrementally.  The request is not split however long its URL
+        is, and it is not journaled; if the session is recording, it is recorded once its body has been read, with the
+        error that stopped the reading, if any.
+
+        :param api_spec: Request path (and query) relative to the server URL
+        :param timeout: Timeout for each attempt in seconds (defaults to the session's timeout)
+        :return: Generator of decompressed response body bytes chunks
+        :raise http.client.HTTPException: If the server answers with an error status
+        """
+        request = self._begin_request('GET', api_spec, None)
+        try:
+            status, reason, response_headers, chunks = self._send(request.server_url, 'GET', api_spec, None,
+                                                                  request.headers,
+                                                                  timeout if timeout else self.timeout, True)
+        except Exception as exc:
+            self._record(request, None, None, exc)
+            raise
+        size = 0
+        content_encoding = response_headers.get('content-encoding')
+        recorded_chunks = [] if self.recorder is not None else None
+        error = None
+        try:
+            if status >= 400:
+                raise http.client.HTTPException('HTTP Error %d: %s' % (status, reason))
+            for chunk in decode_content_chunks(chunks, content_encoding):
+                size += len(chunk)
+                if recorded_chunks is not None:
+                    recorded_chunks.append(chunk)
+                yield chunk
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            chunks.close()
+            with self._lock:
+                self._compression_stats.record_response_size(chunks.size, size, content_encoding)
+            if recorded_chunks is not None:
+                self._record(request, status, b''.join(recorded_chunks), error)
+
+    def put(self, args, form_header, api_spec, method='PUT', timeout=None):
+        try:
+            return self.request(method, api_spec, self._encode_put(args, form_header), timeout)
+        finally:
+            self._end_put(api_spec, method, args)
+
+
+class SingleSender:
+    """
+    Proxy for the default session, which API functions use when not passed a session explicitly.
+    """
+
+    default_server_url = 'http://localhost:9000'
+    default_transport_name = 'pooled'   # 'pooled', 'pipelined' or 'urllib'.
+    default_pool_max_size = 4
+    default_pipeline_window = 32
+    default_pool_idle_timeout = 30.0
+    default_accept_encoding = 'gzip, deflate'
+    default_compress_threshold = None   # Request bodies are sent uncompressed unless a threshold is set.
+    default_codec_name = 'json'         # Standard library json; 'orjson', 'ujson' or 'fastest' to opt in.
+    default_timeout = 10.0              # Seconds to wait for each request attempt.
+    default_payload_cache_size = 1024   # Encoded frozen request payloads kept per session.
+    default_max_url_length = 8000       # Longer GET requests are split by key.
+    default_query_concurrency = 4       # Parts of a split GET request sent at once.
 
     _instance = None
 
     def __init__(self, server_url=None, is_verbose=False):
         if not SingleSender._instance:
-            SingleSender._instance = SingleSender.__InnerSender(server_url, is_verbose)
+            SingleSender._instance = Session(server_url, is_verbose)
         else:
-            SingleSender._instance._server_url = server_url
-            SingleSender._instance._is_verbose = is_verbose
+            SingleSender._instance.configure(server_url, is_verbose)
 
     def __getattr__(self, name):
         return getattr(self._instance, name)
 
+    def __setattr__(self, name, value):
+        setattr(self._instance, name, value)
+
 Sender = SingleSender()
+
+
+def session_of(session):
+    """
+    Resolve the session an API call should use.
+
+    :param session: Session passed to the API call, or None
+    :return: The given session, or the default session
+    """
+    return session if session else SingleSender._instance
@@ -0,0 +1,287 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Sharding of fields and trunks across several Taranos Servers.  A ShardedSession can be passed as the session of any
+# API function: requests are routed to a shard by the field key (trp/f/...) or trunk key (tsp/t/...) they address,
+# constructors are placed on shards by a placement policy, and requests addressing fields or trunks on several
+# shards are scattered to those shards in parallel and their responses gathered back in order.  Field and trunk keys
+# are assumed to be unique across the servers.
+#
+
+import concurrent.futures
+import contextvars
+import threading
+import urllib.parse
+import zlib
+
+from taranoscsfpapi.rendering import *
+from taranoscsfpapi.signaling import *
+
+
+class HashPlacement:
+    """
+    Places each new field or trunk on a shard chosen by a hash of its tag, so that an element is always created on
+    the same shard.
+    """
+    def choose(self, request_dict, shard_loads):
+        tag = request_dict.get('m', {}).get('t', '')
+        return zlib.crc32(tag.encode('utf-8')) % len(shard_loads)
+
+
+class LeastLoadedPlacement:
+    """
+    Places each new field or trunk on the shard holding the fewest known fields and trunks.
+    """
+    def choose(self, request_dict, shard_loads):
+        return min(range(len(shard_loads)), key=shard_loads.__getitem__)
+
+
+class ShardedSession:
+    """
+    Session spread over several Taranos Servers.
+
+    Requests addressing a field or trunk are sent to the shard known to hold it; keys not yet known are looked up by
+    querying every shard.  Requests not addressing a field or trunk (such as cell requests) are sent to the first
+    shard, except cell destruction, which is sent to all of them.
+    """
+
+    _collections = {'trp/f': 'rf', 'tsp/t': 'rt'}
+    _report_classes = {'trp/f': FieldReport, 'tsp/t': TrunkReport}
+
+    def __init__(self, server_urls, placement=None, is_verbose=False, max_concurrency=8):
+        if not server_urls:
+            raise ValueError('no server URLs')
+        self.fk = None   # Default field key.
+        self.tk = None   # Default trunk key.
+        self.shards = [Session(server_url, is_verbose) for server_url in server_urls]
+        self.placement = placement if placement else HashPlacement()
+        self.coalescer = None
+        self._routes = {}
+        self._shard_loads = [0] * len(self.shards)
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+
+    @property
+    def server_url(self):
+        return self.shards[0].server_url
+
+    @property
+    def codec(self):
+        return self.shards[0].codec
+
+    @property
+    def request_count(self):
+        return sum(shard.request_count for shard in self.shards)
+
+    def _add_route(self, key, shard_index):
+        with self._lock:
+            previous_index = self._routes.get(key)
+            if previous_index != shard_index:
+                if previous_index is not None:
+                    self._shard_loads[previous_index] -= 1
+                self._routes[key] = shard_index
+                self._shard_loads[shard_index] += 1
+
+    def _drop_route(self, key):
+        with self._lock:
+            shard_index = self._routes.pop(key, None)
+            if shard_index is not None:
+                self._shard_loads[shard_index] -= 1
+
+    def shard_of(self, collection, key):
+        """
+        Find the shard holding a field or trunk.
+
+        :param collection: 'trp/f' for a field, 'tsp/t' for a trunk
+        :param key: Field or trunk key
+        :return: Index of the shard, or 0 if no shard holds it
+        """
+        shard_index = self._routes.get(key)
+        if shard_index is not None:
+            return shard_index
+        reply_key = ShardedSession._collections[collection]
+        api_spec = '%s?k=%s' % (collection, key)
+        futures = [self._executor.submit(contextvars.copy_context().run, shard.get, api_spec) for shard in self.shards]
+        responses = [future.result() for future in futures]
+        for shard_index, response_dict in enumerate(responses):
+            if _is_ok(response_dict) and response_dict.get(reply_key):
+                self._add_route(key, shard_index)
+                return shard_index
+        return 0
+
+    def _route(self, api_spec):
+        parts = api_spec.split('?', 1)[0].split('/')
+        collection = '/'.join(parts[:2])
+        if collection in ShardedSession._collections and len(parts) > 2:
+            return self.shard_of(collection, parts[2])
+        return 0
+
+    def get(self, api_spec, timeout=None):
+        path, _, query = api_spec.partition('?')
+        if path not in ShardedSession._collections:
+            return self.shards[self._route(api_spec)].get(api_spec, timeout)
+
+        query_list = urllib.parse.parse_qsl(query)
+        keys = [value for name, value in query_list if name == 'k']
+        other_query_list = [(name, value) for name, value in query_list if name != 'k']
+        if not keys:
+            shard_indices = range(len(self.shards))
+            requests = [(shard_index, api_spec) for shard_index in shard_indices]
+            positions = None
+        else:
+            positions = {}
+            for i, key in enumerate(keys):
+                positions.setdefault(self.shard_of(path, key), []).append(i)
+            requests = []
+            for shard_index, indices in positions.items():
+                shard_query = [('k', keys[i]) for i in indices] + other_query_list
+                requests.append((shard_index, '%s?%s' % (path, urllib.parse.urlencode(shard_query, safe='~'))))
+        return self._scatter(requests, positions, len(keys),
+                             lambda shard_index, spec: self.shards[shard_index].get(spec, timeout))
+
+    def split_query(self, api_spec):
+        return self.shards[self._route(api_spec)].split_query(api_spec)
+
+    def stream(self, api_spec, timeout=None):
+        # Only requests addressing a single field or trunk are streamed, from the shard holding it:
+        return self.shards[self._route(api_spec)].stream(api_spec, timeout)
+
+    def put(self, args, form_header, api_spec, method='PUT', timeout=None):
+        if api_spec == 'tmp/c' and method == 'DELETE':
+            with self._lock:
+                self._routes.clear()
+                self._shard_loads = [0] * len(self.shards)
+
+            def destroy_shard_cell(shard_index, spec):
+                return self.shards[shard_index].put(args, form_header, spec, method, timeout)
+
+            requests = [(shard_index, api_spec) for shard_index in range(len(self.shards))]
+            return self._scatter(requests, None, 0, destroy_shard_cell)
+        if api_spec not in ShardedSession._collections:
+            return self.shards[self._route(api_spec)].put(args, form_header, api_spec, method, timeout)
+
+        if args is None:
+            args = []
+        elif isinstance(args, FormBatch):
+            args = args.request_dicts()
+        elif type(args) is not list:
+            args = [args]
+        request_dicts = [arg() if callable(arg) else arg for arg in args]
+        with self._lock:
+            shard_loads = list(self._shard_loads)
+        positions = {}
+        for i, request_dict in enumerate(request_dicts):
+            if method == 'POST':
+                shard_index = self.placement.choose(request_dict, shard_loads)
+                shard_loads[shard_index] += 1
+            else:
+                shard_index = self.shard_of(api_spec, request_dict['m']['k'])
+            positions.setdefault(shard_index, []).append(i)
+        requests = [(shard_index, api_spec) for shard_index in positions]
+
+        def put_shard(shard_index, spec):
+            # Frozen requests are passed on as they are, so that their encoded payloads are reused:
+            shard_args = [args[i] if type(args[i]) is FrozenRequest else request_dicts[i]
+                          for i in positions[shard_index]]
+            return self.shards[shard_index].put(shard_args, form_header, spec, method, timeout)
+
+        response_dict = self._scatter(requests, positions, len(request_dicts), put_shard)
+        if _is_ok(response_dict):
+            reply_key = ShardedSession._collections[api_spec]
+            if method == 'POST':
+                reports = response_dict.get(reply_key)
+                report_class = ShardedSession._report_classes[api_spec]
+                for shard_index, indices in positions.items():
+                    for i in indices:
+                        if reports and i < len(reports):
+                            # Creation reports carry the new element's key under its entity code, e.g. m._f:
+                            key = report_class.decode(reports[i]).key
+                            if key:
+                                self._add_route(key, shard_index)
+            elif method == 'DELETE':
+                for request_dict in request_dicts:
+                    self._drop_route(request_dict['m']['k'])
+        return response_dict
+
+    def _scatter(self, requests, positions, item_count, send):
+        """
+        Send requests to shards in parallel, and merge their responses.
+
+        :param requests: List of (shard index, API spec) tuples
+        :param positions: Dict of the positions of the items each shard's request addresses in the whole request,
+            keyed by shard index, or None to concatenate the shards' reply lists
+        :param item_count: Number of items addressed by the whole request
+        :param send: Function taking a shard index and API spec, returning the shard's response dict
+        :return: Merged response dict; the first unsuccessful shard response if there is one
+        """
+        if len(requests) == 1:
+            return send(*requests[0])
+        futures = [self._executor.submit(contextvars.copy_context().run, send, shard_index, api_spec)
+                   for shard_index, api_spec in requests]
+        responses = [future.result() for future in futures]
+        for response_dict in responses:
+            if not _is_ok(response_dict):
+                return response_dict
+
+        merged = dict(responses[0])
+        for name, value in responses[0].items():
+            if not isinstance(value, (list, ArrayView)):
+                continue
+            if positions is None:
+                merged[name] = [item for response_dict in responses for item in response_dict.get(name, [])]
+                continue
+            items = [None] * item_count
+            is_complete = True
+            for (shard_index, _), response_dict in zip(requests, responses):
+                shard_items = response_dict.get(name, [])
+                indices = positions[shard_index]
+                if len(shard_items) != len(indices):
+                    is_complete = False
+                    break
+                for i, item in zip(indices, shard_items):
+                    items[i] = item
+            if is_complete:
+                merged[name] = items
+            else:
+                merged[name] = [item for response_dict in responses for item in response_dict.get(name, [])]
+        return merged
+
+    def stats(self):
+        """
+        Report sharded session statistics.
+
+        :return: Dict of the number of fields and trunks known to be on each shard, and each shard's stats
+        """
+        with self._lock:
+            shard_loads = list(self._shard_loads)
+        return {
+            'requests': self.request_count,
+            'loads': shard_loads,
+            'shards': [shard.stats() for shard in self.shards]}
+
+    def close(self):
+        """
+        Close all shards' connections.
+        """
+        for shard in self.shards:
+            shard.close()
+        self._executor.shutdown(wait=False)
+
+
+def _is_ok(response_dict):
+    return bool(response_dict) and response_dict.get('s') == 0 and response_dict.get('r') == 0
@@ -33,10 +33,11 @@ def check_mode_arg(mode):
         raise PapiException(-1, 'mode arg invalid')
 
 
-def tk(new_value=None):
+def tk(new_value=None, *, session=None):
+    session = session_of(session)
     if new_value:
-        Globals.tk = new_value
-    return Globals.tk
+        session.tk = new_value
+    return session.tk
 
 
 #
@@ -46,6 +47,14 @@ def tk(new_value=None):
 # Create:
 
 class TrunkConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -56,77 +65,88 @@ class TrunkConstructor:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
-
-
-def create_trunks(*, constructors):
-    response_dict = Sender.put(constructors, 'ct', 'tsp/t', method='POST')
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_trunks(*, constructors, session=None):
+    response_dict = session_of(session).put(constructors, 'ct', 'tsp/t', method='POST')
     return handle_response(response_dict, 'rt')
 
 
-def create_trunk(**kwargs):
-    return create_trunks(constructors=[TrunkConstructor(**kwargs)])[0]
+def create_trunk(*, session=None, **kwargs):
+    return create_trunks(constructors=[TrunkConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class TrunkDestructor:
+    __slots__ = ('key', 'scope')
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key,
                  scope=None):
         self.key = check_key_arg(key)
         self.scope = check_string_arg(scope)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_trunks(*, destructors):
-    response_dict = Sender.put(destructors, 'dt', 'tsp/t', method='DELETE')
+def destroy_trunks(*, destructors, session=None):
+    response_dict = session_of(session).put(destructors, 'dt', 'tsp/t', method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_trunk(*, key=None, **kwargs):
+def destroy_trunk(*, key=None, session=None, **kwargs):
     if not key:
-        key = tk()
-    return destroy_trunks(destructors=[TrunkDestructor(key, **kwargs)])
+        key = tk(session=session)
+    return destroy_trunks(destructors=[TrunkDestructor(key, **kwargs)], session=session)
 
 
 # Report:
 
 class TrunkQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_trunks(*, keys, sections=None):
+class TrunkReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description')
+
+    report_spec = (
+        ('key', 'm._t'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
+    decode = compile_report_decoder(report_spec)
+
+
+def report_trunks(*, keys, sections=None, session=None):
     query = TrunkQuery(keys, sections)
-    response_dict = Sender.get('tsp/t%s' % query())
+    response_dict = session_of(session).get('tsp/t%s' % query())
     return handle_response(response_dict, 'rt')
 
 
-def report_trunk(*, key=None, sections=None):
+def report_trunk(*, key=None, sections=None, session=None):
     if not key:
-        key = tk()
-    result = report_trunks(keys=[key], sections=sections)
+        key = tk(session=session)
+    result = report_trunks(keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class TrunkUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -135,26 +155,18 @@ class TrunkUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_trunks(*, updates):
-    response_dict = Sender.put(updates, 'ut', 'tsp/t')
+def update_trunks(*, updates, session=None):
+    response_dict = session_of(session).put(updates, 'ut', 'tsp/t')
     return handle_response(response_dict, None)
 
 
-def update_trunk(*, key=None, **kwargs):
+def update_trunk(*, key=None, session=None, **kwargs):
     if not key:
-        key = tk()
-    return update_trunks(updates=[TrunkUpdate(key, **kwargs)])
+        key = tk(session=session)
+    return coalesce(update_trunks, 'updates', TrunkUpdate(key, **kwargs), session=session)
 
 
 #
@@ -164,6 +176,14 @@ def update_trunk(*, key=None, **kwargs):
 # Create:
 
 class SignalInterfaceConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -174,85 +194,81 @@ class SignalInterfaceConstructor:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
-
-        
-def create_signal_interfaces(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csi', 'tsp/t/%s/si' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_interfaces(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csi', 'tsp/t/%s/si' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsi')
 
 
-def create_signal_interface(*, trunk_key=None, **kwargs):
+def create_signal_interface(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     return create_signal_interfaces(trunk_key=trunk_key,
-                                    constructors=[SignalInterfaceConstructor(**kwargs)])[0]
+                                    constructors=[SignalInterfaceConstructor(**kwargs)],
+                                    session=session)[0]
 
 
 # Destroy:
 
 class SignalInterfaceDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
-
-        
-def destroy_signal_interfaces(*, trunk_key=None, destructors):
+    __call__ = compile_request_serializer(request_spec)
+def destroy_signal_interfaces(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsi', 'tsp/t/%s/si' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsi', 'tsp/t/%s/si' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_interface(*, trunk_key=None, **kwargs):
+def destroy_signal_interface(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     return destroy_signal_interfaces(trunk_key=trunk_key,
-                                     destructors=[SignalInterfaceDestructor(**kwargs)])
+                                     destructors=[SignalInterfaceDestructor(**kwargs)],
+                                     session=session)
 
 
 # Report:
 
 class SignalInterfaceQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_interfaces(*, trunk_key=None, keys, sections=None):
+def report_signal_interfaces(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalInterfaceQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/si%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/si%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsi')
 
 
-def report_signal_interface(*, trunk_key=None, key, sections=None):
+def report_signal_interface(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_interfaces(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_interfaces(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalInterfaceUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -261,28 +277,24 @@ class SignalInterfaceUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_interfaces(*, trunk_key=None, updates):
+def update_signal_interfaces(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usi', 'tsp/t/%s/si' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usi', 'tsp/t/%s/si' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_interface(*, trunk_key=None, **kwargs):
+def update_signal_interface(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_interfaces(trunk_key=trunk_key, updates=[SignalInterfaceUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_interfaces,
+                    'updates',
+                    SignalInterfaceUpdate(**kwargs),
+                    trunk_key=trunk_key,
+                    session=session)
 
 
 #
@@ -292,6 +304,16 @@ def update_signal_interface(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalPortConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'alias', 'mode')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('alias', 'm.a'),
+        ('mode', 'm.m', True))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -306,101 +328,116 @@ class SignalPortConstructor:
         self.alias = check_string_arg(alias)
         self.mode = check_mode_arg(mode)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.alias:
-            request_dict['m']['a'] = self.alias
-        request_dict['m']['m'] = self.mode
-        return request_dict
-
-
-def create_signal_ports(*, trunk_key=None, interface_key, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(
+    __call__ = compile_request_serializer(request_spec)
+
+
+def create_signal_ports(*, trunk_key=None, interface_key, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(
         constructors, 'csp', 'tsp/t/%s/si/%s/sp' % (trunk_key, interface_key), method='POST')
     return handle_response(response_dict, 'rsp')
 
 
-def create_signal_port(*, trunk_key=None, interface_key, **kwargs):
+def create_signal_port(*, trunk_key=None, interface_key, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     return create_signal_ports(trunk_key=trunk_key,
                                interface_key=interface_key,
-                               constructors=[SignalPortConstructor(**kwargs)])[0]
+                               constructors=[SignalPortConstructor(**kwargs)],
+                               session=session)[0]
 
 
 # Destroy:
 
 class SignalPortDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = key
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_signal_ports(*, trunk_key=None, destructors):
+def destroy_signal_ports(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsp', 'tsp/t/%s/sp' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsp', 'tsp/t/%s/sp' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_port(*, trunk_key=None, **kwargs):
+def destroy_signal_port(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_ports(trunk_key=trunk_key, destructors=[SignalPortDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_ports(trunk_key=trunk_key, destructors=[SignalPortDestructor(**kwargs)], session=session)
 
 
 # Lookup:
 
-def lookup_signal_port(*, trunk_key=None, alias):
+def lookup_signal_port(*, trunk_key=None, alias, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.get('tsp/t/%s/spa/%s' % (trunk_key, alias))
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).get('tsp/t/%s/spa/%s' % (trunk_key, alias))
     return handle_response(response_dict, 'lsp')
 
 
 # Report:
 
 class SignalPortQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class SignalPortReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'alias', 'mode', 'signal')
+
+    report_spec = (
+        ('key', 'm._sp'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('alias', 'm.a'),
+        ('mode', 'm.m'),
+        ('signal', 's.s'))
 
+    decode = compile_report_decoder(report_spec)
 
-def report_signal_ports(*, trunk_key=None, interface_key, keys, sections=None):
+
+def report_signal_ports(*, trunk_key=None, interface_key, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalPortQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/si/%s/sp%s' % (trunk_key, interface_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/si/%s/sp%s' % (trunk_key, interface_key, query()))
     return handle_response(response_dict, 'rsp')
 
 
-def report_signal_port(*, trunk_key=None, interface_key, key, sections=None):
+def report_signal_port(*, trunk_key=None, interface_key, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     result = report_signal_ports(trunk_key=trunk_key,
                                  interface_key=interface_key,
                                  keys=[key],
-                                 sections=sections)
+                                 sections=sections,
+                                 session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalPortUpdate:
+    __slots__ = ('key', 'name', 'description', 'alias', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('alias', 'm.a'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -413,33 +450,20 @@ class SignalPortUpdate:
         self.alias = check_string_arg(alias)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.alias:
-            request_dict['m']['a'] = self.alias
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
-
-
-def update_signal_ports(*, trunk_key=None, updates):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usp', 'tsp/t/%s/sp' % trunk_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_signal_ports(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usp', 'tsp/t/%s/sp' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_port(*, trunk_key=None, **kwargs):
+def update_signal_port(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_ports(trunk_key=trunk_key, updates=[SignalPortUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_ports, 'updates', SignalPortUpdate(**kwargs), trunk_key=trunk_key, session=session)
 
 
 #
@@ -449,6 +473,14 @@ def update_signal_port(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalSourceConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -459,83 +491,84 @@ class SignalSourceConstructor:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def create_signal_sources(*, trunk_key=None, constructors):
+def create_signal_sources(*, trunk_key=None, constructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'css', 'tsp/t/%s/ss' % trunk_key, method='POST')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'css', 'tsp/t/%s/ss' % trunk_key, method='POST')
     return handle_response(response_dict, 'rss')
 
 
-def create_signal_source(*, trunk_key=None, **kwargs):
+def create_signal_source(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_sources(trunk_key=trunk_key, constructors=[SignalSourceConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_sources(trunk_key=trunk_key,
+                                 constructors=[SignalSourceConstructor(**kwargs)],
+                                 session=session)[0]
 
 
 # Destroy:
 
 class SignalSourceDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_signal_sources(*, trunk_key=None, destructors):
+def destroy_signal_sources(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dss', 'tsp/t/%s/ss' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dss', 'tsp/t/%s/ss' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_source(*, trunk_key=None, **kwargs):
+def destroy_signal_source(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_sources(trunk_key=trunk_key, destructors=[SignalSourceDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_sources(trunk_key=trunk_key, destructors=[SignalSourceDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalSourceQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_sources(*, trunk_key=None, keys, sections=None):
+def report_signal_sources(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalSourceQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/ss%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/ss%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rss')
 
 
-def report_signal_source(*, trunk_key=None, key, sections=None):
+def report_signal_source(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_sources(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_sources(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalSourceUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -546,31 +579,24 @@ class SignalSourceUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_sources(*, trunk_key=None, updates):
+def update_signal_sources(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'uss', 'tsp/t/%s/ss' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'uss', 'tsp/t/%s/ss' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_source(*, trunk_key=None, **kwargs):
+def update_signal_source(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_sources(trunk_key=trunk_key, updates=[SignalSourceUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_sources,
+                    'updates',
+                    SignalSourceUpdate(**kwargs),
+                    trunk_key=trunk_key,
+                    session=session)
 
 
 #
@@ -580,6 +606,15 @@ def update_signal_source(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalSinkConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -592,84 +627,82 @@ class SignalSinkConstructor:
         self.description = check_string_arg(description)
         self.mode = check_mode_arg(mode)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def create_signal_sinks(*, trunk_key=None, constructors):
+def create_signal_sinks(*, trunk_key=None, constructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csk', 'tsp/t/%s/sk' % trunk_key, method='POST')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csk', 'tsp/t/%s/sk' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsk')
 
 
-def create_signal_sink(*, trunk_key=None, **kwargs):
+def create_signal_sink(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_sinks(trunk_key=trunk_key, constructors=[SignalSinkConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_sinks(trunk_key=trunk_key, constructors=[SignalSinkConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class SignalSinkDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_signal_sinks(*, trunk_key=None, destructors):
+def destroy_signal_sinks(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsk', 'tsp/t/%s/sk' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsk', 'tsp/t/%s/sk' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_sink(*, trunk_key=None, **kwargs):
+def destroy_signal_sink(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_sinks(trunk_key=trunk_key, destructors=[SignalSinkDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_sinks(trunk_key=trunk_key, destructors=[SignalSinkDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalSinkQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_sinks(*, trunk_key=None, keys, sections=None):
+def report_signal_sinks(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalSinkQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/sk%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/sk%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsk')
 
 
-def report_signal_sink(*, trunk_key=None, key, sections=None):
+def report_signal_sink(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_sinks(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_sinks(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalSinkUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -680,31 +713,20 @@ class SignalSinkUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_sinks(*, trunk_key=None, updates):
+def update_signal_sinks(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usk', 'tsp/t/%s/sk' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usk', 'tsp/t/%s/sk' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_sink(*, trunk_key=None, **kwargs):
+def update_signal_sink(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_sinks(trunk_key=trunk_key, updates=[SignalSinkUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_sinks, 'updates', SignalSinkUpdate(**kwargs), trunk_key=trunk_key, session=session)
 
 
 #
@@ -714,6 +736,17 @@ def update_signal_sink(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalLinkConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode', 'sink_key', 'source_key')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('sink_key', 'r.sk', True),
+        ('source_key', 'r.ss', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -730,87 +763,93 @@ class SignalLinkConstructor:
         self.sink_key = check_key_arg(sink_key)
         self.source_key = check_key_arg(source_key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag},
-            'r': {
-                'sk': self.sink_key,
-                'ss': self.source_key}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        return request_dict
-
-        
-def create_signal_links(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csl', 'tsp/t/%s/sl' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_links(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csl', 'tsp/t/%s/sl' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsl')
 
 
-def create_signal_link(*, trunk_key=None, **kwargs):
+def create_signal_link(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_links(trunk_key=trunk_key, constructors=[SignalLinkConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_links(trunk_key=trunk_key, constructors=[SignalLinkConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class SignalLinkDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
-
-        
-def destroy_signal_links(*, trunk_key=None, destructors):
+    __call__ = compile_request_serializer(request_spec)
+def destroy_signal_links(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsl', 'tsp/t/%s/sl' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsl', 'tsp/t/%s/sl' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_link(*, trunk_key=None, **kwargs):
+def destroy_signal_link(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_links(trunk_key=trunk_key, destructors=[SignalLinkDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_links(trunk_key=trunk_key, destructors=[SignalLinkDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalLinkQuery(CommonQuery):
-    pass
+    __slots__ = ()
+
+
+class SignalLinkReport(ReportRecord):
+    __slots__ = ('key', 'tag', 'badge', 'name', 'description', 'mode', 'sink_key', 'source_key')
 
+    report_spec = (
+        ('key', 'm._sl'),
+        ('tag', 'm.t'),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m'),
+        ('sink_key', 'r.sk'),
+        ('source_key', 'r.ss'))
 
-def report_signal_links(*, trunk_key=None, keys, sections=None):
+    decode = compile_report_decoder(report_spec)
+
+
+def report_signal_links(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalLinkQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/sl%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/sl%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsl')
 
 
-def report_signal_link(*, trunk_key=None, key, sections=None):
+def report_signal_link(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_links(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_links(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalLinkUpdate:
+    __slots__ = ('key', 'name', 'description')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -819,28 +858,20 @@ class SignalLinkUpdate:
         self.name = check_string_arg(name)
         self.description = check_string_arg(description)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_links(*, trunk_key=None, updates):
+def update_signal_links(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usl', 'tsp/t/%s/sl' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usl', 'tsp/t/%s/sl' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_link(*, trunk_key=None, **kwargs):
+def update_signal_link(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_links(trunk_key=trunk_key, updates=[SignalLinkUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_links, 'updates', SignalLinkUpdate(**kwargs), trunk_key=trunk_key, session=session)
 
 
 #
@@ -850,6 +881,15 @@ def update_signal_link(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalTapConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -862,84 +902,80 @@ class SignalTapConstructor:
         self.description = check_string_arg(description)
         self.mode = check_mode_arg(mode)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        return request_dict
-
-        
-def create_signal_taps(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'cst', 'tsp/t/%s/st' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_taps(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'cst', 'tsp/t/%s/st' % trunk_key, method='POST')
     return handle_response(response_dict, 'rst')
 
 
-def create_signal_tap(*, trunk_key=None, **kwargs):
+def create_signal_tap(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_taps(trunk_key=trunk_key, constructors=[SignalTapConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_taps(trunk_key=trunk_key, constructors=[SignalTapConstructor(**kwargs)], session=session)[0]
 
 
 # Destroy:
 
 class SignalTapDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def destroy_signal_taps(*, trunk_key=None, destructors=None):
+def destroy_signal_taps(*, trunk_key=None, destructors=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dst', 'tsp/t/%s/st' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dst', 'tsp/t/%s/st' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_tap(*, trunk_key=None, **kwargs):
+def destroy_signal_tap(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_taps(trunk_key=trunk_key, destructors=[SignalTapDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_taps(trunk_key=trunk_key, destructors=[SignalTapDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalTapQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_taps(*, trunk_key=None, keys, sections=None):
+def report_signal_taps(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalTapQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/st%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/st%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rst')
 
 
-def report_signal_tap(*, trunk_key=None, key, sections=None):
+def report_signal_tap(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_taps(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_taps(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalTapUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -950,32 +986,20 @@ class SignalTapUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            if 's' not in request_dict:
-                request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
-
-
-def update_signal_taps(*, trunk_key=None, updates):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'ust', 'tsp/t/%s/st' % trunk_key)
+    __call__ = compile_request_serializer(request_spec)
+
+
+def update_signal_taps(*, trunk_key=None, updates, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'ust', 'tsp/t/%s/st' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_tap(*, trunk_key=None, **kwargs):
+def update_signal_tap(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_taps(trunk_key=trunk_key, updates=[SignalTapUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_taps, 'updates', SignalTapUpdate(**kwargs), trunk_key=trunk_key, session=session)
 
 
 #
@@ -985,6 +1009,15 @@ def update_signal_tap(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalInputConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -997,84 +1030,80 @@ class SignalInputConstructor:
         self.description = check_string_arg(description)
         self.mode = check_mode_arg(mode)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        return request_dict
-
-        
-def create_signal_inputs(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csmi', 'tsp/t/%s/smi' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_inputs(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csmi', 'tsp/t/%s/smi' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsmi')
 
 
-def create_signal_input(*, trunk_key=None, **kwargs):
+def create_signal_input(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_inputs(trunk_key=trunk_key, constructors=[SignalInputConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_inputs(trunk_key=trunk_key,
+                                constructors=[SignalInputConstructor(**kwargs)],
+                                session=session)[0]
 
 
 # Destroy:
 
 class SignalInputDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
-
-        
-def destroy_signal_inputs(*, trunk_key=None, destructors):
+    __call__ = compile_request_serializer(request_spec)
+def destroy_signal_inputs(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsmi', 'tsp/t/%s/smi' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsmi', 'tsp/t/%s/smi' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_input(*, trunk_key=None, **kwargs):
+def destroy_signal_input(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_inputs(trunk_key=trunk_key, destructors=[SignalInputDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_inputs(trunk_key=trunk_key, destructors=[SignalInputDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalInputQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_inputs(*, trunk_key=None, keys, sections=None):
+def report_signal_inputs(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalInputQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/smi%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/smi%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsmi')
 
 
-def report_signal_input(*, trunk_key=None, key, sections=None):
+def report_signal_input(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_inputs(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_inputs(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalInputUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1085,31 +1114,20 @@ class SignalInputUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_inputs(*, trunk_key=None, updates):
+def update_signal_inputs(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usmi', 'tsp/t/%s/smi' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usmi', 'tsp/t/%s/smi' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_input(*, trunk_key=None, **kwargs):
+def update_signal_input(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_inputs(trunk_key=trunk_key, updates=[SignalInputUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_inputs, 'updates', SignalInputUpdate(**kwargs), trunk_key=trunk_key, session=session)
 
 
 #
@@ -1119,6 +1137,16 @@ def update_signal_input(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalBridgeConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode', 'modulatable_key')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True),
+        ('modulatable_key', 'r.sm'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -1133,87 +1161,80 @@ class SignalBridgeConstructor:
         self.mode = check_mode_arg(mode)
         self.modulatable_key = check_key_arg(modulatable_key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        if self.modulatable_key:
-            request_dict['r'] = {}
-            request_dict['r']['sm'] = self.modulatable_key
-        return request_dict
-
-        
-def create_signal_bridges(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csmb', 'tsp/t/%s/smb' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_bridges(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csmb', 'tsp/t/%s/smb' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsmb')
 
 
-def create_signal_bridge(*, trunk_key=None, **kwargs):
+def create_signal_bridge(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_bridges(trunk_key=trunk_key, constructors=[SignalBridgeConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_bridges(trunk_key=trunk_key,
+                                 constructors=[SignalBridgeConstructor(**kwargs)],
+                                 session=session)[0]
 
 
 # Destroy:
 
 class SignalBridgeDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
-
-        
-def destroy_signal_bridges(*, trunk_key=None, destructors):
+    __call__ = compile_request_serializer(request_spec)
+def destroy_signal_bridges(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsmb', 'tsp/t/%s/smb' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsmb', 'tsp/t/%s/smb' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_bridge(*, trunk_key=None, **kwargs):
+def destroy_signal_bridge(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_bridges(trunk_key=trunk_key, destructors=[SignalBridgeDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_bridges(trunk_key=trunk_key, destructors=[SignalBridgeDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalBridgeQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_bridges(*, trunk_key=None, keys, sections=None):
+def report_signal_bridges(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalBridgeQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/smb%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/smb%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsmb')
 
 
-def report_signal_bridge(*, trunk_key=None, key, sections=None):
+def report_signal_bridge(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_bridges(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_bridges(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalBridgeUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1224,31 +1245,24 @@ class SignalBridgeUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_bridges(*, trunk_key=None, updates):
+def update_signal_bridges(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usmb', 'tsp/t/%s/smb' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usmb', 'tsp/t/%s/smb' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_bridge(*, trunk_key=None, **kwargs):
+def update_signal_bridge(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_bridges(trunk_key=trunk_key, updates=[SignalBridgeUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_bridges,
+                    'updates',
+                    SignalBridgeUpdate(**kwargs),
+                    trunk_key=trunk_key,
+                    session=session)
 
 
 #
@@ -1258,6 +1272,16 @@ def update_signal_bridge(*, trunk_key=None, **kwargs):
 # Create:
 
 class SignalOutputConstructor:
+    __slots__ = ('tag', 'badge', 'name', 'description', 'mode', 'modulatable_key')
+
+    request_spec = (
+        ('tag', 'm.t', True),
+        ('badge', 'm.b'),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('mode', 'm.m', True),
+        ('modulatable_key', 'r.sm'))
+
     def __init__(self,
                  tag,
                  badge=None,
@@ -1272,87 +1296,80 @@ class SignalOutputConstructor:
         self.mode = check_mode_arg(mode)
         self.modulatable_key = check_key_arg(modulatable_key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                't': self.tag}}
-        if self.badge:
-            request_dict['m']['b'] = self.badge
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        request_dict['m']['m'] = self.mode
-        if self.modulatable_key:
-            request_dict['r'] = {}
-            request_dict['r']['sm'] = self.modulatable_key
-        return request_dict
-
-        
-def create_signal_outputs(*, trunk_key=None, constructors):
-    if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(constructors, 'csmo', 'tsp/t/%s/smo' % trunk_key, method='POST')
+    __call__ = compile_request_serializer(request_spec)
+def create_signal_outputs(*, trunk_key=None, constructors, session=None):
+    if not trunk_key:
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(constructors, 'csmo', 'tsp/t/%s/smo' % trunk_key, method='POST')
     return handle_response(response_dict, 'rsmo')
 
 
-def create_signal_output(*, trunk_key=None, **kwargs):
+def create_signal_output(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return create_signal_outputs(trunk_key=trunk_key, constructors=[SignalOutputConstructor(**kwargs)])[0]
+        trunk_key = tk(session=session)
+    return create_signal_outputs(trunk_key=trunk_key,
+                                 constructors=[SignalOutputConstructor(**kwargs)],
+                                 session=session)[0]
 
 
 # Destroy:
 
 class SignalOutputDestructor:
+    __slots__ = ('key',)
+
+    request_spec = (
+        ('key', 'm.k', True),)
+
     def __init__(self,
                  key):
         self.key = check_key_arg(key)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        return request_dict
-
-        
-def destroy_signal_outputs(*, trunk_key=None, destructors):
+    __call__ = compile_request_serializer(request_spec)
+def destroy_signal_outputs(*, trunk_key=None, destructors, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(destructors, 'dsmo', 'tsp/t/%s/smo' % trunk_key, method='DELETE')
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(destructors, 'dsmo', 'tsp/t/%s/smo' % trunk_key, method='DELETE')
     return handle_response(response_dict, None)
 
 
-def destroy_signal_output(*, trunk_key=None, **kwargs):
+def destroy_signal_output(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return destroy_signal_outputs(trunk_key=trunk_key, destructors=[SignalOutputDestructor(**kwargs)])
+        trunk_key = tk(session=session)
+    return destroy_signal_outputs(trunk_key=trunk_key, destructors=[SignalOutputDestructor(**kwargs)], session=session)
 
 
 # Report:
 
 class SignalOutputQuery(CommonQuery):
-    pass
+    __slots__ = ()
 
 
-def report_signal_outputs(*, trunk_key=None, keys, sections=None):
+def report_signal_outputs(*, trunk_key=None, keys, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
+        trunk_key = tk(session=session)
     query = SignalOutputQuery(keys, sections)
-    response_dict = Sender.get('tsp/t/%s/smo%s' % (trunk_key, query()))
+    response_dict = session_of(session).get('tsp/t/%s/smo%s' % (trunk_key, query()))
     return handle_response(response_dict, 'rsmo')
 
 
-def report_signal_output(*, trunk_key=None, key, sections=None):
+def report_signal_output(*, trunk_key=None, key, sections=None, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    result = report_signal_outputs(trunk_key=trunk_key, keys=[key], sections=sections)
+        trunk_key = tk(session=session)
+    result = report_signal_outputs(trunk_key=trunk_key, keys=[key], sections=sections, session=session)
     return None if not result else result[0]
 
 
 # Update:
 
 class SignalOutputUpdate:
+    __slots__ = ('key', 'name', 'description', 'signal')
+
+    request_spec = (
+        ('key', 'm.k', True),
+        ('name', 'm.n'),
+        ('description', 'm.d'),
+        ('signal', 's.s'))
+
     def __init__(self,
                  key,
                  name=None,
@@ -1363,28 +1380,21 @@ class SignalOutputUpdate:
         self.description = check_string_arg(description)
         self.signal = check_string_arg(signal)
 
-    def __call__(self):
-        request_dict = {
-            'm': {
-                'k': self.key}}
-        if self.name:
-            request_dict['m']['n'] = self.name
-        if self.description:
-            request_dict['m']['d'] = self.description
-        if self.signal:
-            request_dict['s'] = {}
-            request_dict['s']['s'] = self.signal
-        return request_dict
+    __call__ = compile_request_serializer(request_spec)
 
 
-def update_signal_outputs(*, trunk_key=None, updates):
+def update_signal_outputs(*, trunk_key=None, updates, session=None):
     if not trunk_key:
-        trunk_key = tk()
-    response_dict = Sender.put(updates, 'usmo', 'tsp/t/%s/smo' % trunk_key)
+        trunk_key = tk(session=session)
+    response_dict = session_of(session).put(updates, 'usmo', 'tsp/t/%s/smo' % trunk_key)
     return handle_response(response_dict, None)
 
 
-def update_signal_output(*, trunk_key=None, **kwargs):
+def update_signal_output(*, trunk_key=None, session=None, **kwargs):
     if not trunk_key:
-        trunk_key = tk()
-    return update_signal_outputs(trunk_key=trunk_key, updates=[SignalOutputUpdate(**kwargs)])
+        trunk_key = tk(session=session)
+    return coalesce(update_signal_outputs,
+                    'updates',
+                    SignalOutputUpdate(**kwargs),
+                    trunk_key=trunk_key,
+                    session=session)
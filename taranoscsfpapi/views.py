@@ -0,0 +1,397 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Lazy and incremental parsing of JSON responses.
+#
+# Lazy, read-only views over JSON response bytes.  The structural characters of a response are indexed in one
+# vectorized pass, and each object or array is only split into members or elements, and each scalar only parsed, when
+# it is first accessed.  Values too small to be worth a view are parsed whole when accessed.  Views need numpy; without
+# it documents are parsed whole.
+#
+# Incremental parsing of a response as its body is read, yielding the elements of a reply list one at a time.
+#
+
+import collections.abc
+import encodings.utf_8
+import json
+import re
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from taranoscsfpapi.codec import *
+
+
+_unparsed = object()   # Placeholder for a member or element that has not been accessed yet.
+_whitespace = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+def _index_tokens(data):
+    """
+    Find the structural characters of a JSON document outside its strings, and their nesting levels.
+
+    :param data: JSON bytes
+    :return: (token positions, token ranks) tuple; the rank of a comma or colon is twice the level of the members or
+        elements it separates, and that of an opening or closing bracket one more than twice the level of the value it
+        delimits
+    """
+    chars = numpy.frombuffer(data, numpy.uint8)
+    quotes = chars == 34
+    if b'\\' in data:
+        # A quote escaped by an odd run of backslashes does not delimit a string:
+        backslashes = numpy.flatnonzero(chars == 92)
+        run_ends = numpy.flatnonzero(numpy.diff(backslashes, append=-2) != 1)
+        run_starts = numpy.concatenate(([0], run_ends[:-1] + 1))
+        escaped = backslashes[run_ends[(run_ends - run_starts) % 2 == 0]] + 1
+        quotes[escaped[escaped < len(chars)]] = False
+    is_outside = numpy.cumsum(quotes.view(numpy.uint8), dtype=numpy.uint8)
+    is_outside &= 1
+    mask = chars == 123
+    mask |= chars == 91
+    mask |= chars == 125
+    mask |= chars == 93
+    mask |= chars == 44
+    mask |= chars == 58
+    mask &= is_outside == 0
+    positions = numpy.flatnonzero(mask).astype(numpy.int32 if len(data) < 2 ** 31 else numpy.int64)
+    tokens = chars[positions]
+    deltas = ((tokens == 123) | (tokens == 91)).view(numpy.int8)
+    deltas -= ((tokens == 125) | (tokens == 93)).view(numpy.int8)
+    ranks = numpy.cumsum(deltas, dtype=numpy.int32)
+    ranks -= deltas > 0
+    ranks *= 2
+    ranks += deltas != 0
+    return positions, ranks
+
+
+class _Structure:
+    """
+    Structural index of a JSON document, shared by all the views over it.
+
+    Tokens are numbered in document order; order lists them sorted by rank, and in document order within a rank, so
+    that the separators inside a value, and its closing bracket, are found by binary search.
+    """
+    __slots__ = ('data', 'codec', 'min_view_size', 'positions', 'order', 'rank_starts')
+
+    def __init__(self, data, codec, min_view_size):
+        positions, ranks = _index_tokens(data)
+        if not len(positions) or ranks[-1] != 1 or data[positions[-1]] not in b'}]' or ranks.min() != 1:
+            raise ValueError('malformed JSON document')
+        # Counting sort; there are few ranks:
+        groups = [numpy.flatnonzero(ranks == rank).astype(numpy.int32) for rank in range(int(ranks.max()) + 1)]
+        order = numpy.concatenate(groups)
+        rank_starts = [0]
+        for group in groups:
+            rank_starts.append(rank_starts[-1] + len(group))
+        rank_starts += [len(order)] * 2
+        if rank_starts[2] - rank_starts[1] != 2:
+            raise ValueError('malformed JSON document')
+        self.data = data
+        self.codec = codec
+        self.min_view_size = min_view_size
+        self.positions = positions
+        self.order = order
+        self.rank_starts = rank_starts
+
+    def separators(self, opener, level):
+        """
+        :param opener: Token of the opening bracket of an object or array
+        :param level: Level of the object or array
+        :return: (bracket and separator positions, separator tokens) tuple: the positions of the opening bracket,
+            the commas and colons inside, and the closing bracket; and the tokens of the commas and colons
+        """
+        order = self.order
+        rank_starts = self.rank_starts
+        start = rank_starts[level * 2 + 2]
+        end = rank_starts[level * 2 + 3]
+        # Search with keys of the array's own type, which numpy would otherwise convert the array to:
+        opener = numpy.int32(opener)
+        brackets = order[rank_starts[level * 2 + 1]:start]
+        closer = brackets[brackets.searchsorted(opener) + 1]
+        separators = order[start:end]
+        tokens = separators[separators.searchsorted(opener):separators.searchsorted(closer)]
+        positions = self.positions[tokens].tolist()
+        return [int(self.positions[opener])] + positions + [int(self.positions[closer])], tokens.tolist()
+
+    def value(self, token, start, end, level):
+        """
+        :param token: Token of the bracket or separator that precedes the value
+        :param start: Position of the first byte of the value
+        :param end: Position just past the last byte of the value
+        :param level: Level of the value
+        :return: ObjectView or ArrayView of an object or array value at least min_view_size bytes long, else the parsed
+            value
+        """
+        token += 1
+        if end - start >= self.min_view_size and token < len(self.positions) and self.positions[token] < end:
+            if self.data[self.positions[token]] == 123:
+                return ObjectView(self, token, level)
+            return ArrayView(self, token, level)
+        return self.codec.loads(self.data[start:end])
+
+
+class ObjectView(collections.abc.Mapping):
+    """
+    Read-only, lazily parsed view of a JSON object.
+    """
+    __slots__ = ('_structure', '_opener', '_level', '_members')
+
+    def __init__(self, structure, opener, level):
+        self._structure = structure
+        self._opener = opener
+        self._level = level
+        self._members = None
+
+    def _load_members(self):
+        structure = self._structure
+        data = structure.data
+        bounds, tokens = structure.separators(self._opener, self._level)
+        members = {}
+        if len(bounds) > 2 or data[bounds[0] + 1:bounds[1]].strip():
+            for i in range(0, len(bounds) - 1, 2):
+                key = data[bounds[i] + 1:bounds[i + 1]].strip()
+                key = key[1:-1].decode() if b'\\' not in key else json.loads(key)
+                members[key] = [tokens[i], bounds[i + 1] + 1, bounds[i + 2], _unparsed]
+        self._members = members
+        return members
+
+    def __getitem__(self, key):
+        members = self._members if self._members is not None else self._load_members()
+        member = members[key]
+        if member[3] is _unparsed:
+            member[3] = self._structure.value(member[0], member[1], member[2], self._level + 1)
+        return member[3]
+
+    def __iter__(self):
+        return iter(self._members if self._members is not None else self._load_members())
+
+    def __len__(self):
+        return len(self._members if self._members is not None else self._load_members())
+
+    def __contains__(self, key):
+        return key in (self._members if self._members is not None else self._load_members())
+
+    def materialize(self):
+        """
+        :return: The object parsed as a dict
+        """
+        structure = self._structure
+        bounds, _ = structure.separators(self._opener, self._level)
+        return structure.codec.loads(structure.data[bounds[0]:bounds[-1] + 1])
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+
+class ArrayView(collections.abc.Sequence):
+    """
+    Read-only, lazily parsed view of a JSON array.
+    """
+    __slots__ = ('_structure', '_opener', '_level', '_bounds', '_tokens', '_items')
+
+    def __init__(self, structure, opener, level):
+        self._structure = structure
+        self._opener = opener
+        self._level = level
+        self._items = None
+
+    def _load_bounds(self):
+        structure = self._structure
+        bounds, tokens = structure.separators(self._opener, self._level)
+        self._bounds = bounds
+        self._tokens = [self._opener] + tokens
+        if len(bounds) > 2 or structure.data[bounds[0] + 1:bounds[1]].strip():
+            self._items = [_unparsed] * (len(bounds) - 1)
+        else:
+            self._items = []
+        return self._items
+
+    def __getitem__(self, index):
+        items = self._items if self._items is not None else self._load_bounds()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(items)))]
+        item = items[index]
+        if item is _unparsed:
+            if index < 0:
+                index += len(items)
+            item = items[index] = self._structure.value(self._tokens[index], self._bounds[index] + 1,
+                                                        self._bounds[index + 1], self._level + 1)
+        return item
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self._items if self._items is not None else self._load_bounds())
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, ArrayView)):
+            return NotImplemented
+        return len(self) == len(other) and all(item == other_item for item, other_item in zip(self, other))
+
+    __hash__ = None
+
+    def materialize(self):
+        """
+        :return: The array parsed as a list
+        """
+        if self._items is None:
+            self._load_bounds()
+        return self._structure.codec.loads(self._structure.data[self._bounds[0]:self._bounds[-1] + 1])
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+
+def load_view(data, codec=JsonCodec, min_view_size=1024):
+    """
+    Load a JSON document lazily.
+
+    :param data: JSON bytes
+    :param codec: Codec used to parse values
+    :param min_view_size: Minimum length in bytes of an object or array that is viewed rather than parsed whole
+    :return: ObjectView or ArrayView of an object or array document at least min_view_size bytes long, if numpy is
+        installed, else the parsed document
+    :raise ValueError: If the document is malformed (errors inside values may only be raised when they are accessed)
+    """
+    if numpy is None or len(data) < min_view_size or data.lstrip()[:1] not in (b'{', b'['):
+        return codec.loads(data)
+    return _Structure(data, codec, min_view_size).value(-1, 0, len(data), 0)
+
+
+class _StreamReader:
+    """
+    Reader of JSON values from text decoded from a stream of bytes chunks, holding only the text not yet read.
+    """
+    __slots__ = ('_chunks', '_decoder', '_text', '_position', '_is_done')
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = encodings.utf_8.IncrementalDecoder()
+        self._text = ''
+        self._position = 0
+        self._is_done = False
+
+    def _fill(self):
+        """
+        :return: False if the stream is exhausted, else True once more text has been read
+        """
+        if self._is_done:
+            return False
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._text = self._text[self._position:] + text
+                self._position = 0
+                return True
+        self._text = self._text[self._position:] + self._decoder.decode(b'', True)
+        self._position = 0
+        self._is_done = True
+        return True
+
+    def next_char(self):
+        """
+        Skip whitespace, and consume the next character.
+
+        :return: Next character, or '' at the end of the stream
+        """
+        while True:
+            self._position = _whitespace.match(self._text, self._position).end()
+            if self._position < len(self._text):
+                self._position += 1
+                return self._text[self._position - 1]
+            if not self._fill():
+                return ''
+
+    def peek_char(self):
+        """
+        Skip whitespace.
+
+        :return: Next character, or '' at the end of the stream
+        """
+        char = self.next_char()
+        if char:
+            self._position -= 1
+        return char
+
+    def value(self):
+        """
+        Consume the next value; a value ending within two characters of the end of the text read so far (such as a
+        number cut short at '1.' or '1e+') is only taken once more text has been read, or the stream is exhausted.
+
+        :return: Parsed value
+        :raise ValueError: If the value is malformed
+        """
+        self.peek_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._text, self._position)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            if end + 2 < len(self._text) or not self._fill():
+                self._position = end
+                return value
+
+
+def iter_array_member(chunks, name, members=None):
+    """
+    Parse a JSON object incrementally, yielding the elements of one of its array members as soon as each is parsed.
+
+    :param chunks: Iterable of bytes chunks of the JSON object
+    :param name: Name of the array member
+    :param members: Dict to add the object's other members to as they are parsed, or None
+    :return: Generator of the elements of the array member
+    :raise ValueError: If the document is malformed
+    """
+    reader = _StreamReader(chunks)
+    if members is None:
+        members = {}
+    if reader.next_char() != '{':
+        raise ValueError('malformed JSON document')
+    if reader.peek_char() == '}':
+        reader.next_char()
+        return
+    while True:
+        key = reader.value()
+        if type(key) is not str or reader.next_char() != ':':
+            raise ValueError('malformed JSON document')
+        if key == name and reader.peek_char() == '[':
+            reader.next_char()
+            if reader.peek_char() == ']':
+                reader.next_char()
+            else:
+                while True:
+                    yield reader.value()
+                    char = reader.next_char()
+                    if char == ']':
+                        break
+                    if char != ',':
+                        raise ValueError('malformed JSON document')
+        else:
+            members[key] = reader.value()
+        char = reader.next_char()
+        if char == '}':
+            return
+        if char != ',':
+            raise ValueError('malformed JSON document')
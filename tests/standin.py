@@ -0,0 +1,213 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Stand-in Taranos Server for tests and benchmarks: a small in-memory model of the server's fields and trunks,
+# callable directly (through a LoopbackTransport) or served over HTTP/1.1 with keep-alive and response compression.
+#
+
+import gzip
+import http.server
+import itertools
+import json
+import threading
+import urllib.parse
+import zlib
+
+
+_reply_keys = {'f': 'rf', 'fe': 'rfe', 'fo': 'rfo', 's': 'rs', 'se': 'rse', 'so': 'rso', 'p': 'rp', 'pe': 'rpe',
+               'po': 'rpo', 'pc': 'rpc', 'smpe': 'rsmpe', 'smpo': 'rsmpo', 'w': 'rw', 't': 'rt', 'si': 'rsi',
+               'sp': 'rsp', 'ss': 'rss', 'sk': 'rsk', 'sl': 'rsl', 'st': 'rst', 'smi': 'rsmi', 'smb': 'rsmb',
+               'smo': 'rsmo', 'e': 'resmpo'}
+
+
+class StandinApp:
+    """
+    In-memory stand-in for the Taranos Server's request handling.
+
+    The cell's fields and trunks are kept, starting with a default field and trunk, and are created, reported, updated
+    and destroyed as the server would; elements within them are reported as they are queried, and writes to them are
+    acknowledged.  Creation reports carry the new element's key under its entity code, e.g. {'m': {'_f': 'f~a-0'}}.
+    """
+    def __init__(self, name='a'):
+        self.name = name
+        self.calls = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        # A cell starts with a default field and trunk:
+        self.fields = {'f~%s-default' % self.name: {'_f': 'f~%s-default' % self.name, 't': 'default'}}
+        self.trunks = {'t~%s-default' % self.name: {'_t': 't~%s-default' % self.name, 't': 'default'}}
+
+    def __call__(self, method, path, body):
+        with self._lock:
+            self.calls.append((method, path))
+            return self._handle(method, path, body)
+
+    def _handle(self, method, path, body):
+        url = urllib.parse.urlsplit(path)
+        steps = url.path.strip('/').split('/')
+        keys = [value for name, value in urllib.parse.parse_qsl(url.query) if name == 'k']
+        items = [json.loads(value) for _, value in urllib.parse.parse_qsl(body.decode('utf-8'))] if body else []
+
+        if steps[0] == 'tmp':
+            if method == 'DELETE':
+                self._reset()
+                return {'s': 0, 'r': 0}
+            return {'s': 0, 'r': 0, 'rc': {'mf': {'_f': 'f~%s-default' % self.name},
+                                           'mt': {'_t': 't~%s-default' % self.name}}}
+
+        code = steps[1]
+        store = self.fields if code == 'f' else self.trunks
+        reply_key = _reply_keys[code]
+        if len(steps) == 2:
+            if method == 'POST':
+                reports = []
+                for item in items:
+                    key = '%s~%s-%d' % (code, self.name, next(self._counter))
+                    store[key] = {'_' + code: key, 't': item['m']['t']}
+                    reports.append({'m': dict(store[key])})
+                return {'s': 0, 'r': 0, reply_key: reports}
+            if method == 'GET':
+                keys = keys or list(store)
+                if any(key not in store for key in keys):
+                    return {'s': 0, 'r': -101, 'e': 'unknown key'}
+                return {'s': 0, 'r': 0, reply_key: [{'m': dict(store[key]), 'shard': self.name} for key in keys]}
+            for item in items:
+                if item['m']['k'] not in store:
+                    return {'s': 0, 'r': -101, 'e': 'unknown key'}
+            for item in items:
+                if method == 'DELETE':
+                    del store[item['m']['k']]
+                elif 'n' in item['m']:
+                    store[item['m']['k']]['n'] = item['m']['n']
+            return {'s': 0, 'r': 0}
+
+        if steps[2] not in store:
+            return {'s': 0, 'r': -101, 'e': 'unknown field or trunk'}
+        code = steps[-1] if len(steps) % 2 == 0 else steps[-2]
+        reply_key = _reply_keys.get(code, 'r' + code)
+        if method == 'GET':
+            return {'s': 0, 'r': 0, reply_key: [{'m': {'_' + code: key, 't': 'tag'}, 'a': {'x': 1},
+                                                 's': {'p': ['0.1', '0.2']}, 'shard': self.name}
+                                                for key in keys]}
+        if method == 'POST':
+            return {'s': 0, 'r': 0, reply_key: [{'m': {'_' + code: '%s~%s-%d' % (code, self.name, next(self._counter)),
+                                                       't': item['m']['t']}}
+                                                for item in items]}
+        return {'s': 0, 'r': 0}
+
+
+class _ThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    request_queue_size = 128   # Fanned out clients connect many times at once.
+
+
+class StandinServer:
+    """
+    HTTP/1.1 server for a StandinApp on a free local port, with keep-alive connections and gzip or deflate response
+    compression as negotiated by Accept-Encoding.
+
+    Set stalled to block responses until resume() is called, drop_connections to close each connection after its
+    response without announcing it (as a server timing out idle keep-alive connections does), and lose_responses to
+    the number of requests to handle but close the connection of instead of answering.
+    """
+    def __init__(self, app=None, compress_threshold=200):
+        self.app = app if app is not None else StandinApp()
+        self.compress_threshold = compress_threshold
+        self.requests = []   # (method, path, request Content-Encoding, response Content-Encoding) tuples.
+        self.connections = set()
+        self.stalled = threading.Event()
+        self.drop_connections = False
+        self.lose_responses = 0
+        self._resume = threading.Condition()
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self.url = 'http://127.0.0.1:%d' % self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def resume(self):
+        with self._resume:
+            self.stalled.clear()
+            self._resume.notify_all()
+
+    def close(self):
+        self.resume()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True   # Headers and body are written separately.
+
+            def log_message(self, *args):
+                pass
+
+            def handle_request(self):
+                server.connections.add(self.client_address)
+                size = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(size) if size else b''
+                body_encoding = self.headers.get('Content-Encoding')
+                if body_encoding == 'gzip':
+                    body = gzip.decompress(body)
+                elif body_encoding == 'deflate':
+                    body = zlib.decompress(body)
+                with server._resume:
+                    while server.stalled.is_set():
+                        server._resume.wait()
+                response = server.app(self.command, self.path, body)
+                status = 200
+                if type(response) is tuple:
+                    status, response = response
+                data = response if type(response) is bytes else json.dumps(response).encode('utf-8')
+                accept_encoding = self.headers.get('Accept-Encoding', '')
+                content_encoding = None
+                if server.compress_threshold is not None and len(data) >= server.compress_threshold:
+                    if 'gzip' in accept_encoding:
+                        data, content_encoding = gzip.compress(data), 'gzip'
+                    elif 'deflate' in accept_encoding:
+                        data, content_encoding = zlib.compress(data), 'deflate'
+                server.requests.append((self.command, self.path, body_encoding, content_encoding))
+                with server._resume:
+                    is_lost = server.lose_responses > 0
+                    server.lose_responses -= is_lost
+                if is_lost:
+                    self.close_connection = True
+                    return
+                self.send_response(status)
+                if content_encoding:
+                    self.send_header('Content-Encoding', content_encoding)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                if server.drop_connections:
+                    self.close_connection = True
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_PUT = do_POST = do_DELETE = handle_request
+
+        return Handler
@@ -0,0 +1,69 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import os
+import unittest
+
+from taranoscsfpapi import aiorendering
+from taranoscsfpapi import rendering
+from taranoscsfpapi.aioapi import *
+from tests.standin import StandinApp
+from tools.generate_aio import generate_module, module_names, package_dir
+
+
+class GeneratedModulesTest(unittest.TestCase):
+    def test_modules_are_up_to_date(self):
+        for module_name in module_names:
+            with open(os.path.join(package_dir, 'aio%s.py' % module_name), newline='') as file:
+                self.assertEqual(file.read(), generate_module(module_name),
+                                 'aio%s.py is out of date: run python -m tools.generate_aio' % module_name)
+
+
+class AsyncSenderTest(unittest.TestCase):
+    def setUp(self):
+        self.session = Session('http://sync')
+        self.session.use_transport(LoopbackTransport(StandinApp()))
+        self.sender = AsyncSender('http://async')
+        self.sender.use_transport(AsyncLoopbackTransport(StandinApp()))
+
+    def _run(self, function_name, **kwargs):
+        async def run():
+            return await getattr(aiorendering, function_name)(session=self.sender, **kwargs)
+        return getattr(rendering, function_name)(session=self.session, **kwargs), asyncio.run(run())
+
+    def test_requests_match_session(self):
+        for name, kwargs in (('create_field', {'tag': 'one'}),
+                             ('report_fields', {'keys': ['f~a-default']}),
+                             ('update_field', {'key': 'f~a-default', 'name': 'renamed'}),
+                             ('report_subjects', {'field_key': 'f~a-default', 'keys': ['s~1', 's~2']})):
+            sync_result, async_result = self._run(name, **kwargs)
+            self.assertEqual(sync_result, async_result, name)
+        sync_stats, async_stats = self.session.stats(), self.sender.stats()
+        for name in ('requests', 'retries', 'breaker', 'compression'):
+            self.assertEqual(sync_stats[name], async_stats[name], name)
+
+    def test_server_errors_match_session(self):
+        with self.assertRaises(PapiException) as sync_context:
+            rendering.report_fields(keys=['f~unknown'], session=self.session)
+        with self.assertRaises(PapiException) as async_context:
+            asyncio.run(aiorendering.report_fields(keys=['f~unknown'], session=self.sender))
+        self.assertEqual(sync_context.exception.args, async_context.exception.args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+import unittest
+
+from taranoscsfpapi.rendering import *
+from tests.standin import StandinServer
+
+_field_key = 'f~a-default'
+
+
+class CoalescerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer()
+        self.session = Session(self.server.url)
+        self.session.retry_policy = None
+        self.session.coalescer = Coalescer(window=0.01)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.close()
+
+    def test_timer_flush_keeps_the_request_deadline(self):
+        self.server.stalled.set()
+        started = time.monotonic()
+        with request_deadline(0.3):
+            future = update_subject(field_key=_field_key, key='s~1', position=[0.1, 0.2], session=self.session)
+        self.assertIsInstance(future.exception(timeout=3.0), TimeoutError)
+        self.assertLess(time.monotonic() - started, 2.0)
+
+    def test_requests_under_different_deadlines_are_held_apart(self):
+        coalescer = self.session.coalescer
+        coalescer.window = None
+        futures = [update_subject(field_key=_field_key, key='s~1', position=[0.1, 0.2], session=self.session)]
+        with request_deadline(5.0):
+            futures += [update_subject(field_key=_field_key, key='s~%d' % i, position=[0.1, 0.2],
+                                       session=self.session)
+                        for i in range(2, 4)]
+        coalescer.flush()
+        for future in futures:
+            future.result(timeout=3.0)
+        self.assertEqual(coalescer.stats(), {'requests': 3, 'batches': 2, 'held': 0})
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import unittest
+import urllib.parse
+
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.rendering import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CodecTest(unittest.TestCase):
+    def test_json_is_the_default(self):
+        self.assertIs(get_codec(), JsonCodec)
+        self.assertIs(Session().codec, JsonCodec)
+        self.assertIs(AsyncSender().codec, JsonCodec)
+
+    def test_default_wire_format_is_unchanged(self):
+        update = {'m': {'k': 's~1', 'p': [0.5, float('nan')]}, 'a': {'x': 1}}
+        self.assertEqual(encode_form([update], 'us', get_codec()),
+                         urllib.parse.urlencode({'us': json.dumps(update)}).encode('ascii'))
+
+    def test_fastest_codec_is_opt_in(self):
+        self.assertIn(get_codec('fastest'), codecs.values())
+        with self.assertRaises(ValueError):
+            get_codec('unknown')
+
+    def test_fast_codecs_fall_back_to_json(self):
+        args = [{1: 'int key'}, {'k': 2 ** 70}]
+        if numpy is not None:
+            args.append({'p': [numpy.float64(0.25)]})
+        for codec in codecs.values():
+            for arg in args:
+                self.assertEqual(json.loads(codec.dumps(arg)), json.loads(json.dumps(arg)), codec.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from taranoscsfpapi import aiorendering
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.rendering import *
+from tests.standin import StandinServer
+
+_field_key = 'f~a-default'
+_subject_keys = ['s~%d' % i for i in range(50)]
+
+
+class CompressionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def _session(self, transport_name='pooled', accept_encoding='gzip, deflate', compress_threshold=None):
+        session = Session(self.server.url)
+        session.transport_name = transport_name
+        session.accept_encoding = accept_encoding
+        session.compress_threshold = compress_threshold
+        self.addCleanup(session.close)
+        return session
+
+    def test_responses_are_compressed_as_negotiated(self):
+        plain_session = self._session(accept_encoding=None)
+        plain_reports = report_subjects(field_key=_field_key, keys=_subject_keys, session=plain_session)
+        for transport_name in ('pooled', 'pipelined', 'urllib'):
+            for accept_encoding, content_encoding in (('gzip, deflate', 'gzip'), ('deflate', 'deflate')):
+                session = self._session(transport_name, accept_encoding)
+                reports = report_subjects(field_key=_field_key, keys=_subject_keys, session=session)
+                self.assertEqual(reports, plain_reports)
+                self.assertEqual(self.server.requests[-1][3], content_encoding, transport_name)
+                stats = session.stats()['compression']
+                self.assertEqual(stats['responses_compressed'], 1)
+                self.assertGreater(stats['response_ratio'], 5.0)
+        self.assertIsNone(self.server.requests[0][3])
+
+    def test_small_responses_are_not_compressed(self):
+        session = self._session()
+        report_subjects(field_key=_field_key, keys=_subject_keys[:1], session=session)
+        self.assertIsNone(self.server.requests[-1][3])
+        self.assertEqual(session.stats()['compression']['responses_compressed'], 0)
+
+    def test_request_bodies_are_compressed_above_threshold(self):
+        session = self._session(compress_threshold=1000)
+        updates = [SubjectUpdate(key, position=[0.1, 0.2]) for key in _subject_keys]
+        update_subjects(field_key=_field_key, updates=updates[:2], session=session)
+        update_subjects(field_key=_field_key, updates=updates, session=session)
+        self.assertEqual([request[2] for request in self.server.requests], [None, 'gzip'])
+        stats = session.stats()['compression']
+        self.assertEqual(stats['requests_compressed'], 1)
+        self.assertGreater(stats['request_ratio'], 2.0)
+
+    def test_streamed_responses_are_decompressed(self):
+        api_spec = 'trp/f/%s/s%s' % (_field_key, SubjectQuery(_subject_keys)())
+        streamed_data = b''.join(self._session().stream(api_spec))
+        plain_data = self._session(accept_encoding=None).transport().request('GET', api_spec)[3]
+        self.assertEqual(streamed_data, plain_data)
+        self.assertEqual([request[3] for request in self.server.requests], ['gzip', None])
+
+    def test_async_sender_negotiates_compression(self):
+        sender = AsyncSender(self.server.url)
+
+        async def run():
+            try:
+                return await aiorendering.report_subjects(field_key=_field_key, keys=_subject_keys, session=sender)
+            finally:
+                sender.close()
+
+        self.assertEqual(len(asyncio.run(run())), len(_subject_keys))
+        self.assertEqual(self.server.requests[-1][3], 'gzip')
+        self.assertEqual(sender.stats()['compression']['responses_compressed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import http.client
+import unittest
+import urllib.parse
+
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.sender import *
+from tests.standin import StandinServer
+
+_create_body = urllib.parse.urlencode({'f': '{"m": {"t": "new"}}'}).encode('utf-8')
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer()
+        self.pool = ConnectionPool(self.server.url)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.close()
+
+    def test_get_is_resent_after_lost_response(self):
+        self.assertEqual(self.pool.request('GET', 'tmp/c')[0], 200)
+        self.server.lose_responses = 1
+        self.assertEqual(self.pool.request('GET', 'tmp/c')[0], 200)
+        self.assertEqual([request[0] for request in self.server.requests], ['GET', 'GET', 'GET'])
+        self.assertEqual(self.pool.stats()['reconnected'], 1)
+
+    def test_post_is_not_resent_after_lost_response(self):
+        self.assertEqual(self.pool.request('GET', 'tmp/c')[0], 200)
+        self.server.lose_responses = 1
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.pool.request('POST', 'trp/f', _create_body)
+        self.assertEqual([request[0] for request in self.server.requests], ['GET', 'POST'])
+        self.assertEqual(len(self.server.app.fields), 2)
+
+    def test_post_is_not_resent_over_dropped_connection(self):
+        self.assertEqual(self.pool.request('GET', 'tmp/c')[0], 200)
+        self.server.lose_responses = 1
+        with self.assertRaises(ConnectionError):
+            self.pool.request('POST', 'trp/f', _create_body)
+        self.assertEqual(self.pool.request('POST', 'trp/f', _create_body)[0], 200)
+        self.assertEqual([request[0] for request in self.server.requests], ['GET', 'POST', 'POST'])
+        self.assertEqual(len(self.server.app.fields), 3)
+        self.assertEqual(self.pool.stats()['reconnected'], 0)
+
+
+class AsyncConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def _run(self, *requests):
+        async def run():
+            pool = AsyncConnectionPool(self.server.url)
+            try:
+                await pool.request('GET', 'tmp/c')
+                self.server.lose_responses = 1
+                return [await pool.request(*request) for request in requests], pool.stats()
+            finally:
+                pool.close()
+        return asyncio.run(run())
+
+    def test_get_is_resent_after_lost_response(self):
+        responses, stats = self._run(('GET', 'tmp/c'))
+        self.assertEqual(responses[0][0], 200)
+        self.assertEqual(stats['reconnected'], 1)
+
+    def test_post_is_not_resent_after_lost_response(self):
+        with self.assertRaises(ConnectionError):
+            self._run(('POST', 'trp/f', _create_body))
+        self.assertEqual([request[0] for request in self.server.requests], ['GET', 'POST'])
+        self.assertEqual(len(self.server.app.fields), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import unittest
+
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.sender import *
+
+_report = {'s': 0, 'r': 0, 'rf': []}
+
+
+def wait_until(predicate, timeout=3.0):
+    limit = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > limit:
+            raise AssertionError('condition not reached')
+        time.sleep(0.001)
+
+
+class GatedHandler:
+    # Handler for a LoopbackTransport, holding the requests of the gated methods until the gate is opened.
+    def __init__(self, error=None):
+        self.requests = []
+        self.gate = threading.Event()
+        self.gated_methods = ('GET', 'PUT')
+        self.error = error
+
+    def __call__(self, method, path, body):
+        self.requests.append((method, path))
+        if method in self.gated_methods and not self.gate.wait(3.0):
+            raise AssertionError('gate not opened')
+        if self.error is not None:
+            raise self.error
+        return _report
+
+
+class InflightGetsTest(unittest.TestCase):
+    def setUp(self):
+        self.handler = GatedHandler()
+        self.session = Session('http://standin')
+        self.session.retry_policy = None
+        self.session.use_transport(LoopbackTransport(self.handler))
+        self.session.inflight_gets = InflightGets()
+        self.executor = concurrent.futures.ThreadPoolExecutor(8)
+
+    def tearDown(self):
+        self.handler.gate.set()
+        self.executor.shutdown()
+
+    def get_all(self, count, api_spec='trp/f'):
+        futures = [self.executor.submit(self.session.get, api_spec) for _ in range(count)]
+        wait_until(lambda: self.session.inflight_gets.stats()['shared'] == count - 1)
+        self.handler.gate.set()
+        return futures
+
+    def test_identical_gets_send_one_request(self):
+        futures = self.get_all(5)
+        responses = [future.result(3.0) for future in futures]
+        self.assertEqual(self.handler.requests, [('GET', 'trp/f')])
+        self.assertTrue(all(response is responses[0] for response in responses))
+        self.assertEqual(self.session.inflight_gets.stats(), {'sent': 1, 'shared': 4, 'in_flight': 0})
+
+    def test_different_gets_are_not_shared(self):
+        futures = [self.executor.submit(self.session.get, api_spec) for api_spec in ('trp/f', 'trp/f?k=f~1')]
+        wait_until(lambda: len(self.handler.requests) == 2)
+        self.handler.gate.set()
+        for future in futures:
+            future.result(3.0)
+        self.assertEqual(self.session.inflight_gets.stats()['shared'], 0)
+
+    def test_failure_reaches_every_waiter(self):
+        self.handler.error = TimeoutError('timed out')
+        futures = self.get_all(4)
+        for future in futures:
+            self.assertIsInstance(future.exception(3.0), TimeoutError)
+        self.assertEqual(len(self.handler.requests), 1)
+        self.assertEqual(self.session.inflight_gets.stats()['in_flight'], 0)
+
+    def test_puts_are_never_shared(self):
+        futures = [self.executor.submit(self.session.request, 'PUT', 'trp/f/f~1/s', b'us=%7B%7D') for _ in range(3)]
+        wait_until(lambda: len(self.handler.requests) == 3)
+        self.handler.gate.set()
+        for future in futures:
+            future.result(3.0)
+        self.assertEqual(self.session.inflight_gets.stats()['sent'], 0)
+
+    def test_put_detaches_gets_in_flight(self):
+        self.handler.gated_methods = ('GET',)
+        first = self.executor.submit(self.session.get, 'trp/f')
+        wait_until(lambda: len(self.handler.requests) == 1)
+        self.session.put({'m': {'k': 'f~1'}}, 'uf', 'trp/f')
+        second = self.executor.submit(self.session.get, 'trp/f')
+        wait_until(lambda: len(self.handler.requests) == 3)
+        self.handler.gate.set()
+        first.result(3.0)
+        second.result(3.0)
+        self.assertEqual(self.handler.requests, [('GET', 'trp/f'), ('PUT', 'trp/f'), ('GET', 'trp/f')])
+        self.assertEqual(self.session.inflight_gets.stats()['shared'], 0)
+
+    def test_interrupted_leader_releases_its_followers(self):
+        inflight_gets = InflightGets()
+        release = threading.Event()
+
+        def fetch():
+            release.wait(3.0)
+            raise KeyboardInterrupt
+
+        leader = self.executor.submit(inflight_gets.call, 'trp/f', fetch)
+        wait_until(lambda: inflight_gets.stats()['in_flight'] == 1)
+        follower = self.executor.submit(inflight_gets.call, 'trp/f', lambda: _report)
+        wait_until(lambda: inflight_gets.stats()['shared'] == 1)
+        release.set()
+        self.assertIsInstance(leader.exception(3.0), KeyboardInterrupt)
+        self.assertIsInstance(follower.exception(3.0), KeyboardInterrupt)
+        self.assertIs(inflight_gets.call('trp/f', lambda: _report), _report)
+
+
+class GatedAsyncTransport(Transport):
+    # Asynchronous transport holding every request until the gate is opened.
+    def __init__(self, error=None):
+        self.requests = []
+        self.gate = asyncio.Event()
+        self.error = error
+
+    async def request(self, method, path, body=None, headers=None, timeout=None):
+        self.requests.append((method, path))
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return 200, 'OK', {}, JsonCodec.dumps(_report).encode('utf-8')
+
+
+class AsyncInflightGetsTest(unittest.TestCase):
+    def run_sender(self, test, error=None):
+        async def run():
+            transport = GatedAsyncTransport(error)
+            sender = AsyncSender('http://standin')
+            sender.retry_policy = None
+            sender.use_transport(transport)
+            sender.inflight_gets = AsyncInflightGets()
+            return await test(sender, transport)
+        return asyncio.run(run())
+
+    @staticmethod
+    async def settle():
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    def test_identical_gets_send_one_request(self):
+        async def test(sender, transport):
+            tasks = [asyncio.create_task(sender.get('trp/f')) for _ in range(5)]
+            await self.settle()
+            transport.gate.set()
+            responses = await asyncio.gather(*tasks)
+            self.assertEqual(transport.requests, [('GET', 'trp/f')])
+            self.assertTrue(all(response is responses[0] for response in responses))
+            self.assertEqual(sender.inflight_gets.stats(), {'sent': 1, 'shared': 4, 'in_flight': 0})
+        self.run_sender(test)
+
+    def test_failure_reaches_every_waiter(self):
+        async def test(sender, transport):
+            tasks = [asyncio.create_task(sender.get('trp/f')) for _ in range(4)]
+            await self.settle()
+            transport.gate.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            self.assertTrue(all(isinstance(result, TimeoutError) for result in results), results)
+            self.assertEqual(len(transport.requests), 1)
+        self.run_sender(test, TimeoutError('timed out'))
+
+    def test_puts_are_never_shared(self):
+        async def test(sender, transport):
+            tasks = [asyncio.create_task(sender.request('PUT', 'trp/f/f~1/s', b'us=%7B%7D')) for _ in range(3)]
+            await self.settle()
+            self.assertEqual(len(transport.requests), 3)
+            transport.gate.set()
+            await asyncio.gather(*tasks)
+            self.assertEqual(sender.inflight_gets.stats()['sent'], 0)
+        self.run_sender(test)
+
+    def test_cancelled_leader_leaves_followers_waiting(self):
+        async def test(sender, transport):
+            leader = asyncio.create_task(sender.get('trp/f'))
+            await self.settle()
+            followers = [asyncio.create_task(sender.get('trp/f')) for _ in range(3)]
+            await self.settle()
+            leader.cancel()
+            await self.settle()
+            transport.gate.set()
+            responses = await asyncio.gather(*followers)
+            self.assertTrue(leader.cancelled())
+            self.assertEqual(responses, [_report] * 3)
+            self.assertEqual(transport.requests, [('GET', 'trp/f')])
+        self.run_sender(test)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import concurrent.futures
+import time
+import unittest
+
+from taranoscsfpapi.rendering import *
+from tests.standin import StandinServer
+
+
+class PipelinedTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandinServer()
+        self.transport = PipelinedTransport(self.server.url, window=2)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.close()
+
+    def test_concurrent_requests_share_one_connection(self):
+        session = Session(self.server.url)
+        session.use_transport(self.transport)
+        field_key = 'f~a-default'
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            reports = list(executor.map(lambda i: report_subject(field_key=field_key, key='s~%d' % i, session=session),
+                                        range(64)))
+        self.assertEqual([report['m']['_s'] for report in reports], ['s~%d' % i for i in range(64)])
+        stats = self.transport.stats()
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['requests'], 64)
+        self.assertLessEqual(stats['max_in_flight'], 2)
+
+    def test_timed_out_requests_free_their_window_slots(self):
+        self.server.stalled.set()
+        for _ in range(3):
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                self.transport.request('GET', 'tmp/c', timeout=0.3)
+            self.assertLess(time.monotonic() - started, 1.0)
+        self.server.resume()
+        status, _, _, data = self.transport.request('GET', 'tmp/c', timeout=5.0)
+        self.assertEqual(status, 200)
+        self.assertEqual(self.transport.stats()['in_flight'], 0)
+
+    def test_full_window_times_out(self):
+        self.server.stalled.set()
+        futures = [self.transport.submit('GET', 'tmp/c') for _ in range(2)]
+        started = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            self.transport.submit('GET', 'tmp/c', timeout=0.2)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.server.resume()
+        self.assertEqual([future.result(5.0)[0] for future in futures], [200, 200])
+
+    def test_session_deadline_applies(self):
+        session = Session(self.server.url)
+        session.use_transport(self.transport)
+        session.retry_policy = None
+        self.server.stalled.set()
+        for _ in range(3):
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                with request_deadline(0.3):
+                    session.get('tmp/c')
+            self.assertLess(time.monotonic() - started, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import os
+import tempfile
+import unittest
+
+from taranoscsfpapi.replay import *
+from tests.standin import StandinApp, StandinServer
+
+
+class RecordingTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'traffic.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_failures_and_streams_are_recorded(self):
+        with StandinServer() as server:
+            session = Session(server.url)
+            session.retry_policy = None
+            session.start_recording(self.path)
+            session.request('GET', 'tmp/c')
+            server.stalled.set()
+            with self.assertRaises(TimeoutError):
+                session.request('GET', 'tmp/c', timeout=0.2)
+            server.resume()
+            streamed_data = b''.join(session.stream('trp/f'))
+            session.stop_recording()
+            session.close()
+
+        records = list(read_traffic(self.path))
+        self.assertEqual([(record.method, record.api_spec, record.status) for record in records],
+                         [('GET', 'tmp/c', 200), ('GET', 'tmp/c', None), ('GET', 'trp/f', 200)])
+        self.assertIsNone(records[0].error)
+        self.assertIsNone(records[1].response_data)
+        self.assertTrue(records[1].error.startswith('TimeoutError'))
+        self.assertEqual(records[2].response_data, streamed_data)
+
+    def test_replay_counts_failures_as_errors(self):
+        recorder = TrafficRecorder(self.path)
+        response_data = json.dumps({'s': 0, 'r': 0, 'rf': []}).encode('utf-8')
+        recorder.record(0.0, 'GET', 'trp/f', None, 200, response_data, 0.001)
+        recorder.record(0.0, 'GET', 'trp/f', None, 200, b'not json', 0.001)
+        recorder.record(0.0, 'GET', 'trp/f', None, None, None, 0.2, 'TimeoutError: timed out')
+        recorder.close()
+
+        app = StandinApp()
+        app.fields.clear()
+        session = Session('http://replay')
+        session.use_transport(LoopbackTransport(app))
+        report = replay_traffic(self.path, session=session, speed=None)
+        self.assertEqual((report.request_count, report.error_count, report.mismatch_count), (3, 1, 0))
+        self.assertEqual(report.errors[0][0].response_data, b'not json')
+        self.assertIsInstance(report.errors[0][1], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+import numpy
+
+from taranoscsfpapi.rendering import *
+
+
+class BulkValidationTest(unittest.TestCase):
+    positions = [[0.1, -0.2], [1.0, -1.0], [0, 1], [0.333, 0.5]]
+    rotations = [[0.1], [-1.0], [1], [0.25]]
+
+    def test_positions_match_per_item_validation(self):
+        expected = [check_position_arg(position) for position in self.positions]
+        self.assertEqual(check_position_args(numpy.array(self.positions, dtype=float)),
+                         [check_position_arg([float(x) for x in position]) for position in self.positions])
+        self.assertEqual(check_position_args(numpy.array([[0, 1], [-1, 0]])), [['0', '1'], ['-1', '0']])
+        self.assertEqual(check_position_args(self.positions), expected)
+
+    def test_rotations_match_per_item_validation(self):
+        expected = [check_rotation_arg([float(rotation[0])]) for rotation in self.rotations]
+        array = numpy.array(self.rotations, dtype=float)
+        self.assertEqual(check_rotation_args(array), expected)
+        self.assertEqual(check_rotation_args(array.ravel()), expected)
+        self.assertEqual(check_rotation_args(self.rotations), [check_rotation_arg(r) for r in self.rotations])
+
+    def test_empty_batches(self):
+        self.assertEqual(check_position_args(numpy.zeros((0, 2))), [])
+        self.assertEqual(check_rotation_args(numpy.zeros(0)), [])
+        self.assertEqual(check_position_args([]), [])
+
+    def test_out_of_bounds_row_is_rejected(self):
+        for bad_row in ([0.5, 1.5], [-1.01, 0.0]):
+            with self.assertRaises(PapiException):
+                check_position_args(numpy.array(self.positions + [bad_row]))
+            with self.assertRaises(PapiException):
+                check_position_args(self.positions + [bad_row])
+        with self.assertRaises(PapiException):
+            check_rotation_args(numpy.array([0.5, -2.0, 0.0]))
+        with self.assertRaises(PapiException):
+            check_rotation_args(self.rotations + [[2.0]])
+
+    def test_malformed_array_is_rejected(self):
+        for array in (numpy.zeros((3, 3)), numpy.zeros(4), numpy.zeros((2, 2, 2)), numpy.array([['a', 'b']])):
+            with self.assertRaises(PapiException):
+                check_position_args(array)
+        for array in (numpy.zeros((3, 2)), numpy.array(['a'])):
+            with self.assertRaises(PapiException):
+                check_rotation_args(array)
+
+
+
+class ColumnarUpdateTest(unittest.TestCase):
+    keys = ['s~1', 's~2', 's~3']
+    positions = [[0.1, -0.2], [1.0, -1.0], [0.5, 0.25]]
+    rotations = [[0.1], [-1.0], [0.75]]
+
+    def per_item_updates(self, update_class, positions=None, rotations=None, names=None):
+        return [update_class(key,
+                             name=names[i] if names else None,
+                             position=positions[i] if positions else None,
+                             rotation=rotations[i] if rotations else None)
+                for i, key in enumerate(self.keys)]
+
+    def test_made_updates_match_per_item_updates(self):
+        for make, update_class in ((make_subject_updates, SubjectUpdate), (make_probe_updates, ProbeUpdate)):
+            updates = make(self.keys, numpy.array(self.positions), numpy.array(self.rotations))
+            self.assertEqual([type(update) for update in updates], [update_class] * len(self.keys))
+            self.assertEqual([update() for update in updates],
+                             [update() for update in self.per_item_updates(update_class, self.positions,
+                                                                           self.rotations)])
+
+    def test_batch_bodies_match_per_item_bodies(self):
+        names = ['a', None, 'c']
+        for codec in (JsonCodec, get_codec('fastest')):
+            for positions, rotations, batch_names in ((self.positions, self.rotations, None),
+                                                      (self.positions, None, None),
+                                                      (None, self.rotations, None),
+                                                      (self.positions, self.rotations, names)):
+                batch = SpatialUpdateBatch(self.keys,
+                                           numpy.array(positions) if positions else None,
+                                           numpy.array(rotations) if rotations else None,
+                                           batch_names)
+                updates = self.per_item_updates(SubjectUpdate, positions, rotations, batch_names)
+                self.assertEqual(batch.request_dicts(), [update() for update in updates])
+                self.assertEqual(encode_form(batch, 'us', codec), encode_form(updates, 'us', codec))
+
+    def test_unsafe_keys_are_encoded_like_per_item_updates(self):
+        keys = ['s~ 1', 's~&2', 's~\u00e93']
+        batch = SpatialUpdateBatch(keys, self.positions)
+        updates = [SubjectUpdate(key, position=position) for key, position in zip(keys, self.positions)]
+        self.assertEqual(encode_form(batch, 'us'), encode_form(updates, 'us'))
+
+    def test_columnar_updates_send_per_item_requests(self):
+        requests = []
+
+        def handler(method, path, body):
+            requests.append((method, path, body))
+            return {'s': 0, 'r': 0}
+
+        session = Session('http://standin')
+        session.use_transport(LoopbackTransport(handler))
+        for update_columnar, update_items, update_class in (
+                (update_subjects_columnar, update_subjects, SubjectUpdate),
+                (update_probes_columnar, update_probes, ProbeUpdate)):
+            update_columnar(field_key='F', keys=self.keys, positions=numpy.array(self.positions),
+                            rotations=self.rotations, session=session)
+            update_items(field_key='F', updates=self.per_item_updates(update_class, self.positions, self.rotations),
+                         session=session)
+            self.assertEqual(requests[-2], requests[-1])
+        self.assertEqual([request[1] for request in requests], ['trp/f/F/s'] * 2 + ['trp/f/F/p'] * 2)
+
+    def test_column_length_mismatch_is_rejected(self):
+        with self.assertRaises(PapiException):
+            SpatialUpdateBatch(self.keys, numpy.array(self.positions[:2]))
+        with self.assertRaises(PapiException):
+            SpatialUpdateBatch(self.keys, names=['a'])
+        with self.assertRaises(PapiException):
+            make_subject_updates(self.keys, rotations=self.rotations + [[0.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from taranoscsfpapi.api import ReportCache
+
+OK = {'s': 0, 'r': 0, 'rs': []}
+
+
+class ReportCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = ReportCache(ttl=10.0, clock=lambda: self.now)
+
+    def fill(self, *api_specs):
+        for api_spec in api_specs:
+            self.cache.put(api_spec, OK, self.cache.generation_of(api_spec))
+
+    def cached(self, *api_specs):
+        return [api_spec for api_spec in api_specs if self.cache.get(api_spec) is not None]
+
+    def test_update_drops_queries_for_its_keys(self):
+        specs = ['trp/f/F/s?k=s1', 'trp/f/F/s?k=s2', 'trp/f/F/s', 'trp/f/F/s/s1/pe', 'trp/f/G/s?k=s1']
+        self.fill(*specs)
+        self.cache.invalidate('trp/f/F/s', 'PUT', [{'k': 's1'}])
+        self.assertEqual(self.cached(*specs), ['trp/f/F/s?k=s2', 'trp/f/G/s?k=s1'])
+
+    def test_update_with_unknown_keys_drops_its_entity_type(self):
+        specs = ['trp/f/F/s?k=s1', 'trp/f/F/s?k=s2', 'trp/f/F/fe']
+        self.fill(*specs)
+        self.cache.invalidate('trp/f/F/s', 'PUT', [lambda: None])
+        self.assertEqual(self.cached(*specs), ['trp/f/F/fe'])
+
+    def test_create_and_destroy_drop_their_field(self):
+        for method in ('POST', 'DELETE'):
+            specs = ['trp/f/F/s', 'trp/f/F/fo', 'trp/f?k=F', 'trp/f?k=G', 'trp/f/G/s']
+            self.fill(*specs)
+            self.cache.invalidate('trp/f/F/s', method, [{'k': 's1'}])
+            self.assertEqual(self.cached(*specs), ['trp/f?k=G', 'trp/f/G/s'], method)
+
+    def test_call_drops_its_field(self):
+        # A field emitter's create_channel macro adds oscillators and patches to the field:
+        specs = ['trp/f/F/fe?k=fe1', 'trp/f/F/fo', 'trp/f/F/smpe', 'trp/f/F/smpo/p1/e', 'trp/f/G/fo']
+        self.fill(*specs)
+        self.cache.invalidate('trp/f/F/fe/m', 'PUT', [{'k': 'fe1', 'm': {'create_channel': {}}}])
+        self.assertEqual(self.cached(*specs), ['trp/f/G/fo'])
+
+    def test_field_update_drops_its_reports(self):
+        specs = ['trp/f?k=F', 'trp/f', 'trp/f/F/s', 'trp/f/G/s']
+        self.fill(*specs)
+        self.cache.invalidate('trp/f', 'PUT', [{'k': 'F'}])
+        self.assertEqual(self.cached(*specs), ['trp/f/G/s'])
+
+    def test_cell_destroy_drops_everything(self):
+        specs = ['trp/f/F/s', 'trp/f', 'tsp/t/T/sp']
+        self.fill(*specs)
+        self.cache.invalidate('tmp/c', 'DELETE', None)
+        self.assertEqual(self.cached(*specs), [])
+
+    def test_invalidation_is_scoped_to_its_field(self):
+        f_generation = self.cache.generation_of('trp/f/F/s')
+        g_generation = self.cache.generation_of('trp/f/G/s')
+        self.cache.invalidate('trp/f/F/s', 'PUT', [{'k': 's1'}])
+        self.cache.put('trp/f/F/s', OK, f_generation)
+        self.cache.put('trp/f/G/s', OK, g_generation)
+        self.assertEqual(self.cached('trp/f/F/s', 'trp/f/G/s'), ['trp/f/G/s'])
+
+    def test_cell_destroy_invalidates_every_scope(self):
+        generation = self.cache.generation_of('trp/f/G/s')
+        self.cache.invalidate('tmp/c', 'DELETE', None)
+        self.cache.put('trp/f/G/s', OK, generation)
+        self.assertEqual(self.cached('trp/f/G/s'), [])
+
+    def test_entries_expire(self):
+        self.cache.ttls['fo'] = 1.0
+        self.fill('trp/f/F/s', 'trp/f/F/fo', 'trp/f/F/w')
+        self.now = 5.0
+        self.assertEqual(self.cached('trp/f/F/s', 'trp/f/F/fo', 'trp/f/F/w'), ['trp/f/F/s'])
+        self.assertEqual(self.cache.stats()['expirations'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import time
+import unittest
+
+from taranoscsfpapi import aiomanagement
+from taranoscsfpapi.aioapi import *
+from taranoscsfpapi.management import *
+from tests.standin import StandinApp, StandinServer
+
+
+class FailingApp(StandinApp):
+    """
+    StandinApp answering its first failure_count requests with a 503.
+    """
+    def __init__(self, failure_count):
+        super().__init__()
+        self.failure_count = failure_count
+
+    def _handle(self, method, path, body):
+        if len(self.calls) <= self.failure_count:
+            return 503, {'e': 'unavailable'}
+        return super()._handle(method, path, body)
+
+
+class StalledTransport(Transport):
+    async def request(self, method, path, body=None, headers=None, timeout=None):
+        await asyncio.Event().wait()
+
+
+def make_session(app):
+    session = Session('http://standin')
+    session.use_transport(LoopbackTransport(app))
+    session.retry_policy = RetryPolicy(max_attempts=3, backoff=0.001, max_backoff=0.001)
+    return session
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_only_listed_methods_are_retried(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertIsNotNone(policy.next_delay('GET', 1))
+        self.assertIsNone(policy.next_delay('GET', 3))
+        self.assertIsNone(policy.next_delay('PUT', 1))
+        self.assertIsNone(policy.next_delay('POST', 1))
+        self.assertIsNotNone(RetryPolicy(methods=('GET', 'PUT')).next_delay('PUT', 1))
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(max_attempts=10, backoff=0.1, max_backoff=0.3)
+        for attempt in range(1, 10):
+            self.assertLessEqual(policy.next_delay('GET', attempt), 0.3)
+
+    def test_retries_stop_at_the_deadline(self):
+        policy = RetryPolicy(backoff=1.0)
+        with request_deadline(0.5):
+            self.assertIsNone(policy.next_delay('GET', 1))
+
+    def test_session_retries_unavailable_server(self):
+        app = FailingApp(2)
+        session = make_session(app)
+        self.assertEqual(session.request('GET', 'tmp/c')['r'], 0)
+        self.assertEqual(len(app.calls), 3)
+        self.assertEqual(session.stats()['retries']['retries'], 2)
+
+    def test_session_does_not_retry_post(self):
+        app = FailingApp(1)
+        session = make_session(app)
+        self.assertEqual(session.request('POST', 'trp/f'), {})
+        self.assertEqual(len(app.calls), 1)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_transitions(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.closed)
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.open)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        time.sleep(0.06)
+        breaker.before_request()
+        self.assertEqual(breaker.state, CircuitBreaker.half_open)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.open)
+
+        time.sleep(0.06)
+        breaker.before_request()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.closed)
+        self.assertEqual(breaker.stats(), {'state': 'closed', 'consecutive_failures': 0, 'opened': 2, 'rejected': 2})
+
+    def test_session_opens_circuit_on_failures(self):
+        app = FailingApp(100)
+        session = make_session(app)
+        session.retry_policy = None
+        session.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+        for _ in range(3):
+            self.assertEqual(session.request('GET', 'tmp/c'), {})
+        with self.assertRaises(CircuitOpenError):
+            session.request('GET', 'tmp/c')
+        self.assertEqual(len(app.calls), 3)
+
+    def test_cancelled_trial_is_released(self):
+        sender = AsyncSender('http://standin')
+        sender.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        sender.breaker.record_failure()
+        time.sleep(0.02)
+
+        async def run():
+            sender.use_transport(StalledTransport())
+            trial = asyncio.ensure_future(aiomanagement.report_cell(session=sender))
+            await asyncio.sleep(0.01)
+            trial.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await trial
+            sender.use_transport(AsyncLoopbackTransport(StandinApp()))
+            return await sender.request('GET', 'tmp/c')
+
+        self.assertEqual(asyncio.run(run())['r'], 0)
+        self.assertEqual(sender.breaker.state, CircuitBreaker.closed)
+
+    def test_interrupted_trial_is_released(self):
+        def interrupt(method, path, body):
+            raise KeyboardInterrupt
+
+        session = make_session(interrupt)
+        session.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        session.breaker.record_failure()
+        time.sleep(0.02)
+        with self.assertRaises(KeyboardInterrupt):
+            session.request('GET', 'tmp/c')
+        session.use_transport(LoopbackTransport(StandinApp()))
+        self.assertEqual(session.request('GET', 'tmp/c')['r'], 0)
+
+
+class RequestDeadlineTest(unittest.TestCase):
+    def test_nested_deadlines_only_shorten(self):
+        self.assertIsNone(current_deadline())
+        with request_deadline(5.0) as outer:
+            with request_deadline(10.0) as inner:
+                self.assertEqual(inner, outer)
+            with request_deadline(1.0) as inner:
+                self.assertLess(inner, outer)
+                self.assertEqual(current_deadline(), inner)
+            self.assertEqual(current_deadline(), outer)
+        self.assertIsNone(current_deadline())
+
+    def test_passed_deadline_sends_nothing(self):
+        app = StandinApp()
+        session = make_session(app)
+        with request_deadline(0.0):
+            with self.assertRaises(DeadlineExceeded):
+                session.request('GET', 'tmp/c')
+        self.assertEqual(app.calls, [])
+        self.assertEqual(session.stats()['retries']['deadlines_exceeded'], 1)
+
+    def test_deadline_bounds_requests_and_retries(self):
+        with StandinServer() as server:
+            session = Session(server.url)
+            server.stalled.set()
+            started = time.monotonic()
+            with request_deadline(0.3):
+                with self.assertRaises(TimeoutError):
+                    session.request('GET', 'tmp/c')
+            self.assertLess(time.monotonic() - started, 2.0)
+            server.resume()
+            session.close()
+
+    def test_async_timeout_is_counted_and_raised(self):
+        sender = AsyncSender('http://standin')
+        sender.retry_policy = None
+        sender.use_transport(StalledTransport())
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(sender.request('GET', 'tmp/c', timeout=0.05))
+        self.assertEqual(sender.stats()['retries']['timeouts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
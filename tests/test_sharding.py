@@ -0,0 +1,86 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from taranoscsfpapi.sharding import *
+from tests.standin import StandinApp
+
+
+class ShardedSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.apps = [StandinApp(name) for name in 'abc']
+        self.session = ShardedSession(['http://a', 'http://b', 'http://c'])
+        for shard, app in zip(self.session.shards, self.apps):
+            shard.use_transport(LoopbackTransport(app))
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_created_fields_are_routed_to_their_shards(self):
+        reports = create_fields(constructors=[FieldConstructor(tag='tag%d' % i) for i in range(9)],
+                                session=self.session)
+        keys = [FieldReport.decode(report).key for report in reports]
+        self.assertEqual(len(set(keys)), 9)
+        self.assertEqual(sum(self.session.stats()['loads']), 9)
+
+        reported = report_fields(keys=keys[::-1], session=self.session)
+        self.assertEqual([FieldReport.decode(report).key for report in reported], keys[::-1])
+        for key in keys:
+            shard_name = key.split('~')[1].split('-')[0]
+            calls_before = [len(app.calls) for app in self.apps]
+            self.assertEqual(report_field(key=key, session=self.session)['shard'], shard_name)
+            self.assertEqual(report_subject(field_key=key, key='s~1', session=self.session)['shard'], shard_name)
+            # Known routes need no lookups on the other shards:
+            self.assertEqual([len(app.calls) - count for app, count in zip(self.apps, calls_before)],
+                             [2 if app.name == shard_name else 0 for app in self.apps])
+
+    def test_created_trunks_are_routed_to_their_shards(self):
+        reports = create_trunks(constructors=[TrunkConstructor(tag='tag%d' % i) for i in range(4)],
+                                session=self.session)
+        keys = [TrunkReport.decode(report).key for report in reports]
+        self.assertTrue(all(keys))
+        self.assertEqual(sum(self.session.stats()['loads']), 4)
+        for key in keys:
+            self.assertEqual(report_trunk(key=key, session=self.session)['shard'], key.split('~')[1].split('-')[0])
+
+    def test_reports_without_keys_are_not_routed(self):
+        for app in self.apps:
+            app_handle = app._handle
+            app._handle = lambda method, path, body, handle=app_handle: (
+                {'s': 0, 'r': 0, 'rf': [{'m': {'t': 'tag'}}]} if method == 'POST' else handle(method, path, body))
+        create_fields(constructors=[FieldConstructor(tag='tag')], session=self.session)
+        self.assertEqual(self.session.stats()['loads'], [0, 0, 0])
+
+    def test_deadline_reaches_every_shard(self):
+        deadlines = []
+        for app in self.apps:
+            app_handle = app._handle
+            app._handle = lambda method, path, body, handle=app_handle: (
+                deadlines.append(current_deadline()) or handle(method, path, body))
+        with request_deadline(30.0) as deadline:
+            reports = create_fields(constructors=[FieldConstructor(tag='tag%d' % i) for i in range(6)],
+                                    session=self.session)
+            keys = [FieldReport.decode(report).key for report in reports]
+            report_fields(keys=keys, session=self.session)
+            self.session.shard_of('trp/f', 'f~unknown')
+        self.assertGreaterEqual(len(deadlines), 9)
+        self.assertEqual(set(deadlines), {deadline})
+
+
+if __name__ == '__main__':
+    unittest.main()
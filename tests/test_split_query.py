@@ -0,0 +1,124 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.sender import *
+
+
+def key_params(api_spec):
+    return [param for param in api_spec.partition('?')[2].split('&') if param.startswith('k=')]
+
+
+def report_handler(requests, bad_key=None):
+    # Handler for a LoopbackTransport, reporting each queried field key, or failing on the bad key.
+    def handle(method, path, body):
+        requests.append(path)
+        keys = [param[2:] for param in key_params(path)]
+        if bad_key in keys:
+            return {'s': 0, 'r': 5, 'e': 'unknown key %s' % bad_key}
+        return {'s': 0, 'r': 0, 'rf': [{'k': key} for key in keys], 'n': len(requests)}
+    return handle
+
+
+class SplitQueryKeysTest(unittest.TestCase):
+    api_spec = 'trp/f?' + '&'.join('k=f~%d' % i for i in range(20)) + '&s=mr'
+
+    def test_spec_that_fits_is_not_split(self):
+        self.assertEqual(split_query_keys(self.api_spec, len(self.api_spec)), [self.api_spec])
+        long_key_spec = 'trp/f?k=' + 'f~x' * 100 + '&s=mr'
+        self.assertEqual(split_query_keys(long_key_spec, 10), [long_key_spec])
+        self.assertEqual(split_query_keys('trp/f/f~1/s/s~' + '1' * 100, 10), ['trp/f/f~1/s/s~' + '1' * 100])
+
+    def test_parts_fit_and_keep_key_order(self):
+        for max_length in range(30, len(self.api_spec)):
+            api_specs = split_query_keys(self.api_spec, max_length)
+            self.assertGreater(len(api_specs), 1)
+            self.assertTrue(all(len(api_spec) <= max_length for api_spec in api_specs), max_length)
+            self.assertTrue(all(api_spec.startswith('trp/f?k=') and api_spec.endswith('&s=mr')
+                                for api_spec in api_specs))
+            self.assertEqual([param for api_spec in api_specs for param in key_params(api_spec)],
+                             key_params(self.api_spec))
+
+    def test_part_at_the_limit_is_filled(self):
+        part = 'trp/f?k=f~0&k=f~1&s=mr'
+        self.assertEqual(split_query_keys(self.api_spec, len(part))[0], part)
+        self.assertEqual(split_query_keys(self.api_spec, len(part) - 1)[0], 'trp/f?k=f~0&s=mr')
+
+    def test_overlong_key_gets_a_part_of_its_own(self):
+        api_spec = 'trp/f?k=f~1&k=f~' + 'x' * 50 + '&k=f~2'
+        self.assertEqual(split_query_keys(api_spec, 30), ['trp/f?k=f~1', 'trp/f?k=f~' + 'x' * 50, 'trp/f?k=f~2'])
+
+
+class MergeResponsesTest(unittest.TestCase):
+    def test_reply_lists_are_concatenated_in_part_order(self):
+        merged = merge_responses([{'s': 0, 'r': 0, 'rf': [1, 2], 'n': 1},
+                                  {'s': 0, 'r': 0, 'rf': [], 'n': 2},
+                                  {'s': 0, 'r': 0, 'rf': [3], 'n': 3}])
+        self.assertEqual(merged, {'s': 0, 'r': 0, 'rf': [1, 2, 3], 'n': 1})
+
+    def test_single_response_is_returned_as_is(self):
+        response_dict = {'s': 0, 'r': 3, 'e': 'error'}
+        self.assertIs(merge_responses([response_dict]), response_dict)
+
+    def test_first_error_reply_is_returned(self):
+        errors = [{'s': 0, 'r': 3, 'e': 'first'}, {'s': 1}, {}]
+        ok = {'s': 0, 'r': 0, 'rf': [1]}
+        self.assertIs(merge_responses([ok, errors[0], errors[1]]), errors[0])
+        self.assertIs(merge_responses([errors[1], ok]), errors[1])
+        self.assertIs(merge_responses([ok, errors[2]]), errors[2])
+
+
+class SplitGetTest(unittest.TestCase):
+    keys = ['f~%02d' % i for i in range(40)]
+    api_spec = 'trp/f?' + '&'.join('k=' + key for key in keys)
+
+    def make_session(self, requests, bad_key=None):
+        session = Session('http://standin')
+        session.max_url_length = 100
+        session.use_transport(LoopbackTransport(report_handler(requests, bad_key)))
+        return session
+
+    def test_split_get_is_merged_in_key_order(self):
+        for query_concurrency in (1, 4):
+            requests = []
+            session = self.make_session(requests)
+            session.query_concurrency = query_concurrency
+            response_dict = session.get(self.api_spec)
+            self.assertGreater(len(requests), 1)
+            self.assertTrue(all(len('http://standin/' + request) <= 100 for request in requests))
+            self.assertEqual([report['k'] for report in response_dict['rf']], self.keys)
+
+    def test_split_get_returns_the_error_reply(self):
+        requests = []
+        response_dict = self.make_session(requests, 'f~25').get(self.api_spec)
+        self.assertEqual(response_dict, {'s': 0, 'r': 5, 'e': 'unknown key f~25'})
+
+    def test_async_split_get_is_merged_in_key_order(self):
+        requests = []
+        sender = AsyncSender('http://standin')
+        sender.max_url_length = 100
+        sender.use_transport(AsyncLoopbackTransport(report_handler(requests)))
+        response_dict = asyncio.run(sender.get(self.api_spec))
+        self.assertGreater(len(requests), 1)
+        self.assertEqual([report['k'] for report in response_dict['rf']], self.keys)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import unittest
+
+from taranoscsfpapi.aiosender import *
+from taranoscsfpapi.rendering import *
+from taranoscsfpapi.views import *
+
+_document = ('{"s": 0, "rs": [{"k": "s~1", "n": "quote \\" backslash \\\\ ] }, [", "d": "\\u00e9\\ud83c\\udfb5 é"},'
+             ' -12.5e-3, true, null, [1, [2]], "\\\\"], "r": 0, "tail": {"a": [1, 2]}}').encode('utf-8')
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class IterArrayMemberTest(unittest.TestCase):
+    expected = json.loads(_document.decode('utf-8'))
+
+    def check(self, chunks):
+        members = {}
+        self.assertEqual(list(iter_array_member(chunks, 'rs', members)), self.expected['rs'])
+        self.assertEqual(members, {'s': 0, 'r': 0, 'tail': {'a': [1, 2]}})
+
+    def test_chunks_of_every_size(self):
+        for size in range(1, len(_document) + 1):
+            self.check(chunked(_document, size))
+
+    def test_every_cut(self):
+        # Including cuts inside escapes and multi-byte characters:
+        for i in range(len(_document) + 1):
+            self.check([_document[:i], b'', _document[i:]])
+
+    def test_numbers_cut_short_are_read_whole(self):
+        data = b'{"rs": [12345, 1.5e+10, -0.25, 7]}'
+        for size in range(1, 6):
+            self.assertEqual(list(iter_array_member(chunked(data, size), 'rs')), [12345, 1.5e+10, -0.25, 7])
+
+    def test_empty_object_and_array(self):
+        self.assertEqual(list(iter_array_member([b'{}'], 'rs')), [])
+        members = {}
+        self.assertEqual(list(iter_array_member([b'{"rs"', b': [ ', b'], "r": 0}'], 'rs', members)), [])
+        self.assertEqual(members, {'r': 0})
+
+    def test_malformed_document_is_rejected(self):
+        for data in (b'[1]', b'{"rs": [1 2]}', b'{"rs": [1, 2}', b'{"rs" [1]}', b'{"rs": [1]', b'{"rs": ["a]}'):
+            with self.assertRaises(ValueError):
+                list(iter_array_member(chunked(data, 3), 'rs'))
+
+
+class StreamResponseTest(unittest.TestCase):
+    def make_session(self, response):
+        session = Session('http://standin')
+        session.use_transport(LoopbackTransport(lambda method, path, body: response))
+        return session
+
+    def test_elements_are_streamed(self):
+        session = self.make_session(_document)
+        self.assertEqual(list(stream_response(session, 'trp/f/f~1/s', 'rs')), IterArrayMemberTest.expected['rs'])
+
+    def test_error_reply_is_raised(self):
+        session = self.make_session({'s': 0, 'r': 4, 'e': 'no such field'})
+        with self.assertRaises(PapiException):
+            list(iter_report_subjects(field_key='f~1', keys=['s~1'], session=session))
+
+    def test_malformed_response_is_raised(self):
+        session = self.make_session(b'{"rs": [1, ')
+        with self.assertRaises(PapiException):
+            list(stream_response(session, 'trp/f/f~1/s', 'rs'))
+
+    def test_async_sender_is_rejected(self):
+        sender = AsyncSender('http://standin')
+        with self.assertRaises(PapiException):
+            iter_report_subjects(field_key='f~1', keys=['s~1'], session=sender)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+#
+# Taranos Cloud Sonification Framework: Python Pseudo-API
+# Copyright (C) 2018 David Hinson, Netrogen Blue LLC (dhinson@netrogenblue.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# Generator of the asynchronous API modules.  aiorendering.py, aiosignaling.py and aiomanagement.py are generated from
+# rendering.py, signaling.py and management.py: every function that sends a request (directly through
+# session_of(session), or through another such function) becomes a coroutine that sends it through
+# aio_session_of(session) and awaits the functions it calls; the rest of each module is shared by star import.
+# Regenerate them after changing the synchronous modules, from the root of the repository:
+#
+#     python -m tools.generate_aio
+#
+# and check that they are up to date with --check.
+#
+
+import ast
+import os
+import re
+import sys
+
+package_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'taranoscsfpapi')
+module_names = ('rendering', 'signaling', 'management')
+line_limit = 119
+license_line_count = 16
+
+_known_coroutines = {'get_server_defaults'}   # Defined by hand in aioapi.py.
+_sync_only_functions = {'fk', 'tk'}           # Default key accessors, which don't send requests.
+_session_param_docs = (':param session: Session to use (defaults to the default session)',
+                       ':param session: AsyncSender to use (defaults to AioSender)')
+
+
+def _is_call_to(node, names):
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in names
+
+
+def _is_session_call(node):
+    function = node.func
+    return (isinstance(function, ast.Attribute) and _is_call_to(function.value, ('session_of',)))
+
+
+def find_api_functions(tree):
+    """
+    Find the functions of a module that send requests, and so are to become coroutines.  Generators (iter_*) stay
+    synchronous.
+
+    :param tree: Module AST
+    :return: Set of function names
+    """
+    functions = [node for node in tree.body if isinstance(node, ast.FunctionDef)
+                 and node.name not in _sync_only_functions and not node.name.startswith('iter_')]
+    api = set()
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for node in functions:
+            if node.name not in api and any(_is_call_to(sub, api | _known_coroutines | {'session_of'})
+                                            for sub in ast.walk(node)):
+                api.add(node.name)
+                is_changed = True
+    return api
+
+
+def uncoalesce(source):
+    """
+    Turn coalesce(function, 'items', item, k=v, session=session) calls back into function(k=v, items=[item],
+    session=session) calls, as the asynchronous API doesn't coalesce.
+    """
+    tree = ast.parse(source)
+    lines = source.split('\n')
+    edits = []
+    for call in ast.walk(tree):
+        if _is_call_to(call, ('coalesce',)):
+            arguments = ['%s=%s' % (keyword.arg, ast.get_source_segment(source, keyword.value))
+                         for keyword in call.keywords]
+            item = '%s=[%s]' % (ast.literal_eval(call.args[1]), ast.get_source_segment(source, call.args[2]))
+            is_session_last = call.keywords and call.keywords[-1].arg == 'session'
+            arguments.insert(len(arguments) - 1 if is_session_last else len(arguments), item)
+            edits.append((call, '%s(%s)' % (call.args[0].id, ', '.join(arguments))))
+    for call, text in sorted(edits, key=lambda edit: (edit[0].lineno, edit[0].col_offset), reverse=True):
+        first, last = lines[call.lineno - 1], lines[call.end_lineno - 1]
+        lines[call.lineno - 1:call.end_lineno] = [first[:call.col_offset] + text + last[call.end_col_offset:]]
+    return '\n'.join(lines)
+
+
+def make_coroutine(source, node, api):
+    """
+    Turn a function into a coroutine, awaiting its requests and its calls to other API functions, and document its
+    session param as an AsyncSender.
+
+    :return: Coroutine source
+    """
+    lines = source.split('\n')[node.lineno - 1:node.end_lineno]
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+    text = '\n'.join(lines)
+
+    parents = {child: parent for parent in ast.walk(node) for child in ast.iter_child_nodes(parent)}
+    edits = []
+    coroutines = api | _known_coroutines
+    for call in ast.walk(node):
+        if not isinstance(call, ast.Call) or not (_is_session_call(call) or _is_call_to(call, coroutines)):
+            continue
+        start = offsets[call.lineno - node.lineno] + call.col_offset
+        end = offsets[call.end_lineno - node.lineno] + call.end_col_offset
+        segment = text[start:end]
+        indent = 0
+        if segment.startswith('session_of('):
+            segment = 'aio_' + segment
+            indent += len('aio_')
+        parent = parents.get(call)
+        is_operand = isinstance(parent, (ast.Subscript, ast.Attribute)) and parent.value is call
+        indent += len('(await ' if is_operand else 'await ')
+        segment = segment.replace('\n', '\n' + ' ' * indent)
+        edits.append((start, end, ('(await %s)' if is_operand else 'await %s') % segment))
+    for start, end, segment in sorted(edits, reverse=True):
+        text = text[:start] + segment + text[end:]
+    text = text.replace(*_session_param_docs)
+    return re.sub(r'^def ', 'async def ', text)
+
+
+def _split_arguments(text):
+    arguments, depth, argument = [], 0, ''
+    for char in text:
+        depth += (char in '([{') - (char in ')]}')
+        if char == ',' and depth == 0:
+            arguments.append(argument.strip())
+            argument = ''
+        else:
+            argument += char
+    arguments.append(argument.strip())
+    return arguments
+
+
+def wrap_long_lines(text):
+    """
+    Wrap calls and definitions that awaiting pushed over the line limit, one argument per line.
+    """
+    wrapped = []
+    for line in text.split('\n'):
+        match = re.match(r'^(\s*(?:return |result = |response_dict = )?(?:\(?await )?|async def |def )(\w+)\((.*)\)'
+                         r'(\)?\[0\]|:)?$', line)
+        if len(line) <= line_limit or not match:
+            wrapped.append(line)
+            continue
+        prefix, name, arguments, suffix = match.group(1), match.group(2), _split_arguments(match.group(3)), \
+            match.group(4) or ''
+        indent = ' ' * (len(prefix) + len(name) + 1)
+        wrapped.append(prefix + name + '(' + arguments[0] + ',')
+        wrapped += [indent + argument + ',' for argument in arguments[1:-1]]
+        wrapped.append(indent + arguments[-1] + ')' + suffix)
+    return '\n'.join(wrapped)
+
+
+def generate_module(module_name):
+    """
+    Generate the asynchronous counterpart of a synchronous API module.
+
+    :param module_name: Name of the synchronous module, e.g. 'rendering'
+    :return: Source of the asynchronous module, with CRLF line endings
+    """
+    with open(os.path.join(package_dir, module_name + '.py'), newline='') as file:
+        source = uncoalesce(file.read().replace('\r\n', '\n'))
+    tree = ast.parse(source)
+    api = find_api_functions(tree)
+    lines = source.split('\n')
+    license_lines = lines[:license_line_count]
+    for node in reversed(tree.body):
+        if isinstance(node, ast.FunctionDef) and node.name in api:
+            lines[node.lineno - 1:node.end_lineno] = make_coroutine(source, node, api).split('\n')
+        else:
+            lines[node.lineno - 1:node.end_lineno] = []
+    text = '\n'.join(lines[license_line_count:])
+
+    # Keep the section comments of the coroutines only, with the synchronous module's blank-line conventions.
+    text = re.sub(r'\n[ \t]+\n', '\n\n', text)
+    text = re.sub(r'\n# [A-Za-z ]+:\n(?=\s*\n(#|$))', '\n', text)
+    text = re.sub(r'\n#\n# [A-Za-z ]+:?\n#\n(?=\s*(#\n#|$))', '\n', text)
+    text = re.sub(r'\n{3,}', '\n\n\n', text).strip('\n')
+    text = re.sub(r'(\n# [A-Za-z ]+:)\n\n\n', r'\1\n\n', text)
+
+    header = ['',
+              '#',
+              '# Generated from %s.py by tools/generate_aio.py: do not edit by hand.' % module_name,
+              '#',
+              '',
+              'from taranoscsfpapi.%s import *' % module_name,
+              'from taranoscsfpapi.aioapi import *']
+    text = '\n'.join(license_lines + header) + '\n\n\n' + wrap_long_lines(text) + '\n'
+    return text.replace('\n', '\r\n')
+
+
+def main(arguments):
+    is_check = '--check' in arguments
+    stale = []
+    for module_name in module_names:
+        path = os.path.join(package_dir, 'aio%s.py' % module_name)
+        text = generate_module(module_name)
+        with open(path, newline='') as file:
+            if file.read() == text:
+                continue
+        stale.append(path)
+        if not is_check:
+            with open(path, 'w', newline='') as file:
+                file.write(text)
+    for path in stale:
+        print('%s %s' % ('out of date:' if is_check else 'regenerated', path))
+    return 1 if is_check and stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))